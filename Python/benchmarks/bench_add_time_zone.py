@@ -0,0 +1,60 @@
+"""
+Throughput benchmark for add_time_zone and add_time_zone_batched.
+
+Runs the batched version over 1e4, 1e6 and 1e7 rows with 1, 50 and 400 distinct zones
+and reports rows per second. The row-by-row add_time_zone is only timed at the smallest
+size by default, since it takes minutes beyond that.
+
+Usage:
+    python benchmarks/bench_add_time_zone.py [--sizes 10000 1000000] [--zones 1 50] [--loop-max 10000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.add_time_zone import add_time_zone, add_time_zone_batched
+
+
+def make_inputs(n_rows, n_zones, seed=0):
+    rng = np.random.default_rng(seed)
+    zones = np.array(pytz.common_timezones[:n_zones], dtype=object)
+    epochs = rng.integers(0, 2_000_000_000, n_rows)
+    datetime_series = pd.Series(pd.to_datetime(epochs, unit="s", utc=True))
+    tz_series = pd.Series(zones[rng.integers(0, n_zones, n_rows)])
+    return datetime_series, tz_series
+
+
+def rows_per_second(func, n_rows, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return n_rows / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--zones", type=int, nargs="+", default=[1, 50, 400])
+    parser.add_argument("--loop-max", type=int, default=10_000,
+                        help="largest size at which the row-by-row add_time_zone is also timed")
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10} {'zones':>6} {'loop rows/s':>14} {'series rows/s':>14} {'frame rows/s':>14}")
+    for n_rows in args.sizes:
+        for n_zones in args.zones:
+            datetime_series, tz_series = make_inputs(n_rows, n_zones)
+            loop = "-"
+            if n_rows <= args.loop_max:
+                loop = f"{rows_per_second(add_time_zone, n_rows, datetime_series, tz_series):,.0f}"
+            series = rows_per_second(add_time_zone_batched, n_rows, datetime_series, tz_series)
+            frame = rows_per_second(add_time_zone_batched, n_rows, datetime_series, tz_series, output="frame")
+            print(f"{n_rows:>10,} {n_zones:>6} {loop:>14} {series:>14,.0f} {frame:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark of format_with_timezone's bulk path against formatting each timestamp with strftime.
+
+The per-row baseline is what format_with_timezone did before the bulk path: astimezone and
+strftime for every element. Both are run on the same Series and their output is compared.
+
+Usage:
+    python benchmarks/bench_format_with_timezone.py [--rows 1000000] [--scalar-rows 100000] [--tz America/New_York]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time import format_with_timezone
+
+FORMATS = ("%Y-%m-%d %H:%M:%S %Z", "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--scalar-rows", type=int, default=100_000,
+                        help="rows timed with per-row strftime (its rate is extrapolated)")
+    parser.add_argument("--tz", default="America/New_York")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    nanoseconds = rng.integers(0, 2_000_000_000, args.rows) * 1_000_000_000 + rng.integers(0, 1_000_000_000, args.rows)
+    times = pd.Series(pd.to_datetime(nanoseconds, utc=True))
+    sample = times.iloc[:min(args.scalar_rows, args.rows)]
+    tz = pytz.timezone(args.tz)
+
+    print(f"{args.rows:,} timestamps to {args.tz}")
+    print(f"{'format':<26} {'strftime rows/s':>16} {'bulk rows/s':>14} {'speedup':>9}")
+    for format_str in FORMATS:
+        start = time.perf_counter()
+        expected = sample.map(lambda dt: dt.astimezone(tz).strftime(format_str))
+        scalar_rate = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = format_with_timezone(times, format_str, to_tz=args.tz)
+        bulk_rate = args.rows / (time.perf_counter() - start)
+        if not result.iloc[:len(sample)].equals(expected):
+            raise AssertionError(f"{format_str!r}: bulk output differs from strftime")
+        print(f"{format_str:<26} {scalar_rate:>16,.0f} {bulk_rate:>14,.0f} {bulk_rate / scalar_rate:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark of the cached clock service against the per-call get_local_time path it replaced.
+
+Simulates request handling: every "request" asks for the current local time of the same set of
+zones, formatted with the time zone abbreviation. The uncached path validates the zone, builds an
+aware datetime with datetime.now and formats %Z with strftime, as get_local_time used to.
+
+Usage:
+    python benchmarks/bench_get_local_time.py [--requests 20000] [--zones 40]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.get_local_time import get_local_time, get_local_times
+from zone_time.zone_clock import ZoneClock
+from zone_time.zone_registry import get_zone, is_valid_zone
+
+FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def uncached(tz):
+    if not is_valid_zone(tz):
+        raise ValueError(tz)
+    current_time = datetime.now(get_zone(tz))
+    return current_time.strftime(FORMAT) + " " + current_time.strftime("%Z")
+
+
+def timed(label, requests, zones, func, baseline=None):
+    start = time.perf_counter()
+    for _ in range(requests):
+        func()
+    elapsed = time.perf_counter() - start
+    calls = requests * zones
+    speedup = f"{baseline / elapsed:>7.1f}x" if baseline else f"{'-':>8}"
+    print(f"{label:<36} {elapsed:>8.2f}s {calls / elapsed:>12,.0f} zones/s {speedup}")
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--zones", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    zones = pytz.common_timezones[::max(1, len(pytz.common_timezones) // args.zones)][:args.zones]
+
+    # Same answers at a fixed instant
+    instant = time.time()
+    fixed = ZoneClock(clock=lambda: instant)
+    expected = [datetime.fromtimestamp(instant, get_zone(tz)) for tz in zones]
+    actual = get_local_times(zones, clock=fixed)
+    mismatches = sum(a != e or a.tzname() != e.tzname() or a.replace(tzinfo=None) != e.replace(tzinfo=None)
+                     for a, e in zip(actual, expected))
+
+    print(f"{args.requests:,} requests x {len(zones)} zones (formatted, with abbreviation)")
+    baseline = timed("uncached (datetime.now + strftime)", args.requests, len(zones),
+                     lambda: [uncached(tz) for tz in zones])
+    timed("get_local_time per zone", args.requests, len(zones),
+          lambda: [get_local_time(tz, True, True) for tz in zones], baseline)
+    timed("get_local_times", args.requests, len(zones),
+          lambda: get_local_times(zones, True, True), baseline)
+    timed("get_local_times (datetimes only)", args.requests, len(zones),
+          lambda: get_local_times(zones), baseline)
+    print(f"mismatches at a fixed instant: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Cold-start guard: import time of the zone_time package, measured with python -X importtime.
+
+Each scenario runs in a fresh interpreter several times and the median is reported. The run
+fails (exit status 1) if a scenario exceeds its budget or pulls in NumPy, pandas or pytz,
+which must only be imported when a function first needs them.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 7] [--budget-ms 50] [--show-modules]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+HEAVY = ("numpy", "pandas", "pytz")
+MARKER = "--- zone_time import starts ---"
+
+SCENARIOS = {
+    "import zone_time": "import zone_time",
+    "from zone_time import convert_to_utc": "from zone_time import convert_to_utc",
+    "from zone_time import is_dst, is_dst_batch": "from zone_time import is_dst, is_dst_batch",
+    "every public function": "import zone_time\nfor name in zone_time.__all__: getattr(zone_time, name)",
+}
+
+
+def run(statement):
+    # Import time in microseconds of the statement alone, per module, and the heavy modules it loaded
+    code = (f"import sys; sys.stderr.write({MARKER!r} + '\\n'); sys.stderr.flush()\n{statement}\n"
+            f"print(','.join(name for name in {HEAVY!r} if name in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PYTHON_DIR, os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                               capture_output=True, text=True, check=True)
+    lines = completed.stderr.split(MARKER, 1)[1].splitlines()
+    modules = []
+    total = 0
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # Top-level entries (no extra indentation) add up to the whole statement
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+        modules.append((int(cumulative), name.rstrip()))
+    heavy = [name for name in completed.stdout.strip().split(",") if name]
+    return total, modules, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="maximum median import time per scenario (default: 50)")
+    parser.add_argument("--show-modules", action="store_true", help="list the slowest modules of each scenario")
+    args = parser.parse_args(argv)
+
+    # Warm up once so the bytecode caches exist
+    run(SCENARIOS["every public function"])
+
+    failed = False
+    print(f"{'scenario':<45} {'median ms':>10} {'max ms':>8}  heavy modules")
+    for label, statement in SCENARIOS.items():
+        runs = [run(statement) for _ in range(args.repeat)]
+        times = [total / 1000 for total, _, _ in runs]
+        heavy = sorted(set(name for _, _, names in runs for name in names))
+        median = statistics.median(times)
+        over = median > args.budget_ms or heavy
+        failed = failed or over
+        print(f"{label:<45} {median:>10.1f} {max(times):>8.1f}  {', '.join(heavy) or '-'}{'  FAIL' if over else ''}")
+        if args.show_modules:
+            for cumulative, name in sorted(runs[-1][1], reverse=True)[:10]:
+                print(f"    {cumulative / 1000:>8.1f} ms {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
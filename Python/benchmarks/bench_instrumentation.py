@@ -0,0 +1,94 @@
+"""
+Overhead of the instrumentation hooks in the conversion functions.
+
+Each workload is timed with instrumentation off and on. With it off, a hook is a call returning a
+shared no-op context manager, too cheap to see against the noise of a whole conversion; so its
+cost is measured on its own and multiplied by the number of hooks each call runs (counted with
+instrumentation on). The run fails (exit status 1) if that cost exceeds --max-overhead of a call.
+
+Usage:
+    python benchmarks/bench_instrumentation.py [--rows 100000] [--repeat 5] [--max-overhead 0.01]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time import instrumentation
+from zone_time.batch_convert import to_utc_batch
+from zone_time.convert_time_zone import convert_time_zone, convert_time_zone_batch
+from zone_time.convert_to_utc import convert_to_utc
+from zone_time.instrumentation import record, stage
+
+
+def workloads(rows):
+    rng = np.random.default_rng(0)
+    seconds = rng.integers(946_684_800, 1_893_456_000, rows)
+    times = [value.replace("T", " ") for value in np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s")]
+    zones = np.array(pytz.common_timezones[::10], dtype=object)[rng.integers(0, len(pytz.common_timezones[::10]), rows)]
+    zone_list = zones.tolist()
+    return [
+        ("convert_time_zone, 1 row", 1, lambda: convert_time_zone(times[0], "America/New_York", "Asia/Tokyo")),
+        ("convert_to_utc, 1 row", 1, lambda: convert_to_utc(times[:1], zone_list[:1])),
+        ("convert_to_utc", rows, lambda: convert_to_utc(times, zone_list, return_errors=True)),
+        ("convert_time_zone_batch", rows, lambda: convert_time_zone_batch(times, zone_list, "Asia/Tokyo")),
+        ("to_utc_batch", rows, lambda: to_utc_batch(times, zones)),
+    ]
+
+
+def best_time(func, repeat):
+    # Fastest of repeat runs of enough calls to last about 0.2 s
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def hook_cost(repeat):
+    # One disabled stage hook around a block, and one disabled record call
+    timer = timeit.Timer("with stage('f', 's', 1):\n    pass\nrecord('f', 1)", globals={"stage": stage, "record": record})
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def hooks_per_call(func):
+    instrumentation.enable()
+    func()
+    snapshot = instrumentation.disable(flush=False).snapshot()
+    stages = sum(entry["calls"] for stages in snapshot["stages"].values() for entry in stages.values())
+    return stages, sum(snapshot["calls"].values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-overhead", type=float, default=0.01,
+                        help="largest disabled-hook cost allowed, as a fraction of a call (default: 0.01)")
+    args = parser.parse_args(argv)
+
+    instrumentation.disable(flush=False)
+    per_hook = hook_cost(args.repeat)
+    print(f"disabled hook (stage + record): {per_hook * 1e9:.0f} ns")
+    print(f"{'workload':<28} {'rows':>8} {'off ms':>10} {'on ms':>10} {'on cost':>8} {'hooks':>6} {'off cost':>9}")
+    failed = False
+    for label, rows, func in workloads(args.rows):
+        func()  # warm-up
+        stages, records = hooks_per_call(func)
+        off = best_time(func, args.repeat)
+        instrumentation.enable()
+        on = best_time(func, args.repeat)
+        instrumentation.disable(flush=False)
+        # Counting every hook as a full stage + record pair overestimates the cost
+        disabled = (stages + records) * per_hook / off
+        failed = failed or disabled > args.max_overhead
+        print(f"{label:<28} {rows:>8,} {off * 1e3:>10.3f} {on * 1e3:>10.3f} {on / off - 1:>+8.1%} "
+              f"{stages + records:>6} {disabled:>9.3%}{'  FAIL' if disabled > args.max_overhead else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
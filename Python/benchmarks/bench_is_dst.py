@@ -0,0 +1,54 @@
+"""
+Benchmark of is_dst_batch against calling is_dst once per row.
+
+Both run on the same random wall-clock times and zones, and their answers are compared.
+
+Usage:
+    python benchmarks/bench_is_dst.py [--rows 1000000] [--zones 50] [--scalar-rows 100000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.is_dst import is_dst, is_dst_batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--zones", type=int, default=50)
+    parser.add_argument("--scalar-rows", type=int, default=100_000,
+                        help="rows timed with the per-row is_dst (its rate is extrapolated)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    seconds = rng.integers(0, 2_000_000_000, args.rows)
+    times = np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s")
+    times = np.char.replace(times, "T", " ")
+    zones = np.array(pytz.common_timezones[:args.zones], dtype=object)[rng.integers(0, args.zones, args.rows)]
+
+    start = time.perf_counter()
+    result = is_dst_batch(times, zones)
+    batch_time = time.perf_counter() - start
+
+    sample = min(args.scalar_rows, args.rows)
+    start = time.perf_counter()
+    expected = [is_dst(time_str, zone) for time_str, zone in zip(times[:sample].tolist(), zones[:sample].tolist())]
+    scalar_time = time.perf_counter() - start
+    if not np.array_equal(result.dst[:sample], expected):
+        raise AssertionError("is_dst_batch differs from is_dst")
+
+    batch_rate = args.rows / batch_time
+    scalar_rate = sample / scalar_time
+    print(f"{args.rows:,} rows, {args.zones} zones")
+    print(f"is_dst per row   {scalar_rate:>14,.0f} rows/s")
+    print(f"is_dst_batch     {batch_rate:>14,.0f} rows/s  ({batch_rate / scalar_rate:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
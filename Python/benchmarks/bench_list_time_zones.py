@@ -0,0 +1,81 @@
+"""
+Latency benchmark of list_time_zones for search-as-you-type queries.
+
+Replays typical keystroke sequences (every prefix of each query) against the catalog-backed
+list_time_zones and against the scan-and-sort implementation it replaced, with and without
+details, and reports median and 99th-percentile latency per call. Results are compared.
+
+Usage:
+    python benchmarks/bench_list_time_zones.py [--rounds 20] [--limit 10]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.list_time_zones import list_time_zones
+from zone_time.zone_registry import get_zone
+
+QUERIES = ["america/new_york", "europe/london", "asia/kol", "tokyo", "pacific/auck", "utc", "gmt+", "xyz"]
+
+
+def scan(query=None, limit=float('inf'), details=False):
+    # The previous implementation: substring scan and sort on every call
+    time_zones = pytz.all_timezones
+    if query is not None:
+        time_zones = [tz for tz in time_zones if query.lower() in tz.lower()]
+    time_zones = sorted(time_zones)
+    time_zones = time_zones[:min(limit, len(time_zones))]
+    if details:
+        results = []
+        for tz in time_zones:
+            now = datetime.now(get_zone(tz))
+            results.append(f"{tz} {now.strftime('%Z')} {now.strftime('%z')}")
+        return results
+    return time_zones
+
+
+def latencies(func, keystrokes, rounds, **kwargs):
+    times = []
+    for _ in range(rounds):
+        for query in keystrokes:
+            start = time.perf_counter()
+            func(query, **kwargs)
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times) * 1e6, times[int(len(times) * 0.99)] * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    keystrokes = [query[:end] for query in QUERIES for end in range(1, len(query) + 1)]
+    mismatches = sum(list_time_zones(query, args.limit) != scan(query, args.limit) for query in keystrokes)
+    mismatches += list_time_zones(None) != scan(None)
+
+    # Build the catalog and warm the clock before timing, as a long-running server would have
+    list_time_zones("a", details=True)
+    scan("a", details=True)
+
+    print(f"{len(keystrokes)} keystrokes x {args.rounds} rounds, limit {args.limit}")
+    print(f"{'case':<26} {'scan p50 us':>12} {'scan p99 us':>12} {'catalog p50 us':>15} {'catalog p99 us':>15}")
+    cases = [("names", {"limit": args.limit}), ("names, no limit", {}),
+             ("details", {"limit": args.limit, "details": True})]
+    for label, kwargs in cases:
+        old = latencies(scan, keystrokes, args.rounds, **kwargs)
+        new = latencies(list_time_zones, keystrokes, args.rounds, **kwargs)
+        print(f"{label:<26} {old[0]:>12.1f} {old[1]:>12.1f} {new[0]:>15.1f} {new[1]:>15.1f}")
+    print(f"mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Scaling benchmark for the process-pool conversion mode.
+
+Converts the same rows with to_utc_batch in-process and with convert_parallel on 1 to N
+worker processes (reusing one worker_pool per worker count), and reports rows/sec and speedup.
+
+Usage:
+    python benchmarks/bench_parallel.py [--rows 5000000] [--zones 400] [--max-workers N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.batch_convert import to_utc_batch
+from zone_time.parallel import convert_parallel, worker_pool
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--zones", type=int, default=400)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    times = np.char.replace(np.datetime_as_string(rng.integers(0, 2_000_000_000, args.rows).astype("datetime64[s]")),
+                            "T", " ")
+    zones = np.array(pytz.common_timezones[:args.zones], dtype=object)[rng.integers(0, args.zones, args.rows)]
+
+    start = time.perf_counter()
+    expected = to_utc_batch(times, zones)
+    baseline = time.perf_counter() - start
+    print(f"{args.rows:,} rows, {args.zones} zones, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'rows/s':>14} {'speedup':>8}")
+    print(f"{'inline':>8} {baseline:>9.2f} {args.rows / baseline:>14,.0f} {1:>7.2f}x")
+    for workers in range(1, args.max_workers + 1):
+        with worker_pool(workers) as pool:
+            pool.submit(int).result()  # start the workers before timing
+            start = time.perf_counter()
+            result = convert_parallel(times, zones, workers=workers, executor=pool)
+            elapsed = time.perf_counter() - start
+        if not np.array_equal(result.values, expected.values, equal_nan=True):
+            raise AssertionError(f"{workers} workers: results differ from the in-process conversion")
+        print(f"{workers:>8} {elapsed:>9.2f} {args.rows / elapsed:>14,.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark and precision check of remove_time_zone.
+
+Times the previous implementation (strftime then strptime, once per element) on a sample and the
+vectorized paths on a whole tz-aware Series and Arrow array, keeping the wall clock or the UTC
+instant. The precision checks compare against the previous behaviour: the same result down to
+the second, and the sub-second part kept instead of dropped.
+
+Usage:
+    python benchmarks/bench_remove_time_zone.py [--rows 1000000] [--scalar-rows 50000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.remove_time_zone import remove_time_zone
+
+
+def previous(datetime_obj):
+    # The implementation this replaces
+    datetime_str = datetime_obj.strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def check_scalars(rng, count):
+    # Aware datetimes in many zones: same second as before, microseconds now kept
+    mismatches = 0
+    zones = [pytz.timezone(name) for name in pytz.common_timezones[::7]]
+    seconds = rng.integers(-2_000_000_000, 4_000_000_000, count)
+    micros = rng.integers(0, 1_000_000, count)
+    for second, micro, zone in zip(seconds, micros, rng.choice(len(zones), count)):
+        aware = datetime.fromtimestamp(int(second), zones[zone]).replace(microsecond=int(micro))
+        wall = remove_time_zone(aware)
+        utc = remove_time_zone(aware, keep="utc")
+        mismatches += wall.replace(microsecond=0) != previous(aware) or wall.microsecond != micro
+        mismatches += utc != aware.astimezone(pytz.utc).replace(tzinfo=None)
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--scalar-rows", type=int, default=50_000,
+                        help="rows timed with the per-element implementation (its rate is extrapolated)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    ticks = rng.integers(0, 2_000_000_000_000_000, args.rows)
+    series = pd.Series(ticks.astype("datetime64[us]")).dt.tz_localize("UTC").dt.tz_convert("America/New_York")
+    array = pa.array(series)
+
+    sample = series.iloc[:min(args.scalar_rows, args.rows)]
+    previous_values, previous_time = timed(lambda: sample.map(previous))
+    previous_rate = len(sample) / previous_time
+
+    wall, wall_time = timed(remove_time_zone, series)
+    utc, utc_time = timed(remove_time_zone, series, keep="utc")
+    arrow_wall, arrow_wall_time = timed(remove_time_zone, array)
+    arrow_utc, arrow_utc_time = timed(remove_time_zone, array, keep="utc")
+
+    # Precision: the second matches the previous result, the sub-second part is the input's
+    mismatches = int((wall.iloc[:len(sample)].dt.floor("s") != previous_values.astype("datetime64[us]")).sum())
+    mismatches += int((wall.dt.microsecond != series.dt.microsecond).sum())
+    mismatches += int((utc.to_numpy() != ticks.astype("datetime64[us]")).sum())
+    mismatches += int((arrow_wall.to_numpy() != wall.to_numpy()).sum())
+    mismatches += int((arrow_utc.to_numpy() != utc.to_numpy()).sum())
+    mismatches += check_scalars(rng, 20_000)
+
+    print(f"{args.rows:,} timestamps in America/New_York")
+    print(f"{'path':<32} {'rows/s':>14} {'speedup':>9}")
+    print(f"{'strftime/strptime (previous)':<32} {previous_rate:>14,.0f} {'-':>9}")
+    for label, elapsed in (("Series, keep='wall'", wall_time), ("Series, keep='utc'", utc_time),
+                           ("Arrow, keep='wall'", arrow_wall_time), ("Arrow, keep='utc'", arrow_utc_time)):
+        rate = args.rows / elapsed
+        print(f"{label:<32} {rate:>14,.0f} {rate / previous_rate:>8,.0f}x")
+    print(f"precision mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
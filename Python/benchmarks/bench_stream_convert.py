@@ -0,0 +1,68 @@
+"""
+Throughput and correctness check of convert_file across CSV and Parquet.
+
+Writes --rows rows of local times and zones to a CSV and a Parquet file, and converts each to
+both formats. The first --chunksize rows are all invalid, so the first chunk written has no
+converted values (Parquet must still take the later chunks). Every output is read back and
+checked against to_utc_batch on the whole column; the run fails (exit status 1) on a mismatch.
+
+Usage:
+    python benchmarks/bench_stream_convert.py [--rows 1000000] [--chunksize 100000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.batch_convert import format_timestamps, to_utc_batch
+from zone_time.stream_convert import convert_file
+
+
+def read(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    times = np.char.replace(np.datetime_as_string(rng.integers(0, 2_000_000_000, args.rows).astype("datetime64[s]")),
+                            "T", " ").astype(object)
+    times[:min(args.chunksize, args.rows)] = "not a time"
+    zones = np.array(pytz.common_timezones, dtype=object)[rng.integers(0, len(pytz.common_timezones), args.rows)]
+    expected = format_timestamps(to_utc_batch(times, zones).values, "+0000")
+
+    failed = False
+    print(f"{args.rows:,} rows, chunks of {args.chunksize:,}, first chunk all invalid")
+    print(f"{'source -> destination':<24} {'seconds':>9} {'rows/s':>14} {'mismatches':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        frame = pd.DataFrame({"time": times, "tz": zones})
+        sources = {"csv": os.path.join(directory, "in.csv"), "parquet": os.path.join(directory, "in.parquet")}
+        frame.to_csv(sources["csv"], index=False)
+        frame.to_parquet(sources["parquet"], index=False)
+        for source_format, source in sources.items():
+            for destination_format in ("csv", "parquet"):
+                destination = os.path.join(directory, f"out.{destination_format}")
+                summary = convert_file(source, destination, "time", tz_column="tz", chunksize=args.chunksize)
+                converted = read(destination)["time_utc"].to_numpy(dtype=object)
+                mismatches = sum(1 for value, want in zip(converted, expected)
+                                 if (want is None and not pd.isna(value)) or (want is not None and value != want))
+                mismatches += abs(len(converted) - len(expected))
+                failed = failed or mismatches > 0
+                print(f"{source_format + ' -> ' + destination_format:<24} {summary['seconds']:>9.2f} "
+                      f"{summary['rows_per_second']:>14,.0f} {mismatches:>11,}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Benchmark of time_difference_matrix against per-pair pytz offset lookups.
+
+Builds the zones x zones x instants minute-difference matrix for hourly instants of a year,
+then times the per-pair astimezone approach on a sample of cells (its rate is extrapolated)
+and checks the sampled cells agree.
+
+Usage:
+    python benchmarks/bench_time_difference.py [--zones 100] [--hours 8760] [--scalar-cells 20000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.time_difference import time_difference_matrix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--zones", type=int, default=100)
+    parser.add_argument("--hours", type=int, default=8760)
+    parser.add_argument("--scalar-cells", type=int, default=20_000,
+                        help="cells computed with per-pair pytz calls (their rate is extrapolated)")
+    args = parser.parse_args(argv)
+
+    zones = pytz.common_timezones[::max(1, len(pytz.common_timezones) // args.zones)][:args.zones]
+    instants = pd.date_range("2027-01-01", periods=args.hours, freq="h", tz="UTC")
+
+    start = time.perf_counter()
+    matrix = time_difference_matrix(zones, instants)
+    matrix_time = time.perf_counter() - start
+    cells = matrix.size
+
+    rng = np.random.default_rng(0)
+    sample = rng.integers(0, [len(zones), len(zones), len(instants)], size=(args.scalar_cells, 3))
+    tzinfos = [pytz.timezone(tz) for tz in zones]
+    moments = instants.to_pydatetime()
+    start = time.perf_counter()
+    expected = [round((moments[t].astimezone(tzinfos[i]).utcoffset().total_seconds()
+                       - moments[t].astimezone(tzinfos[j]).utcoffset().total_seconds()) / 60)
+                for i, j, t in sample]
+    scalar_time = time.perf_counter() - start
+    mismatches = int((matrix[sample[:, 0], sample[:, 1], sample[:, 2]] != np.array(expected)).sum())
+    scalar_rate = len(sample) / scalar_time
+
+    print(f"{len(zones)} zones x {len(zones)} zones x {len(instants):,} instants = {cells:,} cells "
+          f"({matrix.nbytes / 2 ** 20:,.0f} MiB)")
+    print(f"per-pair pytz: {scalar_rate:>14,.0f} cells/s (extrapolated {cells / scalar_rate:,.0f}s)")
+    print(f"matrix:        {cells / matrix_time:>14,.0f} cells/s ({matrix_time:.2f}s)")
+    print(f"speedup:       {cells / matrix_time / scalar_rate:>14,.0f}x")
+    print(f"mismatches in {len(sample):,} sampled cells: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
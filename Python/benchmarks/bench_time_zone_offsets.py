@@ -0,0 +1,89 @@
+"""
+Benchmark and correctness check of time_zone_offsets against per-row pytz offsets.
+
+Times time_zone_offset (one string per row, as before) on a sample and time_zone_offsets on
+--rows timestamps spread over the common zones: UTC instants and wall-clock times from NumPy
+arrays, with zones as a list and as an Arrow string array. The offsets of a sample are checked
+against pytz (utcoffset at the instant, and localize for wall times).
+
+Usage:
+    python benchmarks/bench_time_zone_offsets.py [--rows 10000000] [--scalar-rows 20000] [--check-rows 50000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pyarrow as pa
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.time_zone_offset import time_zone_offset, time_zone_offsets
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def pytz_offsets(seconds, zones, kind):
+    # Offsets in seconds, one pytz call per row
+    tzinfos = {zone: pytz.timezone(zone) for zone in set(zones)}
+    if kind == "utc":
+        return [int(datetime.fromtimestamp(int(s), tzinfos[zone]).utcoffset().total_seconds())
+                for s, zone in zip(seconds, zones)]
+    return [int(tzinfos[zone].localize(EPOCH + timedelta(seconds=int(s))).utcoffset().total_seconds())
+            for s, zone in zip(seconds, zones)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--scalar-rows", type=int, default=20_000,
+                        help="rows timed with time_zone_offset (its rate is extrapolated)")
+    parser.add_argument("--check-rows", type=int, default=50_000, help="rows checked against pytz")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    zone_names = np.array(pytz.common_timezones, dtype=object)
+    seconds = rng.integers(-1_000_000_000, 2_500_000_000, args.rows)
+    instants = seconds.astype("datetime64[s]")
+    zone_list = zone_names[rng.integers(0, len(zone_names), args.rows)].tolist()
+    zone_array = pa.array(zone_list)
+
+    sample = min(args.scalar_rows, args.rows)
+    naive = [EPOCH + timedelta(seconds=int(s)) for s in seconds[:sample]]
+    _, scalar_time = timed(time_zone_offset, zone_list[:sample], naive)
+    scalar_rate = sample / scalar_time
+
+    runs = [
+        ("utc, list of zones", lambda: time_zone_offsets(zone_list, instants)),
+        ("utc, Arrow zones", lambda: time_zone_offsets(zone_array, instants)),
+        ("utc, one zone", lambda: time_zone_offsets("America/New_York", instants)),
+        ("wall, Arrow zones", lambda: time_zone_offsets(zone_array, instants, kind="wall")),
+        ("wall, Arrow zones, strings", lambda: time_zone_offsets(zone_array, instants, kind="wall", as_strings=True)),
+    ]
+    print(f"{args.rows:,} rows, {len(zone_names)} zones")
+    print(f"{'path':<34} {'seconds':>9} {'rows/s':>14} {'speedup':>9}")
+    print(f"{'time_zone_offset (per row)':<34} {args.rows / scalar_rate:>9.1f} {scalar_rate:>14,.0f} {'-':>9}")
+    results = {}
+    for label, func in runs:
+        results[label], elapsed = timed(func)
+        print(f"{label:<34} {elapsed:>9.2f} {args.rows / elapsed:>14,.0f} {args.rows / elapsed / scalar_rate:>8,.0f}x")
+
+    check = min(args.check_rows, args.rows)
+    mismatches = 0
+    for kind, label in (("utc", "utc, Arrow zones"), ("wall", "wall, Arrow zones")):
+        expected = np.array(pytz_offsets(seconds[:check], zone_list[:check], kind))
+        mismatches += int((results[label].seconds[:check] != expected).sum())
+    print(f"mismatches against pytz in {check:,} rows: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark of parse_timestamps against a datetime.strptime loop.
+
+Parses the same "YYYY-MM-DD HH:MM:SS" strings both ways (plus a variant with fractional
+seconds and offsets for the bulk parser) and checks that the results agree. Small inputs (1 and
+10 rows) are timed per call as well: there parse_wall_seconds, which the list paths of
+convert_to_utc and convert_from_utc use, must stay within --max-small-ratio of the strptime loop,
+or the run fails (exit status 1).
+
+Usage:
+    python benchmarks/bench_timestamp_parser.py [--rows 1000000] [--max-small-ratio 2.0]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.timestamp_parser import parse_timestamps, parse_wall_seconds
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def strptime_loop(values):
+    return [datetime.strptime(value, "%Y-%m-%d %H:%M:%S") for value in values]
+
+
+def per_call(func, *args):
+    # Fastest of 5 runs of enough calls to last about 0.2 s
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(5, number)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--max-small-ratio", type=float, default=2.0,
+                        help="largest parse_wall_seconds / strptime time allowed for 1 and 10 rows (default: 2.0)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    seconds = rng.integers(0, 2_000_000_000, args.rows).astype("datetime64[s]")
+    plain = np.char.replace(np.datetime_as_string(seconds), "T", " ").tolist()
+    micros = seconds.astype("datetime64[us]") + rng.integers(0, 1_000_000, args.rows).astype("timedelta64[us]")
+    extended = np.char.add(np.datetime_as_string(micros), "+05:30").tolist()
+
+    expected, strptime_time = timed(strptime_loop, plain)
+    parsed, parser_time = timed(parse_timestamps, plain)
+    if parsed.invalid.any() or not np.array_equal(parsed.values, np.array(expected, dtype="datetime64[us]")):
+        raise AssertionError("parse_timestamps disagrees with strptime")
+    parsed_extended, extended_time = timed(parse_timestamps, extended)
+    if parsed_extended.invalid.any() or not np.array_equal(parsed_extended.values, micros):
+        raise AssertionError("parse_timestamps misread fractional seconds")
+
+    print(f"{args.rows:,} strings")
+    print(f"{'path':<34} {'seconds':>8} {'rows/s':>14}")
+    print(f"{'strptime loop':<34} {strptime_time:>8.2f} {args.rows / strptime_time:>14,.0f}")
+    print(f"{'parse_timestamps':<34} {parser_time:>8.2f} {args.rows / parser_time:>14,.0f}")
+    print(f"{'parse_timestamps (.ffffff+HH:MM)':<34} {extended_time:>8.2f} {args.rows / extended_time:>14,.0f}")
+
+    print()
+    print(f"{'rows':>4} {'strptime us':>12} {'parse_wall_seconds us':>22} {'parse_timestamps us':>20}")
+    failed = False
+    for rows in (1, 10):
+        loop = per_call(strptime_loop, plain[:rows])
+        wall = per_call(parse_wall_seconds, plain[:rows])
+        bulk = per_call(parse_timestamps, plain[:rows])
+        slow = wall > loop * args.max_small_ratio
+        failed = failed or slow
+        print(f"{rows:>4} {loop * 1e6:>12.1f} {wall * 1e6:>22.1f} {bulk * 1e6:>20.1f}{'  FAIL' if slow else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark of the memory-mapped zone database against compiling zones from pytz.
+
+Compiles a database into a temporary directory, checks that every table in it equals the one
+built from pytz, then starts fresh worker processes that each compile every zone, once with the
+database and once without (ZONE_TIME_DB=off). Each worker reports the time to open the database,
+the time to compile all zones and how much private (anonymous) memory that took; the tables read
+from the database live in the shared file mapping instead. Memory figures need Linux's /proc.
+
+Usage:
+    python benchmarks/bench_zone_db.py [--workers 4] [--zones 0]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.zone_db import ZoneDatabase, compile_database
+from zone_time.zone_engine import pytz_tables
+
+WORKER = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import numpy, pytz
+
+def private_kib():
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+
+from zone_time import zone_db
+from zone_time.zone_engine import compile_zone
+names = {names!r}
+before = private_kib()
+start = time.perf_counter()
+database = zone_db.shared_database()
+opened = time.perf_counter()
+for name in names:
+    compile_zone(name)
+done = time.perf_counter()
+after = private_kib()
+print(json.dumps({{"database": database is not None, "open": opened - start, "compile": done - opened,
+                  "private_kib": None if before is None else after - before}}))
+"""
+
+
+def run_workers(count, names, database):
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    env = dict(os.environ, ZONE_TIME_DB=database or "off")
+    code = WORKER.format(root=root, names=names)
+    results = []
+    for _ in range(count):
+        output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+        results.append(json.loads(output.stdout))
+    return results
+
+
+def check(database):
+    # Every table in the database must equal the one built from pytz
+    mismatches = 0
+    for name in database.names:
+        expected = pytz_tables(name)
+        mismatches += not all(np.array_equal(stored, built) for stored, built in zip(database.tables(name), expected))
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="fresh processes per mode")
+    parser.add_argument("--zones", type=int, default=0, help="zones each worker compiles (default: all)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "zones.bin")
+        start = time.perf_counter()
+        compile_database(path)
+        compile_time = time.perf_counter() - start
+        database = ZoneDatabase(path)
+        names = list(database.names[:args.zones] if args.zones else database.names)
+        mismatches = check(database)
+        stats = database.stats()
+        print(f"compiled {stats['zones']} zones, {stats['periods']:,} periods, {stats['bytes'] / 1024:,.0f} KiB "
+              f"(tzdata {stats['tzdata_version']}) in {compile_time:.2f}s")
+        print(f"{args.workers} workers x {len(names)} zones")
+        print(f"{'source':<10} {'open ms':>9} {'compile ms':>11} {'private KiB':>12}")
+        for label, source in (("pytz", None), ("database", path)):
+            results = run_workers(args.workers, names, source)
+            if any(result["database"] != (source is not None) for result in results):
+                raise AssertionError(f"{label}: workers did not use the expected zone source")
+            private = [result["private_kib"] for result in results]
+            memory = f"{statistics.median(private):>12,.0f}" if None not in private else f"{'-':>12}"
+            print(f"{label:<10} {statistics.median(result['open'] for result in results) * 1e3:>9.2f} "
+                  f"{statistics.median(result['compile'] for result in results) * 1e3:>11.1f} {memory}")
+    print(f"mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Benchmark of the compiled transition-table engine against per-element pytz calls.
+
+Converts the same timestamps UTC -> local (pytz astimezone vs utc_lookup) and
+local -> UTC (pytz localize vs local_lookup), and checks that both give the same offsets.
+
+Usage:
+    python benchmarks/bench_zone_engine.py [--rows 1000000] [--zones 50]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.zone_engine import local_lookup, utc_lookup
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def pytz_from_utc(seconds, zones):
+    epoch = pytz.utc.localize(datetime(1970, 1, 1))
+    tzinfos = {zone: pytz.timezone(zone) for zone in set(zones)}
+    return [int((epoch + timedelta(seconds=int(s))).astimezone(tzinfos[zone]).utcoffset().total_seconds())
+            for s, zone in zip(seconds, zones)]
+
+
+def pytz_to_utc(seconds, zones):
+    epoch = datetime(1970, 1, 1)
+    tzinfos = {zone: pytz.timezone(zone) for zone in set(zones)}
+    return [int(tzinfos[zone].localize(epoch + timedelta(seconds=int(s))).utcoffset().total_seconds())
+            for s, zone in zip(seconds, zones)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--zones", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    seconds = rng.integers(0, 2_000_000_000, args.rows)
+    zones = np.array(pytz.common_timezones[:args.zones], dtype=object)[rng.integers(0, args.zones, args.rows)]
+    zone_list = zones.tolist()
+
+    print(f"{args.rows:,} timestamps, {args.zones} zones")
+    print(f"{'direction':<14} {'pytz s':>9} {'engine s':>9} {'speedup':>9}")
+    for label, pytz_func, engine_func in (("utc -> local", pytz_from_utc, utc_lookup),
+                                          ("local -> utc", pytz_to_utc, local_lookup)):
+        expected, pytz_time = timed(pytz_func, seconds, zone_list)
+        result, engine_time = timed(engine_func, seconds, zones)
+        offsets = result[0] if engine_func is utc_lookup else result[1]
+        if not np.array_equal(offsets, expected):
+            raise AssertionError(f"{label}: engine offsets differ from pytz")
+        print(f"{label:<14} {pytz_time:>9.2f} {engine_time:>9.3f} {pytz_time / engine_time:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
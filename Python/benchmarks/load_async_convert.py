@@ -0,0 +1,186 @@
+"""
+Local load test of the asyncio conversion API.
+
+1. Small requests: --clients concurrent clients each send --requests one-row conversions, one
+   after another, as request handlers would. They are handled inline with convert_time_zone and
+   then through a ConversionCoalescer. The test reports throughput and per-request latency, and
+   checks that both give the same answers.
+2. Event-loop blocking: one --large-rows batch is converted inline with convert_time_zone_batch
+   and then with convert_time_zone_async, while a heartbeat task measures how late the loop
+   wakes it.
+3. Threshold: convert_time_zone_batch and convert_from_utc are timed inline and through the
+   executor over a range of batch sizes. The suggested run_batch threshold is the smallest size
+   whose inline call blocks the loop for longer than --max-block milliseconds.
+
+Usage:
+    python benchmarks/load_async_convert.py [--clients 200] [--requests 50] [--window 0.002] [--large-rows 200000]
+                                            [--max-block 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import timeit
+
+import numpy as np
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.async_convert import DEFAULT_THRESHOLD, ConversionCoalescer, convert_time_zone_async
+from zone_time.convert_from_utc import convert_from_utc
+from zone_time.convert_time_zone import convert_time_zone, convert_time_zone_batch
+
+THRESHOLD_SIZES = (10, 100, 300, 1000, 3000, 10000)
+
+
+def workload(clients, requests, seed=0):
+    rng = np.random.default_rng(seed)
+    zones = pytz.common_timezones[::10]
+    seconds = rng.integers(0, 2_000_000_000, (clients, requests))
+    times = np.char.replace(np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s"), "T", " ")
+    from_tz = np.array(zones, dtype=object)[rng.integers(0, len(zones), (clients, requests))]
+    to_tz = np.array(zones, dtype=object)[rng.integers(0, len(zones), (clients, requests))]
+    return [[(str(times[c, r]), from_tz[c, r], to_tz[c, r]) for r in range(requests)] for c in range(clients)]
+
+
+async def run_clients(work, handle):
+    latencies = []
+    answers = []
+
+    async def client(requests):
+        for request in requests:
+            start = time.perf_counter()
+            answers.append((request, await handle(*request)))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(requests) for requests in work))
+    return time.perf_counter() - start, latencies, dict(answers)
+
+
+async def heartbeat_lag(work, interval=0.001):
+    # Run work while a task sleeps in short steps, and report its worst wake-up delay
+    lags = []
+    done = asyncio.Event()
+
+    async def beat():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    beater = asyncio.create_task(beat())
+    await asyncio.sleep(interval * 5)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beater
+    return elapsed, max(lags)
+
+
+def best_time(func):
+    # Fastest of 3 runs of enough calls to last about 0.2 s
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(3, number)) / number
+
+
+async def offloaded_time(func, repeat=20):
+    # Best round trip of func through the default executor
+    loop = asyncio.get_running_loop()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await loop.run_in_executor(None, func)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def threshold_table(max_block):
+    requests = [request for requests in workload(max(THRESHOLD_SIZES) // 100, 100, seed=2) for request in requests]
+    times = [request[0] for request in requests]
+    zones = [request[1] for request in requests]
+    print(f"\nrun_batch threshold (inline vs executor, ms; current default {DEFAULT_THRESHOLD:,} rows)")
+    print(f"{'rows':>8} {'time_zone inline':>17} {'executor':>9} {'from_utc inline':>16} {'executor':>9}")
+    suggested = None
+    for size in THRESHOLD_SIZES:
+        calls = (lambda: convert_time_zone_batch(times[:size], zones[:size], "Asia/Tokyo"),
+                 lambda: convert_from_utc(times[:size], zones[:size]))
+        timings = []
+        for call in calls:
+            timings += [best_time(call), await offloaded_time(call)]
+        if suggested is None and max(timings[0], timings[2]) > max_block / 1e3:
+            suggested = size
+        print(f"{size:>8,} " + " ".join(f"{value * 1e3:>{width}.2f}" for value, width in zip(timings, (17, 9, 16, 9))))
+    print(f"suggested threshold: {suggested:,} rows" if suggested else
+          f"no size up to {max(THRESHOLD_SIZES):,} rows blocks longer than {max_block:g} ms")
+
+
+def report(label, elapsed, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{label:<28} {len(latencies) / elapsed:>12,.0f} {statistics.median(latencies) * 1e3:>10.2f} "
+          f"{p99 * 1e3:>10.2f}")
+
+
+async def main_async(args):
+    work = workload(args.clients, args.requests)
+
+    async def inline(time_str, from_tz, to_tz):
+        return convert_time_zone(time_str, from_tz, to_tz)
+
+    coalescer = ConversionCoalescer(window=args.window)
+    # Warm up the zone caches
+    await run_clients(work[:5], inline)
+    await run_clients(work[:5], coalescer.convert)
+
+    print(f"{args.clients} clients x {args.requests} one-row requests")
+    print(f"{'mode':<28} {'requests/s':>12} {'p50 ms':>10} {'p99 ms':>10}")
+    inline_time, inline_latencies, inline_answers = await run_clients(work, inline)
+    report("inline convert_time_zone", inline_time, inline_latencies)
+    coalescer = ConversionCoalescer(window=args.window)
+    coalesced_time, coalesced_latencies, coalesced_answers = await run_clients(work, coalescer.convert)
+    await coalescer.aclose()
+    report(f"coalesced ({args.window * 1e3:g} ms window)", coalesced_time, coalesced_latencies)
+    stats = coalescer.stats()
+    print(f"  {stats['batches']:,} batches, {stats['requests_per_batch']:.0f} requests per batch")
+    mismatches = sum(inline_answers[key] != coalesced_answers[key] for key in inline_answers)
+
+    large = [request for requests in workload(args.large_rows // 100 + 1, 100, seed=1) for request in requests]
+    times = [request[0] for request in large[:args.large_rows]]
+    print(f"\n{len(times):,}-row batch: event loop blocking")
+    print(f"{'mode':<28} {'seconds':>12} {'max lag ms':>10}")
+
+    async def blocking():
+        return convert_time_zone_batch(times, "America/New_York", "Asia/Tokyo")
+
+    async def offloaded():
+        return await convert_time_zone_async(times, "America/New_York", "Asia/Tokyo")
+
+    for label, work_func in (("inline batch", blocking), ("convert_time_zone_async", offloaded)):
+        elapsed, lag = await heartbeat_lag(work_func)
+        print(f"{label:<28} {elapsed:>12.3f} {lag * 1e3:>10.1f}")
+
+    await threshold_table(args.max_block)
+
+    print(f"\nmismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--window", type=float, default=0.002, help="coalescing window in seconds")
+    parser.add_argument("--large-rows", type=int, default=200_000)
+    parser.add_argument("--max-block", type=float, default=5.0,
+                        help="longest inline call in ms before a batch should go to the executor (default: 5)")
+    args = parser.parse_args(argv)
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Memory profile of the Arrow / NumPy array paths of the conversion functions, with tracemalloc.
+
+Each function runs on Arrow and NumPy timestamp arrays of two sizes. For every call the script
+reports the peak traced memory per row (NumPy buffers included) and the number of Python memory
+blocks still alive afterwards, outside NumPy's buffers. A path that boxes rows into Python objects
+shows a block count that grows with the number of rows; the array paths must not, and the run
+fails (exit status 1) if one does. The list-of-strings path of convert_to_utc is shown for contrast.
+
+Usage:
+    python benchmarks/mem_array_interop.py [--rows 1000000] [--small-rows 100000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pyarrow as pa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zone_time.add_time_zone import add_time_zone
+from zone_time.convert_from_utc import convert_from_utc
+from zone_time.convert_to_utc import convert_to_utc
+from zone_time.format_with_timezone import format_with_timezone
+from zone_time.remove_time_zone import remove_time_zone
+
+ZONES = ["America/New_York", "Europe/Berlin", "Asia/Kolkata", "Australia/Sydney"]
+# Growth in live Python blocks between the two sizes that still counts as "no per-row objects"
+MAX_BLOCK_GROWTH = 1000
+
+
+def inputs(rows):
+    rng = np.random.default_rng(0)
+    ticks = rng.integers(0, 2_000_000_000, rows) * 1_000_000 + rng.integers(0, 1_000_000, rows)
+    zones = pa.array(np.array(ZONES, dtype=object)[rng.integers(0, len(ZONES), rows)])
+    naive = pa.array(ticks, pa.timestamp("us"))
+    aware = pa.array(ticks, pa.timestamp("us", "UTC"))
+    datetimes = ticks.view("datetime64[us]")
+    return {
+        "convert_to_utc, arrow": lambda: convert_to_utc(naive, zones, return_errors=True),
+        "convert_to_utc, numpy": lambda: convert_to_utc(datetimes, "Europe/Berlin", return_errors=True),
+        "convert_from_utc, arrow, 1 zone": lambda: convert_from_utc(aware, "Asia/Kolkata"),
+        "convert_from_utc, arrow, per row": lambda: convert_from_utc(aware, zones),
+        "convert_from_utc, numpy": lambda: convert_from_utc(datetimes, zones),
+        "add_time_zone, arrow": lambda: add_time_zone(aware, "Australia/Sydney"),
+        "add_time_zone, numpy": lambda: add_time_zone(datetimes, zones),
+        "format_with_timezone, arrow": lambda: format_with_timezone(aware, to_tz="America/New_York"),
+        "format_with_timezone, numpy": lambda: format_with_timezone(datetimes, to_tz="America/New_York"),
+        "remove_time_zone, arrow": lambda: remove_time_zone(aware.cast(pa.timestamp("us", "Europe/Berlin"))),
+    }
+
+
+def list_input(rows):
+    strings = np.datetime_as_string(np.arange(rows).astype("datetime64[s]") + 10 ** 9, unit="s")
+    times = [value.replace("T", " ") for value in strings]
+    zones = [ZONES[i % len(ZONES)] for i in range(rows)]
+    return lambda: convert_to_utc(times, zones, return_errors=True)
+
+
+def profile(func):
+    # Peak traced bytes during the call and live Python blocks (outside NumPy buffers) it leaves behind
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start_size = tracemalloc.get_traced_memory()[0]
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1] - start_size
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    domain = tracemalloc.DomainFilter(inclusive=False, domain=np.lib.tracemalloc_domain)
+    blocks = sum(stat.count_diff for stat in after.filter_traces([domain]).compare_to(
+        before.filter_traces([domain]), "filename"))
+    del result
+    return peak, blocks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--small-rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    small, large = inputs(args.small_rows), inputs(args.rows)
+    # Warm up: compile the zones and import everything outside the measurement
+    for func in inputs(1000).values():
+        func()
+
+    failed = False
+    print(f"{'call':<36} {'peak B/row':>11} {'blocks @' + format(args.small_rows, ','):>16} "
+          f"{'blocks @' + format(args.rows, ','):>18}")
+    for label in large:
+        _, small_blocks = profile(small[label])
+        peak, large_blocks = profile(large[label])
+        grows = large_blocks - small_blocks > MAX_BLOCK_GROWTH
+        failed = failed or grows
+        print(f"{label:<36} {peak / args.rows:>11.1f} {small_blocks:>16,} {large_blocks:>18,}"
+              f"{'  FAIL' if grows else ''}")
+
+    # Contrast: the list path boxes every row
+    _, small_blocks = profile(list_input(args.small_rows))
+    peak, large_blocks = profile(list_input(args.rows))
+    print(f"{'convert_to_utc, list (reference)':<36} {peak / args.rows:>11.1f} {small_blocks:>16,} {large_blocks:>18,}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,408 @@
+"""
+Benchmark suite and regression check for every public function.
+
+Each case times one code path of a public function: the per-element "scalar" path (one call per
+row), the "batch" path (one call on a list or Series) or the "array" path (NumPy / Arrow input).
+Cases run over a grid of input sizes and zone cardinalities, on inputs generated from a fixed
+seed. Setup is not timed; each case is timed over --repeat runs of enough calls to last --min-time
+seconds. Scalar paths are timed on at most --scalar-rows rows, so results are compared as time per
+row, taken from the fastest run: as with timeit, slower runs mostly measure other load on the machine.
+
+Results can be saved as a JSON baseline and later runs compared against it. A case is reported
+as a regression when its time per row grows by more than --threshold (0.25 is 25%), and the run
+then fails with exit status 1. Baselines are only meaningful on the machine and library versions
+they were recorded with; both are stored in the file and differences are pointed out.
+
+Usage:
+    python benchmarks/suite.py [--sizes 100,10000] [--zones 1,50] [--filter REGEX] [--list]
+    python benchmarks/suite.py --save benchmarks/baseline.json
+    python benchmarks/suite.py --compare benchmarks/baseline.json [--threshold 0.25]
+"""
+import argparse
+from collections import namedtuple
+from datetime import datetime, timedelta
+import gc
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import zone_time
+from zone_time import (add_time_zone, add_time_zone_batched, convert_from_utc, convert_time_zone,
+                       convert_time_zone_batch, convert_to_utc, format_with_timezone, get_local_time,
+                       get_local_times, is_dst, is_dst_batch, list_time_zones, remove_time_zone, time_difference,
+                       time_difference_matrix, time_zone_offset, time_zone_offsets)
+
+Case = namedtuple("Case", ["function", "path", "setup", "sized", "zoned"])
+CASES = []
+
+
+def case(function, path, sized=True, zoned=True):
+    """
+    Register a benchmark case.
+
+    setup(inputs) prepares the input outside the timing and returns the workload, a callable
+    without arguments, and the number of rows it handles per call. sized and zoned tell whether
+    the case depends on the input size and the zone cardinality; a case that does not runs once
+    instead of once per grid value.
+    """
+    def register(setup):
+        CASES.append(Case(function, path, setup, sized, zoned))
+        return setup
+    return register
+
+
+class Inputs:
+    """
+    Reproducible inputs for one grid point: size rows spread over `zones` distinct time zones.
+    """
+
+    def __init__(self, size, zones, scalar_rows):
+        rng = np.random.default_rng(0)
+        self.size = size
+        self.scalar_rows = min(size, scalar_rows)
+        # A spread of common zones, with and without DST
+        names = pytz.common_timezones[::max(1, len(pytz.common_timezones) // zones)][:zones]
+        self.zone_names = names
+        self.zones = [names[i] for i in rng.integers(0, len(names), size)]
+        self.seconds = rng.integers(946_684_800, 1_893_456_000, size)  # 2000 to 2030
+        self.datetimes = self.seconds.astype("datetime64[s]")
+        self.strings = [value.replace("T", " ") for value in np.datetime_as_string(self.datetimes, unit="s")]
+        self.naive = [datetime(1970, 1, 1) + timedelta(seconds=int(s)) for s in self.seconds]
+
+    def scalar(self, values):
+        return values[:self.scalar_rows]
+
+    def aware_series(self, tz="America/New_York"):
+        return pd.Series(self.datetimes.astype("datetime64[ns]")).dt.tz_localize("UTC").dt.tz_convert(tz)
+
+
+@case("add_time_zone", "scalar")
+def bench_add_time_zone_scalar(inputs):
+    series = inputs.aware_series("UTC").iloc[:inputs.scalar_rows]
+    zones = pd.Series(inputs.scalar(inputs.zones))
+    return lambda: add_time_zone(series, zones), len(series)
+
+
+@case("add_time_zone", "batch")
+def bench_add_time_zone_batch(inputs):
+    series, zones = inputs.aware_series("UTC"), pd.Series(inputs.zones)
+    return lambda: add_time_zone_batched(series, zones, output="frame"), inputs.size
+
+
+@case("add_time_zone", "array")
+def bench_add_time_zone_array(inputs):
+    return lambda: add_time_zone(inputs.datetimes, inputs.zones), inputs.size
+
+
+@case("convert_to_utc", "scalar")
+def bench_convert_to_utc_scalar(inputs):
+    rows = list(zip(inputs.scalar(inputs.strings), inputs.scalar(inputs.zones)))
+    return lambda: [convert_to_utc([time_str], [tz]) for time_str, tz in rows], len(rows)
+
+
+@case("convert_to_utc", "batch")
+def bench_convert_to_utc_batch(inputs):
+    return lambda: convert_to_utc(inputs.strings, inputs.zones), inputs.size
+
+
+@case("convert_to_utc", "array")
+def bench_convert_to_utc_array(inputs):
+    return lambda: convert_to_utc(inputs.datetimes, inputs.zones, return_errors=True), inputs.size
+
+
+@case("convert_from_utc", "scalar")
+def bench_convert_from_utc_scalar(inputs):
+    rows = list(zip(inputs.scalar(inputs.strings), inputs.scalar(inputs.zones)))
+    return lambda: [convert_from_utc([time_str], [tz]) for time_str, tz in rows], len(rows)
+
+
+@case("convert_from_utc", "batch")
+def bench_convert_from_utc_batch(inputs):
+    return lambda: convert_from_utc(inputs.strings, inputs.zones), inputs.size
+
+
+@case("convert_from_utc", "array")
+def bench_convert_from_utc_array(inputs):
+    return lambda: convert_from_utc(inputs.datetimes, inputs.zones), inputs.size
+
+
+@case("convert_time_zone", "scalar")
+def bench_convert_time_zone_scalar(inputs):
+    rows = list(zip(inputs.scalar(inputs.strings), inputs.scalar(inputs.zones)))
+    return lambda: [convert_time_zone(time_str, tz, "Asia/Tokyo") for time_str, tz in rows], len(rows)
+
+
+@case("convert_time_zone", "batch")
+def bench_convert_time_zone_batch(inputs):
+    return lambda: convert_time_zone_batch(inputs.strings, inputs.zones, "Asia/Tokyo"), inputs.size
+
+
+@case("format_with_timezone", "scalar")
+def bench_format_with_timezone_scalar(inputs):
+    values = list(inputs.aware_series().iloc[:inputs.scalar_rows])
+    return lambda: [format_with_timezone(value, to_tz="Europe/Paris") for value in values], len(values)
+
+
+@case("format_with_timezone", "batch", zoned=False)
+def bench_format_with_timezone_batch(inputs):
+    series = inputs.aware_series()
+    return lambda: format_with_timezone(series, to_tz="Europe/Paris"), inputs.size
+
+
+@case("format_with_timezone", "array", zoned=False)
+def bench_format_with_timezone_array(inputs):
+    return lambda: format_with_timezone(inputs.datetimes, to_tz="Europe/Paris"), inputs.size
+
+
+@case("get_local_time", "scalar", sized=False)
+def bench_get_local_time_scalar(inputs):
+    zones = inputs.zone_names
+    return lambda: [get_local_time(tz, format_output=True, include_tz_abbreviation=True) for tz in zones], len(zones)
+
+
+@case("get_local_time", "batch", sized=False)
+def bench_get_local_time_batch(inputs):
+    zones = inputs.zone_names
+    return lambda: get_local_times(zones, format_output=True, include_tz_abbreviation=True), len(zones)
+
+
+@case("is_dst", "scalar")
+def bench_is_dst_scalar(inputs):
+    rows = list(zip(inputs.scalar(inputs.strings), inputs.scalar(inputs.zones)))
+    return lambda: [is_dst(time_str, tz) for time_str, tz in rows], len(rows)
+
+
+@case("is_dst", "batch")
+def bench_is_dst_batch(inputs):
+    return lambda: is_dst_batch(inputs.strings, inputs.zones), inputs.size
+
+
+@case("list_time_zones", "scalar", zoned=False)
+def bench_list_time_zones_scalar(inputs):
+    queries = [name.split("/")[-1][:4] for name in inputs.scalar(inputs.zones)]
+    return lambda: [list_time_zones(query, limit=10) for query in queries], len(queries)
+
+
+@case("list_time_zones", "batch", sized=False, zoned=False)
+def bench_list_time_zones_batch(inputs):
+    count = len(list_time_zones())
+    return lambda: list_time_zones(details=True), count
+
+
+@case("remove_time_zone", "scalar", zoned=False)
+def bench_remove_time_zone_scalar(inputs):
+    values = list(inputs.aware_series().iloc[:inputs.scalar_rows])
+    return lambda: [remove_time_zone(value) for value in values], len(values)
+
+
+@case("remove_time_zone", "batch", zoned=False)
+def bench_remove_time_zone_batch(inputs):
+    series = inputs.aware_series()
+    return lambda: remove_time_zone(series), inputs.size
+
+
+@case("remove_time_zone", "array", zoned=False)
+def bench_remove_time_zone_array(inputs):
+    import pyarrow as pa
+    array = pa.array(inputs.aware_series())
+    return lambda: remove_time_zone(array), inputs.size
+
+
+@case("time_difference", "scalar")
+def bench_time_difference_scalar(inputs):
+    at = datetime(2024, 3, 15, 12)
+    rows = list(zip(inputs.scalar(inputs.zones), inputs.scalar(inputs.zones[::-1])))
+    return lambda: [time_difference([tz1], [tz2], at=at) for tz1, tz2 in rows], len(rows)
+
+
+@case("time_difference", "batch")
+def bench_time_difference_batch(inputs):
+    at = datetime(2024, 3, 15, 12)
+    return lambda: time_difference(inputs.zones, inputs.zones[::-1], at=at), inputs.size
+
+
+@case("time_difference", "matrix", sized=False)
+def bench_time_difference_matrix(inputs):
+    instants = pd.date_range("2024-01-01", periods=24, freq="7D", tz="UTC")
+    zones = inputs.zone_names
+    return lambda: time_difference_matrix(zones, instants), len(zones) ** 2 * len(instants)
+
+
+@case("time_zone_offset", "scalar")
+def bench_time_zone_offset_scalar(inputs):
+    rows = list(zip(inputs.scalar(inputs.zones), inputs.scalar(inputs.naive)))
+    return lambda: [time_zone_offset([tz], [dt]) for tz, dt in rows], len(rows)
+
+
+@case("time_zone_offset", "batch")
+def bench_time_zone_offset_batch(inputs):
+    return lambda: time_zone_offset(inputs.zones, inputs.naive), inputs.size
+
+
+@case("time_zone_offset", "array")
+def bench_time_zone_offset_array(inputs):
+    return lambda: time_zone_offsets(inputs.zones, inputs.datetimes, kind="wall"), inputs.size
+
+
+def measure(func, repeat, min_time):
+    """
+    Time a workload: calls per run are doubled until a run lasts min_time, then repeat runs are timed.
+    The garbage collector is off while timing, as in timeit.
+
+    Returns:
+    List[float]: Seconds per call, one per run.
+    """
+    func()  # warm-up: zone tables, caches and imports
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _timed_runs(func, repeat, min_time)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _timed_runs(func, repeat, min_time):
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    runs = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - start) / number)
+    return runs
+
+
+def run_suite(sizes, zone_counts, pattern=None, repeat=5, min_time=0.05, scalar_rows=1000, report=print):
+    """
+    Run every case matching pattern over the grid.
+
+    Returns:
+    dict: Case key -> {"rows", "seconds" (median per call), "min" (fastest per call), "per_row" (min / rows)}.
+    """
+    results = {}
+    inputs = {}
+    for function, path, setup, sized, zoned in CASES:
+        for size in sizes if sized else sizes[:1]:
+            for zones in zone_counts if zoned else zone_counts[:1]:
+                key = f"{function}[{path}]" + (f" n={size}" if sized else "") + (f" z={zones}" if zoned else "")
+                if pattern and not re.search(pattern, key):
+                    continue
+                if (size, zones) not in inputs:
+                    inputs[(size, zones)] = Inputs(size, zones, scalar_rows)
+                workload, rows = setup(inputs[(size, zones)])
+                runs = measure(workload, repeat, min_time)
+                median = statistics.median(runs)
+                best = min(runs)
+                results[key] = {"rows": rows, "seconds": median, "min": best, "per_row": best / rows}
+                report(f"{key:<44} {rows:>9,} {median * 1e3:>11.3f} {best / rows * 1e6:>11.3f}")
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pytz": pytz.__version__,
+        "tzdata": pytz.OLSON_VERSION,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "node": platform.node(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare time per row against a baseline.
+
+    Returns:
+    Tuple[List[str], List[str]]: The keys that got slower and faster by more than threshold.
+    """
+    slower, faster = [], []
+    print(f"\n{'case':<44} {'baseline us':>12} {'now us':>11} {'change':>8}")
+    for key, result in results.items():
+        before = baseline.get(key)
+        if before is None:
+            print(f"{key:<44} {'-':>12} {result['per_row'] * 1e6:>11.3f} {'new':>8}")
+            continue
+        ratio = result["per_row"] / before["per_row"]
+        flag = ""
+        if ratio > 1 + threshold:
+            slower.append(key)
+            flag = "  SLOWER"
+        elif ratio < 1 / (1 + threshold):
+            faster.append(key)
+            flag = "  faster"
+        print(f"{key:<44} {before['per_row'] * 1e6:>12.3f} {result['per_row'] * 1e6:>11.3f} "
+              f"{ratio - 1:>+8.0%}{flag}")
+    return slower, faster
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100,10000", help="comma-separated input sizes (default: 100,10000)")
+    parser.add_argument("--zones", default="1,50", help="comma-separated zone cardinalities (default: 1,50)")
+    parser.add_argument("--filter", help="only run cases whose key matches this regular expression")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timed run (default: 0.05)")
+    parser.add_argument("--scalar-rows", type=int, default=1000, help="rows for the scalar paths (default: 1000)")
+    parser.add_argument("--save", help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", help="compare against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown reported as a regression (default: 0.25)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    zone_counts = [int(zones) for zones in args.zones.split(",")]
+
+    if args.list:
+        for function, path, _, sized, zoned in CASES:
+            print(f"{function}[{path}]" + (" n" if sized else "") + (" z" if zoned else ""))
+        return 0
+
+    print(f"zone_time from {os.path.dirname(zone_time.__file__)}")
+    print(f"{'case':<44} {'rows':>9} {'ms/call':>11} {'best us/row':>11}")
+    results = run_suite(sizes, zone_counts, args.filter, args.repeat, args.min_time, args.scalar_rows)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"environment": environment(), "created": datetime.now().isoformat(timespec="seconds"),
+                       "results": results}, file, indent=1, sort_keys=True)
+        print(f"\nSaved {len(results)} results to {args.save}")
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as file:
+        baseline = json.load(file)
+    current = environment()
+    differences = [f"{key} {value} -> {current.get(key)}" for key, value in baseline["environment"].items()
+                   if current.get(key) != value]
+    if differences:
+        print("\nWarning: the baseline was recorded in another environment: " + ", ".join(differences))
+    slower, faster = compare(results, baseline["results"], args.threshold)
+    print(f"\n{len(slower)} slower, {len(faster)} faster than the baseline by more than {args.threshold:.0%}")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
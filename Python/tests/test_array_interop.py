@@ -0,0 +1,60 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from zone_time.add_time_zone import add_time_zone
+from zone_time.array_interop import read_timestamps, retag
+from zone_time.convert_from_utc import convert_from_utc
+
+ROWS = 100_000
+TICKS = np.arange(ROWS, dtype=np.int64) * 7_919_000_003 + 1_600_000_000_000_000
+
+
+def traced(func):
+    # The result of func, the peak traced memory (NumPy buffers included) while it ran, and the
+    # number of Python memory blocks outside NumPy's buffers that are still alive with the result
+    func()  # Compile the zones outside the measurement
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1] - start
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    domain = tracemalloc.DomainFilter(inclusive=False, domain=np.lib.tracemalloc_domain)
+    return result, peak, len(snapshot.filter_traces([domain]).traces)
+
+
+def test_numpy_buffer_is_read_without_copying():
+    datetimes = TICKS.view("datetime64[ns]")
+
+    timestamps = read_timestamps(datetimes)
+
+    assert np.shares_memory(timestamps.values, datetimes)
+    assert timestamps.unit == "ns" and timestamps.valid is None
+
+
+def test_arrow_retag_shares_the_buffer():
+    pa = pytest.importorskip("pyarrow")
+    aware = pa.array(TICKS, pa.timestamp("ns", "UTC"))
+
+    result, peak, _ = traced(lambda: add_time_zone(aware, "Australia/Sydney"))
+
+    assert result.type == pa.timestamp("ns", "Australia/Sydney")
+    assert result.buffers()[1].address == aware.buffers()[1].address
+    assert peak < 64 * 1024
+    assert retag(result, None).buffers()[1].address == aware.buffers()[1].address
+
+
+def test_numpy_conversion_allocates_only_the_output():
+    datetimes = TICKS.view("datetime64[ns]")
+    zones = np.array(["America/New_York", "Asia/Kolkata"], dtype=object)[np.arange(ROWS) % 2]
+
+    result, peak, blocks = traced(lambda: convert_from_utc(datetimes, zones))
+
+    assert result.dtype == np.dtype("datetime64[ns]")
+    # A few int64 arrays (output, offsets, positions), and no Python object per row
+    assert peak < 64 * ROWS
+    assert blocks < 1000
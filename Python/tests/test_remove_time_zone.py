@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from zone_time.remove_time_zone import remove_time_zone
+
+NEW_YORK = pytz.timezone("America/New_York")
+
+
+def test_datetime_keeps_microseconds():
+    aware = NEW_YORK.localize(datetime(2023, 9, 23, 12, 0, 0, 123456))
+
+    assert remove_time_zone(aware) == datetime(2023, 9, 23, 12, 0, 0, 123456)
+    assert remove_time_zone(aware, keep="utc") == datetime(2023, 9, 23, 16, 0, 0, 123456)
+
+
+def test_series_keeps_nanoseconds():
+    times = pd.Series(pd.to_datetime(["2023-03-12 06:59:59.999999999", "2023-03-12 07:00:00.000000001"], utc=True))
+    local = times.dt.tz_convert("America/New_York")
+
+    assert remove_time_zone(local).astype("int64").tolist() == [
+        pd.Timestamp("2023-03-12 01:59:59.999999999").value,
+        pd.Timestamp("2023-03-12 03:00:00.000000001").value,
+    ]
+    assert remove_time_zone(local, keep="utc").equals(times.dt.tz_localize(None))
+
+
+def test_object_series_keeps_microseconds():
+    # Mixed zones keep an object dtype, which is converted element by element
+    times = pd.Series([NEW_YORK.localize(datetime(2023, 1, 1, 0, 0, 0, 1)),
+                       pytz.timezone("Asia/Tokyo").localize(datetime(2023, 1, 1, 0, 0, 0, 999999))], dtype=object)
+
+    assert remove_time_zone(times).tolist() == [datetime(2023, 1, 1, 0, 0, 0, 1), datetime(2023, 1, 1, 0, 0, 0, 999999)]
+    assert remove_time_zone(times, keep="utc").tolist() == [datetime(2023, 1, 1, 5, 0, 0, 1),
+                                                            datetime(2022, 12, 31, 15, 0, 0, 999999)]
+
+
+@pytest.mark.parametrize("unit, scale", [("ms", 10 ** 3), ("us", 10 ** 6), ("ns", 10 ** 9)])
+def test_arrow_keeps_sub_second_ticks(unit, scale):
+    pa = pytest.importorskip("pyarrow")
+    # 2023-03-12 07:00 UTC is New York's spring-forward transition; one tick either side of it
+    transition = 1678604400 * scale
+    ticks = np.array([transition - 1, transition + 1], dtype=np.int64)
+    aware = pa.array(ticks, pa.timestamp(unit, "America/New_York"))
+
+    wall = remove_time_zone(aware)
+
+    assert wall.type == pa.timestamp(unit)
+    assert wall.to_numpy().view(np.int64).tolist() == [ticks[0] - 5 * 3600 * scale, ticks[1] - 4 * 3600 * scale]
+    assert remove_time_zone(aware, keep="utc").to_numpy().view(np.int64).tolist() == ticks.tolist()
+
+
+def test_arrow_nulls_stay_null():
+    pa = pytest.importorskip("pyarrow")
+    aware = pa.array([1_500_000_000_123_456, None], pa.timestamp("us", "Europe/Berlin"))
+
+    assert remove_time_zone(aware).to_pylist() == [datetime(2017, 7, 14, 4, 40, 0, 123456), None]
+
+
+def test_numpy_is_returned_unchanged():
+    datetimes = np.array(["2023-01-01T00:00:00.123456789"], dtype="datetime64[ns]")
+
+    assert remove_time_zone(datetimes) is datetimes
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytz
+
+from zone_time.zone_clock import ZoneClock
+
+# 2023-03-12 07:00 UTC, when New York moves from EST to EDT
+TRANSITION = 1678604400
+
+
+class FixedClock:
+    # A clock that only moves when the test sets it
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __call__(self):
+        return self.seconds
+
+
+def test_refreshes_only_after_a_transition():
+    clock = FixedClock(TRANSITION - 3600.25)
+    zones = ZoneClock(clock=clock)
+
+    assert zones.now("America/New_York").strftime("%H:%M:%S.%f %Z") == "00:59:59.750000 EST"
+    assert zones.stats()["refreshes"] == 1
+
+    # Still in the same period: served from the cache
+    clock.seconds = TRANSITION - 1
+    assert zones.abbreviation("America/New_York") == "EST"
+    assert zones.stats()["refreshes"] == 1
+    assert zones.stats()["hits"] == 1
+
+    # Past the transition: looked up again, once
+    clock.seconds = TRANSITION
+    assert zones.abbreviation("America/New_York") == "EDT"
+    clock.seconds = TRANSITION + 3600
+    assert zones.now("America/New_York") == datetime.fromtimestamp(clock.seconds, pytz.timezone("America/New_York"))
+    assert zones.stats()["refreshes"] == 2
+    assert zones.stats()["hits"] == 2
+
+
+def test_clock_going_back_refreshes():
+    clock = FixedClock(TRANSITION + 60)
+    zones = ZoneClock(clock=clock)
+    assert zones.abbreviation("America/New_York") == "EDT"
+
+    clock.seconds = TRANSITION - 60
+    assert zones.abbreviation("America/New_York") == "EST"
+    assert zones.stats()["refreshes"] == 2
+
+
+def test_now_many_shares_one_clock_read():
+    reads = []
+
+    def clock():
+        reads.append(None)
+        return TRANSITION
+
+    results = ZoneClock(clock=clock).now_many(["UTC", "Asia/Tokyo"])
+
+    assert len(reads) == 1
+    assert [(value.isoformat(), abbreviation) for value, abbreviation in results] == [
+        ("2023-03-12T07:00:00+00:00", "UTC"),
+        ("2023-03-12T16:00:00+09:00", "JST"),
+    ]
@@ -0,0 +1,90 @@
+"""
+Zone Time: functions for handling and converting time zones.
+
+Importing the package is cheap. Each function's module is imported the first time the
+function is looked up, and NumPy, pandas and pytz only when a function first needs them.
+
+    >>> from zone_time import convert_to_utc
+    >>> convert_to_utc(["2023-09-23 12:00:00"], ["America/New_York"])
+    ['2023-09-23 16:00:00+0000']
+"""
+import importlib
+import sys
+import types
+
+# Public name -> the submodule defining it
+_EXPORTS = {
+    "add_time_zone": "add_time_zone",
+    "add_time_zone_batched": "add_time_zone",
+    "convert_from_utc": "convert_from_utc",
+    "convert_time_zone": "convert_time_zone",
+    "convert_time_zone_batch": "convert_time_zone",
+    "convert_time_zone_async": "async_convert",
+    "convert_from_utc_async": "async_convert",
+    "ConversionCoalescer": "async_convert",
+    "convert_to_utc": "convert_to_utc",
+    "format_with_timezone": "format_with_timezone",
+    "get_local_time": "get_local_time",
+    "get_local_times": "get_local_time",
+    "is_dst": "is_dst",
+    "is_dst_batch": "is_dst",
+    "list_time_zones": "list_time_zones",
+    "ZoneCatalog": "zone_catalog",
+    "remove_time_zone": "remove_time_zone",
+    "time_difference": "time_difference",
+    "time_difference_matrix": "time_difference",
+    "zone_offset_table": "time_difference",
+    "time_zone_offset": "time_zone_offset",
+    "time_zone_offsets": "time_zone_offset",
+    "BatchResult": "batch_convert",
+    "to_utc_batch": "batch_convert",
+    "from_utc_batch": "batch_convert",
+    "format_timestamps": "batch_convert",
+    "format_instants": "timestamp_formatter",
+    "format_offset": "timestamp_formatter",
+    "error_counts": "batch_convert",
+    "convert_parallel": "parallel",
+    "worker_pool": "parallel",
+    "convert_file": "stream_convert",
+    "parse_timestamps": "timestamp_parser",
+    "DstCalendar": "dst_calendar",
+    "localize": "dst_calendar",
+    "ZoneClock": "zone_clock",
+    "compile_zone": "zone_engine",
+    "ZoneDatabase": "zone_db",
+    "compile_database": "zone_db",
+    "get_zone": "zone_registry",
+    "zone_name": "zone_registry",
+    "canonical_name": "zone_registry",
+    "zone_cache_stats": "zone_registry",
+    "is_valid_zone": "zone_registry",
+    "validate_zones": "zone_registry",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    # Importing a submodule binds it on the package under its own name; for modules named
+    # after the function they define (zone_time.is_dst), keep the name for the function
+    def __setattr__(self, name, value):
+        if name in _EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,43 @@
+"""
+Stand-ins for the heavy dependencies, imported on first attribute access.
+
+Modules use these in place of "import numpy as np" and friends, so importing them costs
+nothing until a function actually touches NumPy, pandas or pytz.
+"""
+import importlib
+
+
+class LazyModule:
+    """
+    Proxy for a module that is imported the first time one of its attributes is read.
+
+    Attributes are cached on the proxy after the first read, so later reads are plain
+    attribute lookups.
+
+    Parameters:
+        name (str): The module to import, e.g. "numpy".
+    """
+
+    def __init__(self, name):
+        self.__dict__["_LazyModule__name"] = name
+        self.__dict__["_LazyModule__module"] = None
+
+    def __getattr__(self, attr):
+        module = self.__module
+        if module is None:
+            module = importlib.import_module(self.__name)
+            self.__dict__["_LazyModule__module"] = module
+        value = getattr(module, attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __repr__(self):
+        state = "loaded" if self.__module is not None else "not loaded"
+        return f"<LazyModule {self.__name!r} ({state})>"
+
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+pytz = LazyModule("pytz")
+# Only the async API needs it, and importing it takes longer than the rest of the package
+asyncio = LazyModule("asyncio")
@@ -0,0 +1,129 @@
+from ._lazy import np, pd, pytz
+
+from .array_interop import array_kind, arrow_zone, read_timestamps, retag, wall_ticks, write_timestamps, zone_groups
+from .zone_registry import get_zone
+
+def add_time_zone(datetime_series, tz_series):
+    """
+    Add Time Zone to Datetime Objects.
+    
+    This function takes a pandas Series of datetime objects and a corresponding Series of time zone strings,
+    and returns a new datetime Series where each datetime object has been assigned the corresponding time zone.
+    
+    Arrow timestamp arrays and NumPy datetime64 arrays are converted on their int64 buffer, without a Python
+    object per row. An Arrow array with a time zone gets the new zone in its type, sharing the data; this needs
+    a single time zone for all rows, as an Arrow type carries one. A NumPy array (taken as UTC instants) becomes
+    the naive wall-clock times in each row's time zone.
+    
+    :param datetime_series: pd.Series of pd.Timestamp, representing the datetime objects to which the time zones will be added.
+                            Also a tz-aware pyarrow timestamp array or an np.ndarray of datetime64.
+    :param tz_series: pd.Series of str, representing the time zones to be assigned to the datetime objects.
+                     The length of tz_series should be the same as the length of datetime_series.
+                     With array input, also a single time zone string or an Arrow string array.
+    :return: A pd.Series of pd.Timestamp with the same length as the input, where each datetime object has the assigned time zone.
+             For array input, an array of the same kind and unit.
+    :raise ValueError: If the length of datetime_series and tz_series are not the same, or an Arrow array is given
+                       more than one time zone.
+    """
+    
+    if array_kind(datetime_series):
+        return _add_to_array(datetime_series, tz_series)
+    
+    if len(datetime_series) != len(tz_series):
+        raise ValueError("Length of datetime_series and tz_series must be the same.")
+    
+    # Initializing the new_datetime series
+    new_datetime = pd.Series(index=datetime_series.index, dtype=object)
+    
+    for i in range(len(datetime_series)):
+        tz = get_zone(tz_series.iloc[i])
+        new_datetime.iloc[i] = datetime_series.iloc[i].tz_convert(tz)
+    
+    return new_datetime
+
+def _add_to_array(values, zones):
+    # add_time_zone for Arrow and NumPy timestamps, on the int64 buffer
+    buffer = read_timestamps(values)
+    groups = list(zone_groups(zones, len(buffer.values)))
+    names = [arrow_zone(tz) for tz, _ in groups]
+    if array_kind(values) == "arrow":
+        if buffer.tz is None:
+            raise TypeError("Cannot convert tz-naive timestamps, use tz_localize to localize.")
+        if len(names) != 1:
+            raise ValueError("An Arrow timestamp array carries a single time zone; got several.")
+        return retag(values, names[0])
+    return write_timestamps(values, wall_ticks(buffer, groups), buffer.unit, None, buffer.valid)
+
+def add_time_zone_batched(datetime_series, tz_series, output="series"):
+    """
+    Add Time Zone to Datetime Objects, converting one group of rows per distinct time zone.
+    
+    This is the batched counterpart of add_time_zone. Rows are grouped by their time zone string and
+    each group is converted with a single vectorized tz_convert, so the cost grows with the number of
+    rows plus the number of distinct zones rather than with one pytz lookup per row.
+    
+    :param datetime_series: pd.Series of tz-aware pd.Timestamp, representing the datetime objects to which the time zones will be added.
+    :param tz_series: pd.Series of str, representing the time zones to be assigned to the datetime objects.
+                     The length of tz_series should be the same as the length of datetime_series.
+    :param output: "series" (default) returns an object Series of pd.Timestamp, each carrying its own time zone,
+                   exactly like add_time_zone. "frame" returns a DataFrame with a "utc" column (datetime64[ns, UTC])
+                   and a categorical "tz" column, which avoids boxing every row into a Python object.
+    :return: A pd.Series or pd.DataFrame indexed like datetime_series.
+    :raise ValueError: If the length of datetime_series and tz_series are not the same, or if output is unknown.
+    :raise pytz.UnknownTimeZoneError: If tz_series contains an unknown or missing time zone.
+    """
+    
+    if len(datetime_series) != len(tz_series):
+        raise ValueError("Length of datetime_series and tz_series must be the same.")
+    if output not in ("series", "frame"):
+        raise ValueError("output must be either 'series' or 'frame'.")
+    
+    if datetime_series.dtype == object:
+        datetime_series = pd.to_datetime(datetime_series)
+    if datetime_series.dt.tz is None:
+        raise TypeError("Cannot convert tz-naive timestamps, use tz_localize to localize.")
+    utc = datetime_series.dt.tz_convert("UTC").array
+    
+    # Factorize the zones positionally; resolving each distinct zone once also validates it
+    names = np.asarray(tz_series, dtype=object)
+    codes, zones = pd.factorize(names)
+    missing = np.flatnonzero(codes < 0)
+    if len(missing):
+        # factorize gives missing zones (None, NaN) no group; add_time_zone fails on them too
+        raise pytz.UnknownTimeZoneError(names[missing[0]])
+    tzinfos = [get_zone(zone) for zone in zones]
+    
+    if output == "frame":
+        return pd.DataFrame({
+            'utc': utc,
+            'tz': pd.Categorical.from_codes(codes, categories=pd.Index(zones, dtype=object)),
+        }, index=datetime_series.index)
+    
+    # Sort the row positions by zone code once, then slice out each zone's group
+    new_datetime = np.empty(len(utc), dtype=object)
+    new_datetime.fill(pd.NaT)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(zones) + 1))
+    for code, tz in enumerate(tzinfos):
+        positions = order[bounds[code]:bounds[code + 1]]
+        new_datetime[positions] = utc[positions].tz_convert(tz).astype(object)
+    
+    return pd.Series(new_datetime, index=datetime_series.index, dtype=object)
+
+if __name__ == "__main__":
+    # Define a DataFrame
+    df = pd.DataFrame({
+        'datetime': pd.to_datetime(["2023-09-23 12:00:00", "2023-09-24 12:00:00", "2023-09-25 12:00:00"], utc=True)
+    })
+
+    # Define a Series of time zones
+    tz_series = pd.Series(["America/New_York", "Europe/London", "Asia/Tokyo"])
+
+    # Apply the add_timezone function to the datetime column with different time zones for each element
+    df['new_datetime'] = add_time_zone(df['datetime'], tz_series)
+
+    # The batched version gives the same result, one tz_convert per distinct zone
+    df['new_datetime_batched'] = add_time_zone_batched(df['datetime'], tz_series)
+
+    # Print the resulting DataFrame
+    print(df)
@@ -0,0 +1,267 @@
+"""
+Zero-copy interop with Apache Arrow timestamp arrays and NumPy datetime64 arrays.
+
+The conversion functions accept these in place of lists and Series. Timestamps are read as the
+int64 buffer underneath (no Python object per row), converted with the compiled zone tables and
+written back as a new buffer of the same kind. Arrow arrays keep their unit and carry their time
+zone in the type; changing only the time zone of an Arrow array relabels the type without
+touching the data.
+"""
+from collections import namedtuple
+import re
+
+from ._lazy import np
+
+from .zone_engine import compile_zone, group_by_zone, narrow_codes
+from .zone_registry import zone_name
+
+# Ticks per second of the datetime units Arrow and NumPy share
+UNITS = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+_NAT = -2 ** 63  # np.iinfo(np.int64).min, the NaT value
+_FIXED_OFFSET = re.compile(r"([+-])(\d{2}):?(\d{2})")
+
+
+def import_pyarrow():
+    """
+    Import pyarrow, with a helpful message if it is not installed.
+
+    Returns:
+    module: The pyarrow module.
+
+    Raises:
+    ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow arrays require pyarrow. Install it with 'pip install pyarrow'.")
+    return pyarrow
+
+
+def array_kind(values):
+    """
+    Tell whether values are an Arrow array or a NumPy datetime64 array, without importing either.
+
+    Parameters:
+    values: Any value.
+
+    Returns:
+    str or None: "arrow" for a pyarrow Array or ChunkedArray, "numpy" for a datetime64 ndarray,
+                 None otherwise.
+    """
+    module = type(values).__module__
+    if module.startswith("pyarrow") and hasattr(values, "type"):
+        return "arrow"
+    if module == "numpy" and getattr(getattr(values, "dtype", None), "kind", None) == "M":
+        return "numpy"
+    return None
+
+
+class Timestamps(namedtuple("Timestamps", ["values", "unit", "tz", "valid"])):
+    """
+    The int64 buffer of a timestamp array, as read by read_timestamps.
+
+    Attributes:
+        values (np.ndarray): int64 ticks since the Unix epoch. A view of the input where possible;
+                             entries at invalid positions are undefined.
+        unit (str): The tick unit, one of "s", "ms", "us" and "ns".
+        tz (str or None): The Arrow time zone of the type, or None for naive timestamps.
+        valid (np.ndarray or None): Boolean array, False at null / NaT positions, or None when there are none.
+    """
+
+    __slots__ = ()
+
+    @property
+    def seconds(self):
+        """
+        np.ndarray: int64 whole seconds since the Unix epoch, rounded down.
+        """
+        return self.values // UNITS[self.unit]
+
+
+def _single_chunk(values):
+    # One Arrow Array for an Array or ChunkedArray; only a ChunkedArray of several chunks is copied
+    if hasattr(values, "chunks"):
+        if values.num_chunks == 1:
+            return values.chunk(0)
+        if values.num_chunks == 0:
+            return import_pyarrow().array([], type=values.type)
+        return values.combine_chunks()
+    return values
+
+
+def read_timestamps(values):
+    """
+    Read the int64 buffer of an Arrow timestamp array or a NumPy datetime64 array.
+
+    Parameters:
+    values (pyarrow.Array, pyarrow.ChunkedArray or np.ndarray): The timestamps. NumPy units coarser
+                                                                than seconds are read as seconds.
+
+    Returns:
+    Timestamps: The buffer, its unit, time zone and validity.
+
+    Raises:
+    TypeError: If the values are not timestamps.
+    """
+    if array_kind(values) == "arrow":
+        pa = import_pyarrow()
+        if not pa.types.is_timestamp(values.type):
+            raise TypeError(f"Expected an Arrow timestamp array, got {values.type}.")
+        array = _single_chunk(values)
+        data = np.frombuffer(array.buffers()[1], dtype=np.int64, count=array.offset + len(array))[array.offset:]
+        valid = array.is_valid().to_numpy(zero_copy_only=False) if array.null_count else None
+        return Timestamps(data, array.type.unit, array.type.tz, valid)
+    if array_kind(values) != "numpy":
+        raise TypeError(f"Expected an Arrow timestamp array or a NumPy datetime64 array, got {type(values).__name__}.")
+    unit = np.datetime_data(values.dtype)[0]
+    if unit not in UNITS:
+        values, unit = values.astype("datetime64[s]"), "s"
+    data = np.ascontiguousarray(values).view(np.int64).reshape(-1)
+    valid = data != _NAT
+    return Timestamps(data, unit, None, None if valid.all() else valid)
+
+
+def write_timestamps(like, values, unit, tz=None, valid=None):
+    """
+    Wrap an int64 buffer as the same kind of array as the input it was computed from.
+
+    Parameters:
+    like: The input array, an Arrow array or a NumPy datetime64 array.
+    values (np.ndarray): int64 ticks since the Unix epoch. Positions that are not valid are overwritten
+                         with NaT for NumPy output, so pass an array the caller owns.
+    unit (str): The tick unit, one of "s", "ms", "us" and "ns".
+    tz (str, optional): The time zone of the Arrow type. Ignored for NumPy output. Default is None (naive).
+    valid (np.ndarray, optional): Boolean array, False at positions to leave null. Default is None (all valid).
+
+    Returns:
+    pyarrow.Array or np.ndarray: An Arrow timestamp array sharing the buffer, or a datetime64 view of it.
+    """
+    if array_kind(like) == "arrow":
+        pa = import_pyarrow()
+        validity = None
+        if valid is not None and not valid.all():
+            validity = pa.py_buffer(np.packbits(valid, bitorder="little"))
+        return pa.Array.from_buffers(pa.timestamp(unit, tz), len(values), [validity, pa.py_buffer(values)])
+    if valid is not None:
+        values[~valid] = _NAT
+    return values.view(f"datetime64[{unit}]")
+
+
+def retag(values, tz):
+    """
+    Set the time zone of an Arrow timestamp array without copying its data.
+
+    The instants are unchanged: Arrow stores timestamps with a time zone as UTC ticks.
+
+    Parameters:
+    values (pyarrow.Array or pyarrow.ChunkedArray): The timestamps.
+    tz (str or None): The new time zone, or None for naive timestamps.
+
+    Returns:
+    pyarrow.Array or pyarrow.ChunkedArray: The same buffers under the new type.
+    """
+    pa = import_pyarrow()
+    target = pa.timestamp(values.type.unit, tz)
+    if hasattr(values, "chunks"):
+        return pa.chunked_array([chunk.view(target) for chunk in values.chunks], type=target)
+    return values.view(target)
+
+
+def zone_offsets(tz, utc_seconds):
+    """
+    Look up the UTC offset of one time zone at UTC instants.
+
+    Parameters:
+    tz (str): A time zone name, or a fixed offset such as "+05:30" as Arrow types may carry.
+    utc_seconds (np.ndarray): int64 UTC instants in seconds since the Unix epoch.
+
+    Returns:
+    np.ndarray: int64 UTC offsets in seconds.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    fixed = _FIXED_OFFSET.fullmatch(tz) if isinstance(tz, str) else None
+    if fixed:
+        sign, hours, minutes = fixed.groups()
+        offset = (int(hours) * 3600 + int(minutes) * 60) * (-1 if sign == "-" else 1)
+        return np.full(len(utc_seconds), offset, dtype=np.int64)
+    zone = compile_zone(tz)
+    return zone.utcoffset[zone.utc_periods(utc_seconds)]
+
+
+def wall_ticks(timestamps, groups):
+    """
+    Shift UTC ticks to the wall clock of their time zones.
+
+    Parameters:
+    timestamps (Timestamps): The instants, from read_timestamps.
+    groups (iterable of Tuple[str, np.ndarray or slice]): Time zone names and the row positions that use
+                                                          them, e.g. from zone_groups.
+
+    Returns:
+    np.ndarray: A new int64 array of naive wall-clock ticks in the same unit.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If a time zone is not known.
+    """
+    scale = UNITS[timestamps.unit]
+    seconds = timestamps.seconds
+    local = timestamps.values.copy()
+    for tz, positions in groups:
+        local[positions] += zone_offsets(tz, seconds[positions]) * scale
+    return local
+
+
+def arrow_zone(tz):
+    """
+    The name to store in an Arrow type for a time zone: pytz spelling for zones, fixed offsets as given.
+
+    Parameters:
+    tz (str): A time zone name or a fixed offset such as "+05:30".
+
+    Returns:
+    str: The name for the Arrow type.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    if isinstance(tz, str) and _FIXED_OFFSET.fullmatch(tz):
+        return tz
+    return zone_name(tz)
+
+
+def zone_groups(zones, size):
+    """
+    Split row positions into groups that share a time zone, without a Python string per row for Arrow input.
+
+    Parameters:
+    zones (str, pyarrow.Array or array-like of str): A single time zone for all rows, or one per row.
+    size (int): The number of rows.
+
+    Returns:
+    Iterator[Tuple[str or None, np.ndarray or slice]]: Pairs of time zone name (None for null zones)
+    and the row positions that use it.
+
+    Raises:
+    ValueError: If the number of zones is neither 1 nor size.
+    """
+    if array_kind(zones) != "arrow":
+        yield from group_by_zone(zones, size)
+        return
+    if len(zones) != size:
+        raise ValueError("Length of zones must be either 1 or equal to the number of values.")
+    encoded = _single_chunk(zones).dictionary_encode()
+    names = encoded.dictionary.to_pylist() + [None]
+    codes = narrow_codes(encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False), len(names) - 1)
+    if len(names) == 2 and not encoded.null_count:
+        yield names[0], slice(None)
+        return
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(-1, len(names)))
+    for code, name in enumerate(names[-1:] + names[:-1]):
+        positions = order[bounds[code]:bounds[code + 1]]
+        if len(positions):
+            yield name, positions
+
@@ -0,0 +1,240 @@
+"""
+asyncio front end for the batched conversions.
+
+Small batches are converted inline, which is cheaper than a thread hop; batches of at least
+`threshold` rows (about 5 ms of work) run in an executor so they do not block the event loop.
+ConversionCoalescer merges many small concurrent requests into one vectorized call per time
+window. Single conversions are cheap enough inline that merging them does not raise throughput;
+it pays off for functions with a high fixed cost per call, and to move bursts of requests off
+the loop as one executor batch.
+
+    >>> coalescer = ConversionCoalescer(window=0.002)
+    >>> await coalescer.convert("2023-09-23 12:00:00", "America/New_York", "Europe/London")
+    '2023-09-23 17:00:00 BST'
+"""
+from functools import partial
+
+from ._lazy import asyncio
+from .convert_from_utc import convert_from_utc
+from .convert_time_zone import convert_time_zone_batch
+
+DEFAULT_THRESHOLD = 1_000
+
+
+async def run_batch(func, times, *args, threshold=DEFAULT_THRESHOLD, executor=None):
+    """
+    Run a batch conversion inline if it is small, otherwise in an executor.
+
+    Parameters:
+    func (callable): The conversion, called as func(times, *args).
+    times (sized): The input times; their number decides where the call runs.
+    *args: The other arguments of func, e.g. time zones.
+    threshold (int): The number of rows from which the call runs in the executor. Default is 1,000.
+    executor (concurrent.futures.Executor, optional): The executor to use. Default is None, the event
+                                                      loop's default thread pool.
+
+    Returns:
+    The result of func.
+    """
+    if len(times) < threshold:
+        return func(times, *args)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, times, *args))
+
+
+async def convert_time_zone_async(times, from_tz="UTC", to_tz="UTC", threshold=DEFAULT_THRESHOLD, executor=None):
+    """
+    Awaitable convert_time_zone_batch that keeps large batches off the event loop.
+
+    Parameters:
+    times (list of str or datetime): The input times.
+    from_tz (str or list of str): The time zone of all input times, or one per time. Default is "UTC".
+    to_tz (str or list of str): The target time zone of all times, or one per time. Default is "UTC".
+    threshold (int): The number of rows from which the conversion runs in the executor. Default is 1,000.
+    executor (concurrent.futures.Executor, optional): The executor to use. Default is None, the event
+                                                      loop's default thread pool.
+
+    Returns:
+    List[str]: The converted times, as convert_time_zone formats them.
+
+    Raises:
+    ValueError: If a time zone or a time string is invalid.
+    """
+    return await run_batch(convert_time_zone_batch, times, from_tz, to_tz, threshold=threshold, executor=executor)
+
+
+async def convert_from_utc_async(time_list, tz_list, threshold=DEFAULT_THRESHOLD, executor=None):
+    """
+    Awaitable convert_from_utc that keeps large batches off the event loop.
+
+    Parameters:
+    time_list (List[str]): The UTC times.
+    tz_list (List[str]): The target time zone(s), one for all times or one per time.
+    threshold (int): The number of rows from which the conversion runs in the executor. Default is 1,000.
+    executor (concurrent.futures.Executor, optional): The executor to use. Default is None, the event
+                                                      loop's default thread pool.
+
+    Returns:
+    List[str]: The converted times, as convert_from_utc formats them.
+
+    Raises:
+    ValueError: If a time zone is invalid.
+    """
+    return await run_batch(convert_from_utc, time_list, tz_list, threshold=threshold, executor=executor)
+
+
+class ConversionCoalescer:
+    """
+    Merge small concurrent conversion requests into one vectorized call.
+
+    The first request after a quiet period starts a window of `window` seconds; every request
+    submitted in the meantime joins the same batch, which is then converted with one call of func
+    (in the executor if it has at least `threshold` rows) and split back per request. A batch is
+    also flushed as soon as it reaches `max_batch` rows. If the merged call fails, each request of
+    the batch is retried alone, so one bad request does not fail the others.
+
+    Parameters:
+        func (callable): The batch conversion, called as func(times, *zones) with one zone per row
+                         in each zones list. Default is convert_time_zone_batch(times, from_tz, to_tz);
+                         convert_from_utc(time_list, tz_list) also fits.
+        window (float): Seconds to wait for more requests before converting. Default is 0.002.
+        max_batch (int): The number of rows that triggers an immediate flush. Default is 10,000.
+        threshold (int): The batch size from which the call runs in the executor. Default is 1,000.
+        executor (concurrent.futures.Executor, optional): The executor for large batches. Default is None,
+                                                          the event loop's default thread pool.
+    """
+
+    def __init__(self, func=convert_time_zone_batch, window=0.002, max_batch=10_000, threshold=DEFAULT_THRESHOLD,
+                 executor=None):
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must not be negative and max_batch must be at least 1.")
+        self.func = func
+        self.window = window
+        self.max_batch = max_batch
+        self.threshold = threshold
+        self.executor = executor
+        self._pending = []
+        self._pending_rows = 0
+        self._timer = None
+        self._tasks = set()
+        self.batches = 0
+        self.requests = 0
+        self.rows = 0
+
+    async def submit(self, times, *zones):
+        """
+        Convert a list of times as part of the next batch.
+
+        Parameters:
+        times (list): The input times.
+        *zones (str or list of str): The zone arguments of func, each one zone for all times or one per time.
+
+        Returns:
+        list: The converted times, in order.
+
+        Raises:
+        Whatever func raises for this request alone.
+        """
+        times = list(times)
+        zones = [[zone] * len(times) if isinstance(zone, str) else list(zone) for zone in zones]
+        if any(len(zone) != len(times) for zone in zones):
+            raise ValueError("Each zone argument must be a single time zone or have one time zone per time.")
+        if not times:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((times, zones, future))
+        self._pending_rows += len(times)
+        if self._pending_rows >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._start_flush)
+        return await future
+
+    async def convert(self, time, *zones):
+        """
+        Convert a single time as part of the next batch.
+
+        Parameters:
+        time (str or datetime): The input time.
+        *zones (str): The zone arguments of func, e.g. from_tz and to_tz.
+
+        Returns:
+        str: The converted time.
+        """
+        return (await self.submit([time], *zones))[0]
+
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_rows = self._pending, [], 0
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch):
+        times = [time for request_times, _, _ in batch for time in request_times]
+        zones = [[zone for _, request_zones, _ in batch for zone in request_zones[i]] for i in range(len(batch[0][1]))]
+        self.batches += 1
+        self.requests += len(batch)
+        self.rows += len(times)
+        try:
+            results = await run_batch(self.func, times, *zones, threshold=self.threshold, executor=self.executor)
+        except Exception as error:
+            if len(batch) == 1:
+                self._settle(batch[0][2], error=error)
+                return
+            # Find the failing requests by converting each alone
+            for request_times, request_zones, future in batch:
+                try:
+                    result = await run_batch(self.func, request_times, *request_zones,
+                                             threshold=self.threshold, executor=self.executor)
+                except Exception as request_error:
+                    self._settle(future, error=request_error)
+                else:
+                    self._settle(future, list(result))
+            return
+        start = 0
+        for request_times, _, future in batch:
+            self._settle(future, list(results[start:start + len(request_times)]))
+            start += len(request_times)
+
+    @staticmethod
+    def _settle(future, result=None, error=None):
+        # The awaiting request may have been cancelled meanwhile
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def flush(self):
+        """
+        Convert the pending requests now and wait for every batch in progress.
+        """
+        self._start_flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def aclose(self):
+        """
+        Flush the pending requests; use before shutting the event loop down.
+        """
+        await self.flush()
+
+    def stats(self):
+        """
+        Report how well requests were coalesced.
+
+        Returns:
+        dict: batches, requests, rows, requests_per_batch and rows_per_batch.
+        """
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "rows": self.rows,
+            "requests_per_batch": self.requests / self.batches if self.batches else 0.0,
+            "rows_per_batch": self.rows / self.batches if self.batches else 0.0,
+        }
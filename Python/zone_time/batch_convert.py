@@ -0,0 +1,229 @@
+from collections import namedtuple
+
+from ._lazy import np, pytz
+
+from .dst_calendar import AMBIGUOUS, NONEXISTENT, localize
+from .instrumentation import record, stage
+from .timestamp_parser import parse_timestamps
+from .zone_engine import compile_zone, utc_lookup
+
+_MICROS = 1_000_000
+_NAT = -2 ** 63  # np.iinfo(np.int64).min, the NaT value
+
+# Bits of the BatchResult.errors codes
+INVALID_TIME = 1
+INVALID_ZONE = 2
+AMBIGUOUS_TIME = 4
+NONEXISTENT_TIME = 8
+ERROR_NAMES = {
+    INVALID_TIME: "invalid_time",
+    INVALID_ZONE: "invalid_zone",
+    AMBIGUOUS_TIME: "ambiguous_time",
+    NONEXISTENT_TIME: "nonexistent_time",
+}
+
+
+class BatchResult(namedtuple("BatchResult", ["values", "tzname", "invalid", "errors"])):
+    """
+    Result of a batched conversion.
+
+    Attributes:
+        values (np.ndarray): datetime64[us] array of converted times, NaT for invalid rows.
+        tzname (np.ndarray or None): object array of time zone abbreviations for the converted times,
+                                     or None when the result is in UTC.
+        invalid (np.ndarray): Boolean array, True where the row has no converted time.
+        errors (np.ndarray): uint8 array of error bits per row, 0 for clean rows: INVALID_TIME, INVALID_ZONE,
+                             AMBIGUOUS_TIME and NONEXISTENT_TIME. The last two are set for every ambiguous
+                             or non-existent wall time, including those a policy resolved.
+    """
+
+    __slots__ = ()
+
+
+def error_counts(errors):
+    """
+    Count the rows carrying each error bit.
+
+    Parameters:
+    errors (np.ndarray): uint8 error codes, e.g. BatchResult.errors.
+
+    Returns:
+    dict: The number of rows per error name in ERROR_NAMES, only for names that occur.
+    """
+    errors = np.asarray(errors, dtype=np.uint8)
+    counts = {name: int(np.count_nonzero(errors & bit)) for bit, name in ERROR_NAMES.items()}
+    return {name: count for name, count in counts.items() if count}
+
+
+def _parse(times):
+    # Wall-clock microseconds, explicit offsets and the invalid mask, from strings or datetime64 values
+    array = np.asarray(times)
+    if array.dtype.kind == "M":
+        micros = array.astype("datetime64[us]").view(np.int64)
+        size = len(micros)
+        return micros, np.zeros(size, dtype=np.int64), np.zeros(size, dtype=bool), np.isnat(array)
+    parsed = parse_timestamps(array if array.dtype.kind == "U" else times)
+    return parsed.values.view(np.int64), parsed.utcoffset.astype(np.int64), parsed.has_offset, parsed.invalid
+
+
+def _resolve_zones(zones, size):
+    # The zones as a str or object array, and a mask of the rows whose zone is known
+    if isinstance(zones, str):
+        try:
+            compile_zone(zones)
+            return zones, np.ones(size, dtype=bool)
+        except pytz.UnknownTimeZoneError:
+            return zones, np.zeros(size, dtype=bool)
+    zones = np.asarray(zones, dtype=object)
+    if len(zones) != size:
+        raise ValueError("Length of zones must be either 1 or equal to the number of values.")
+    known = {}
+
+    def check(zone):
+        try:
+            return known[zone]
+        except KeyError:
+            try:
+                compile_zone(zone)
+                known[zone] = True
+            except pytz.UnknownTimeZoneError:
+                known[zone] = False
+            return known[zone]
+        except TypeError:
+            return False
+
+    return zones, np.fromiter(map(check, zones), dtype=bool, count=size)
+
+
+def _select(zones, mask):
+    return zones if isinstance(zones, str) else zones[mask]
+
+
+def to_utc_batch(times, timezones, workers=None, ambiguous="standard", nonexistent="standard"):
+    """
+    Convert local wall-clock times to UTC in one batched pass.
+
+    Times that carry their own UTC offset (e.g. "2023-09-23 12:00:00+02:00") are converted with that
+    offset and do not need a valid time zone. Ambiguous and non-existent wall times are resolved by the
+    given policies; the defaults do what convert_to_utc does (pytz's is_dst=False).
+
+    Parameters:
+    times (array-like of str or np.ndarray of datetime64): The local times, as strings in the
+                                                          "YYYY-MM-DD HH:MM:SS" layout or naive datetime64 values.
+    timezones (str or array-like of str): A single time zone for all times, or one time zone per time.
+    workers (int, optional): Run on this many processes through parallel.convert_parallel. Default is None,
+                             which converts in the calling process.
+    ambiguous (str): Policy for wall times that occur twice: "standard" (default), "dst", "earliest",
+                     "latest", "raise" or "NaT". See dst_calendar.choose_periods.
+    nonexistent (str): Policy for wall times skipped by the clocks: "standard" (default), "dst",
+                       "shift_forward" (to the first instant after the gap), "raise" or "NaT".
+
+    Returns:
+    BatchResult: UTC datetime64[us] values (tzname is None), the invalid-row mask and the error codes.
+
+    Raises:
+    ValueError: If a policy is unknown.
+    pytz.AmbiguousTimeError: If a time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If a time does not exist and nonexistent is "raise".
+    """
+    if workers is not None and workers > 1:
+        from .parallel import convert_parallel
+        return convert_parallel(times, timezones, "to_utc", workers=workers,
+                                ambiguous=ambiguous, nonexistent=nonexistent)
+    size = len(times)
+    with stage("to_utc_batch", "parse", size):
+        wall, utcoffset, has_offset, bad_time = _parse(times)
+    with stage("to_utc_batch", "resolve_zones", size):
+        timezones, known = _resolve_zones(timezones, size)
+    errors = np.where(bad_time, INVALID_TIME, 0).astype(np.uint8)
+    errors[~(known | has_offset)] |= INVALID_ZONE
+    invalid = errors != 0
+    utc = np.where(invalid, _NAT, wall - utcoffset * _MICROS)
+
+    lookup = ~invalid & ~has_offset
+    if lookup.any():
+        seconds = wall[lookup] // _MICROS
+        with stage("to_utc_batch", "localize", size):
+            result = localize(seconds, _select(timezones, lookup), ambiguous, nonexistent)
+        converted = wall[lookup] + (result.utc - seconds) * _MICROS
+        # Shifted times land exactly on the transition, whatever their fraction of a second
+        shifted = result.kind == NONEXISTENT if nonexistent == "shift_forward" else False
+        converted = np.where(shifted, result.utc * _MICROS, converted)
+        utc[lookup] = np.where(result.unresolved, _NAT, converted)
+        errors[lookup] = np.where(result.kind == AMBIGUOUS, AMBIGUOUS_TIME,
+                                  np.where(result.kind == NONEXISTENT, NONEXISTENT_TIME, 0))
+        invalid[lookup] = result.unresolved
+    record("to_utc_batch", size, errors)
+    return BatchResult(values=utc.view("datetime64[us]"), tzname=None, invalid=invalid, errors=errors)
+
+
+def from_utc_batch(times, timezones, workers=None):
+    """
+    Convert UTC times to wall-clock times in the given time zones in one batched pass.
+
+    Parameters:
+    times (array-like of str or np.ndarray of datetime64): The UTC times, as strings in the
+                                                          "YYYY-MM-DD HH:MM:SS" layout or datetime64 values.
+    timezones (str or array-like of str): A single time zone for all times, or one time zone per time.
+    workers (int, optional): Run on this many processes through parallel.convert_parallel. Default is None,
+                             which converts in the calling process.
+
+    Returns:
+    BatchResult: Local datetime64[us] values, their abbreviations, the invalid-row mask and the error codes.
+    """
+    if workers is not None and workers > 1:
+        from .parallel import convert_parallel
+        return convert_parallel(times, timezones, "from_utc", workers=workers)
+    size = len(times)
+    with stage("from_utc_batch", "parse", size):
+        utc, utcoffset, _, bad_time = _parse(times)
+    utc = utc - utcoffset * _MICROS
+    with stage("from_utc_batch", "resolve_zones", size):
+        timezones, known = _resolve_zones(timezones, size)
+    errors = np.where(bad_time, INVALID_TIME, 0).astype(np.uint8)
+    errors[~known] |= INVALID_ZONE
+    invalid = errors != 0
+    wall = np.full(len(utc), _NAT, dtype=np.int64)
+    tzname = np.full(len(utc), None, dtype=object)
+
+    lookup = ~invalid
+    if lookup.any():
+        with stage("from_utc_batch", "lookup", size):
+            offsets, _, names = utc_lookup(utc[lookup] // _MICROS, _select(timezones, lookup))
+        wall[lookup] = utc[lookup] + offsets * _MICROS
+        tzname[lookup] = names
+    record("from_utc_batch", size, errors)
+    return BatchResult(values=wall.view("datetime64[us]"), tzname=tzname, invalid=invalid, errors=errors)
+
+
+def format_timestamps(values, suffix=""):
+    """
+    Format datetime64 values as "YYYY-MM-DD HH:MM:SS" strings without a per-row Python call.
+
+    Fractional seconds are appended (".ffffff") only for rows that have them. NaT values become None.
+
+    Parameters:
+    values (np.ndarray): datetime64 values.
+    suffix (str or array-like of str): Text appended to every row, or one text per row. Default is "".
+
+    Returns:
+    np.ndarray: object array of formatted strings.
+    """
+    values = np.asarray(values).astype("datetime64[us]")
+    micros = values.view(np.int64)
+    missing = np.isnat(values)
+    text = np.datetime_as_string(values.astype("datetime64[s]"), unit="s")
+    if text.dtype.itemsize == 19 * 4 and len(text):
+        # Swap the ISO "T" for a space in place
+        text.view(np.int32).reshape(len(text), 19)[:, 10] = ord(" ")
+    else:
+        text = np.char.replace(text, "T", " ")
+    fraction = np.where(missing, 0, micros % _MICROS)
+    if fraction.any():
+        digits = np.char.zfill(fraction.astype(str), 6)
+        text = np.char.add(text, np.where(fraction > 0, np.char.add(".", digits), ""))
+    if not isinstance(suffix, str) or suffix:
+        text = np.char.add(text, np.asarray(suffix, dtype=str))
+    result = text.astype(object)
+    result[missing] = None
+    return result
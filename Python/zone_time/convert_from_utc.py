@@ -0,0 +1,91 @@
+from ._lazy import pytz
+
+from .array_interop import array_kind, arrow_zone, read_timestamps, retag, wall_ticks, write_timestamps, zone_groups
+from .instrumentation import record, stage
+from .timestamp_parser import parse_wall_seconds
+from .zone_engine import compile_zone, from_seconds, utc_lookup
+
+def convert_from_utc(time_list, tz_list):
+    """
+    Converts a list of time in UTC to a given list of time zones.
+
+    This function takes a list of time input in UTC (as strings) and converts it to the specified target time zones.
+
+    Parameters:
+    time_list (List[str], pyarrow timestamp array or np.ndarray of datetime64): List of strings representing the
+        input time(s) in UTC, or the instants as an Arrow or NumPy array (naive values are taken as UTC).
+    tz_list (List[str]): List of strings representing the target time zone(s). With array input, also a single
+        time zone string or an Arrow string array.
+
+    Returns:
+    List[str]: List of strings representing the formatted time(s) in the target time zone(s).
+    For array input, an array of the same kind and unit instead. An Arrow array converted to a single time zone
+    keeps its data and carries the zone in its type; with one zone per row, and for NumPy arrays, the result
+    holds the naive wall-clock times in each row's zone.
+
+    Example:
+    convert_from_utc(["2023-09-23 12:00:00", "2023-09-24 14:00:00"], ["America/New_York", "Asia/Tokyo"])
+    Output:
+    ['2023-09-23 08:00:00 EDT', '2023-09-25 23:00:00 JST']
+    """
+
+    if array_kind(time_list):
+        return _convert_array(time_list, tz_list)
+
+    if len(tz_list) != 1 and len(time_list) != len(tz_list):
+        raise ValueError("Length of tz_list must be either 1 or equal to the length of time_list.")
+
+    size = len(time_list)
+    with stage("convert_from_utc", "resolve_zones", size):
+        for current_tz in dict.fromkeys(tz_list):
+            try:
+                compile_zone(current_tz)
+            except pytz.UnknownTimeZoneError:
+                raise ValueError(f"Invalid time zone provided: {current_tz}")
+
+    with stage("convert_from_utc", "parse", size):
+        utc_seconds, errors = parse_wall_seconds(time_list)
+    if errors:
+        raise errors[min(errors)]
+    with stage("convert_from_utc", "lookup", size):
+        utcoffset, _, tzname = utc_lookup(utc_seconds, tz_list[0] if len(tz_list) == 1 else tz_list)
+
+    converted_time = []
+    with stage("convert_from_utc", "format", size):
+        for seconds, offset, abbreviation in zip(utc_seconds.tolist(), utcoffset.tolist(), tzname):
+            dt_in_tz = from_seconds(seconds + offset)
+            converted_time.append(dt_in_tz.strftime("%Y-%m-%d %H:%M:%S ") + abbreviation)
+
+    record("convert_from_utc", size)
+    return converted_time
+
+
+def _convert_array(time_list, tz_list):
+    # convert_from_utc for Arrow and NumPy timestamps, on the int64 buffer
+    if not isinstance(tz_list, str) and array_kind(tz_list) is None and len(tz_list) == 1:
+        tz_list = tz_list[0]
+    buffer = read_timestamps(time_list)
+    size = len(buffer.values)
+    groups = list(zone_groups(tz_list, size))
+    for current_tz, _ in groups:
+        try:
+            arrow_zone(current_tz)
+        except pytz.UnknownTimeZoneError:
+            raise ValueError(f"Invalid time zone provided: {current_tz}")
+
+    record("convert_from_utc", size)
+    if array_kind(time_list) == "arrow" and len(groups) == 1:
+        # Arrow keeps instants in UTC, so the conversion is a change of type
+        return retag(time_list, arrow_zone(groups[0][0]))
+
+    with stage("convert_from_utc", "lookup", size):
+        local = wall_ticks(buffer, groups)
+    return write_timestamps(time_list, local, buffer.unit, None, buffer.valid)
+
+
+if __name__ == "__main__":
+    # Example usage:
+    time_utc = ["2023-09-23 12:00:00", "2023-09-24 14:00:00"]
+    tz_target = ["America/New_York", "Asia/Tokyo"]
+    converted_time = convert_from_utc(time_utc, tz_target)
+    print(converted_time)
@@ -0,0 +1,155 @@
+from datetime import datetime
+from ._lazy import np, pytz
+
+from .batch_convert import format_timestamps
+from .instrumentation import record, stage
+from .timestamp_parser import parse_wall_seconds
+from .zone_engine import SMALL_BATCH, from_seconds, local_lookup, local_lookup_one, to_seconds, utc_lookup
+from .zone_engine import utc_lookup_one
+from .zone_registry import is_valid_zone, validate_zones
+
+# Bounds of the years np.datetime_as_string writes as strftime does, in seconds since the Unix epoch;
+# outside them it zero-pads the year (or exceeds datetime's range), so those rows use strftime
+_YEAR_1000 = -30610224000
+_YEAR_10000 = 253402300800
+
+def convert_time_zone(time, from_tz="UTC", to_tz="UTC"):
+    """
+    Convert Time Between Time Zones
+
+    This function converts time from one time zone to another. 
+    It takes a time input (either a character string or a datetime object), 
+    and the time zones from and to which the time needs to be converted.
+
+    Parameters:
+        time (str or datetime): A string or a datetime object representing the input time.
+        from_tz (str): A string representing the time zone of the input time. Default is "UTC".
+        to_tz (str): A string representing the target time zone to which the time will be converted. Default is "UTC".
+
+    Returns:
+        str or datetime: The time converted to the target time zone, formatted as a string if the input was string, 
+                         otherwise as a datetime object.
+
+    Examples:
+        convert_time_zone("2023-09-23 12:00:00", "America/New_York", "Europe/London")
+        convert_time_zone(datetime(2023, 9, 23, 12, 0, 0, tzinfo=pytz.timezone("America/New_York")), to_tz="Europe/London")
+    """
+    if not is_valid_zone(from_tz) or not is_valid_zone(to_tz):
+        raise ValueError("Invalid time zone provided. Use pytz.all_timezones to view available time zones.")
+    
+    output = _convert_one(time, from_tz, to_tz)
+    record("convert_time_zone", 1)
+    return output
+
+
+def _convert_one(time, from_tz, to_tz):
+    # convert_time_zone after the zones are validated, with scalar lookups
+    input_is_string = isinstance(time, str)
+    
+    if input_is_string:
+        try:
+            dt = datetime.strptime(time, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            raise ValueError("Invalid time format. Please provide time as a recognizable string or a datetime object.")
+        utc_seconds, _, _, _ = local_lookup_one(to_seconds(dt), from_tz)
+    elif time.tzinfo is not None and time.utcoffset() is not None:
+        utc_seconds = to_seconds((time - time.utcoffset()).replace(tzinfo=None))
+    else:
+        # Naive datetimes are taken as system local time, as datetime.astimezone does
+        utc_seconds = to_seconds(time.astimezone(pytz.utc).replace(tzinfo=None))
+    
+    utcoffset, _, tzname = utc_lookup_one(utc_seconds, to_tz)
+    converted_time = from_seconds(utc_seconds + utcoffset)
+    return converted_time.strftime('%Y-%m-%d %H:%M:%S') + " " + tzname
+
+
+def convert_time_zone_batch(times, from_tz="UTC", to_tz="UTC"):
+    """
+    Convert many times between time zones in one vectorized pass.
+
+    Gives the same strings as calling convert_time_zone once per time. String times are parsed and
+    converted as arrays; datetime objects in the list, and inputs of fewer than SMALL_BATCH rows,
+    are converted one by one.
+
+    Parameters:
+        times (list, np.ndarray or pd.Series of str or datetime): The input times.
+        from_tz (str or list of str): The time zone of all input times, or one per time. Default is "UTC".
+        to_tz (str or list of str): The target time zone of all times, or one per time. Default is "UTC".
+
+    Returns:
+        List[str]: The converted times, "YYYY-MM-DD HH:MM:SS" followed by the target zone's abbreviation.
+
+    Raises:
+        ValueError: If a time zone or a time string is invalid, or the lengths of the inputs differ.
+    """
+    size = len(times)
+    # Per-row zones are read by position, so a pandas Series with any index works
+    from_tz, to_tz = (zones if isinstance(zones, str) else list(zones) for zones in (from_tz, to_tz))
+    for zones in (from_tz, to_tz):
+        if isinstance(zones, str):
+            zones = [zones]
+        elif len(zones) != size:
+            raise ValueError("Length of from_tz and to_tz must be either 1 or equal to the number of times.")
+        if not validate_zones(zones).all():
+            raise ValueError("Invalid time zone provided. Use pytz.all_timezones to view available time zones.")
+    
+    if not size:
+        return []
+    items = times.tolist() if hasattr(times, "tolist") else list(times)
+    if size < SMALL_BATCH:
+        # A few rows: the scalar path, without the fixed cost of the arrays
+        with stage("convert_time_zone_batch", "scalar", size):
+            converted = [_convert_one(time, _row(from_tz, i), _row(to_tz, i)) for i, time in enumerate(items)]
+        record("convert_time_zone_batch", size)
+        return converted
+    
+    objects = [i for i, time in enumerate(items) if not isinstance(time, str)]
+    if objects:
+        # Datetime objects: the scalar path, then the strings as one batch
+        converted = [None] * size
+        for i in objects:
+            converted[i] = convert_time_zone(items[i], _row(from_tz, i), _row(to_tz, i))
+        strings = [i for i in range(size) if converted[i] is None]
+        if strings:
+            rows = convert_time_zone_batch([items[i] for i in strings], _take(from_tz, strings), _take(to_tz, strings))
+            for i, value in zip(strings, rows):
+                converted[i] = value
+        return converted
+    
+    with stage("convert_time_zone_batch", "parse", size):
+        wall_seconds, errors = parse_wall_seconds(items)
+    if errors:
+        raise ValueError("Invalid time format. Please provide time as a recognizable string or a datetime object.")
+    with stage("convert_time_zone_batch", "localize", size):
+        utc_seconds, _, _, _ = local_lookup(wall_seconds, from_tz)
+    with stage("convert_time_zone_batch", "lookup", size):
+        utcoffset, _, tzname = utc_lookup(utc_seconds, to_tz)
+    with stage("convert_time_zone_batch", "format", size):
+        local = utc_seconds + utcoffset
+        converted = format_timestamps(local.astype("datetime64[s]"), np.char.add(" ", tzname.astype(str))).tolist()
+        for i in np.flatnonzero((local < _YEAR_1000) | (local >= _YEAR_10000)).tolist():
+            converted[i] = from_seconds(local[i]).strftime('%Y-%m-%d %H:%M:%S') + " " + tzname[i]
+    record("convert_time_zone_batch", size)
+    return converted
+
+
+def _row(zones, i):
+    return zones if isinstance(zones, str) else zones[i]
+
+
+def _take(zones, positions):
+    return zones if isinstance(zones, str) else [zones[i] for i in positions]
+
+
+if __name__ == "__main__":
+    time_char = "2023-09-23 12:00:00"
+    from_tz = "America/New_York"
+    to_tz = "Europe/London"
+
+    converted_time_char = convert_time_zone(time_char, from_tz, to_tz)
+    print(f"Final Output (string input): {converted_time_char}")
+
+    time_dt = datetime(2023, 9, 23, 12, 0, 0)
+    time_dt = pytz.timezone("America/New_York").localize(time_dt)
+    converted_time_dt = convert_time_zone(time_dt, to_tz="Europe/London")
+    print(f"Final Output (datetime input): {converted_time_dt}")
@@ -0,0 +1,203 @@
+from datetime import datetime
+import warnings
+
+from ._lazy import np, pd, pytz
+
+from .array_interop import UNITS, array_kind, read_timestamps, retag, write_timestamps, zone_groups
+from .batch_convert import AMBIGUOUS_TIME, INVALID_TIME, INVALID_ZONE, NONEXISTENT_TIME, error_counts
+from .dst_calendar import AMBIGUOUS, NONEXISTENT, localize, localize_one
+from .instrumentation import record, stage
+from .timestamp_parser import parse_wall_seconds
+from .zone_engine import SMALL_BATCH, compile_zone, from_seconds, to_seconds
+
+def convert_to_utc(times, timezones, ambiguous="standard", nonexistent="standard", return_errors=False):
+    """
+    Convert a list of local times to UTC times based on the given timezones.
+    
+    Parameters:
+    times (List[str], pyarrow timestamp array or np.ndarray of datetime64): A list of strings representing local
+        times in the "YYYY-MM-DD HH:mm:ss" format, or naive wall-clock timestamps as an Arrow or NumPy array.
+    timezones (List[str]): A list of strings representing the corresponding timezones for the local times. With
+        array input, also a single time zone string or an Arrow string array.
+    ambiguous (str): Policy for local times that occur twice when clocks are wound back: "standard" (default,
+                     pytz's is_dst=False), "dst", "earliest", "latest", "raise" or "NaT" (return None).
+    nonexistent (str): Policy for local times skipped when clocks are wound forward: "standard" (default),
+                       "dst", "shift_forward", "raise" or "NaT" (return None).
+    return_errors (bool): Whether to also return the per-row error codes instead of warning with a summary
+                          of the failed rows. Default is False.
+    
+    Returns:
+    List[str]: A list of strings representing the converted UTC times in the "YYYY-MM-DD HH:mm:ss+00:00" format,
+               with None for rows that could not be converted.
+    For array input, an array of the same kind and unit instead: an Arrow timestamp array with time zone "UTC"
+    (null where a row could not be converted), or a datetime64 array of UTC instants (NaT). An Arrow array that
+    already has a time zone holds instants, and is returned relabelled as UTC without copying.
+    If return_errors is True, a tuple of that list and a uint8 np.ndarray of error bits per row (see batch_convert:
+    INVALID_TIME, INVALID_ZONE, AMBIGUOUS_TIME, NONEXISTENT_TIME; 0 for clean rows).
+    
+    Raises:
+    ValueError: If the length of times and timezones is not the same, or a policy is unknown.
+    pytz.AmbiguousTimeError: If a time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If a time does not exist and nonexistent is "raise".
+    """
+    if array_kind(times):
+        return _convert_array(times, timezones, ambiguous, nonexistent, return_errors)
+    
+    if len(times) != len(timezones):
+        raise ValueError("Length of times and timezones must be the same")
+    
+    size = len(times)
+    if size < SMALL_BATCH:
+        with stage("convert_to_utc", "scalar", size):
+            utc_times, codes, errors = _convert_rows(times, timezones, ambiguous, nonexistent)
+        return _finish(utc_times, codes, errors, return_errors)
+    
+    # Parse every row and resolve each distinct time zone once, keeping the first error per row
+    with stage("convert_to_utc", "parse", size):
+        wall_seconds, errors = parse_wall_seconds(times)
+    codes = np.zeros(size, dtype=np.uint8)
+    codes[list(errors)] = INVALID_TIME
+    zone_errors = {}
+    with stage("convert_to_utc", "resolve_zones", size):
+        for timezone in set(timezones):
+            try:
+                compile_zone(timezone)
+            except Exception as e:
+                zone_errors[timezone] = e
+    if zone_errors:
+        for i, timezone in enumerate(timezones):
+            if timezone in zone_errors:
+                errors.setdefault(i, zone_errors[timezone])
+                codes[i] |= INVALID_ZONE
+    
+    valid = codes == 0
+    with stage("convert_to_utc", "localize", size):
+        result = localize(wall_seconds[valid], np.asarray(timezones, dtype=object)[valid], ambiguous, nonexistent)
+    codes[valid] = np.where(result.kind == AMBIGUOUS, AMBIGUOUS_TIME,
+                            np.where(result.kind == NONEXISTENT, NONEXISTENT_TIME, 0))
+    
+    utc_times = [None] * size
+    with stage("convert_to_utc", "format", size):
+        for i, seconds, unresolved in zip(np.flatnonzero(valid).tolist(), result.utc.tolist(), result.unresolved):
+            if unresolved:
+                continue
+            try:
+                utc_times[i] = _utc_text(seconds)
+            except OverflowError as e:
+                errors.setdefault(i, e)
+                codes[i] |= INVALID_TIME
+    
+    return _finish(utc_times, codes, errors, return_errors)
+
+def _convert_rows(times, timezones, ambiguous, nonexistent):
+    # convert_to_utc for a few rows, one scalar lookup each instead of the fixed cost of the array path
+    utc_times, codes, errors = [], [], {}
+    zone_errors = {}
+    for timezone in set(timezones):
+        try:
+            compile_zone(timezone)
+        except Exception as e:
+            zone_errors[timezone] = e
+    for i, (time, timezone) in enumerate(zip(times, timezones)):
+        code = 0
+        try:
+            wall_seconds = to_seconds(datetime.strptime(time, '%Y-%m-%d %H:%M:%S'))
+        except Exception as e:
+            errors[i] = e
+            code = INVALID_TIME
+        if timezone in zone_errors:
+            errors.setdefault(i, zone_errors[timezone])
+            code |= INVALID_ZONE
+        if code:
+            utc_times.append(None)
+            codes.append(code)
+            continue
+        result = localize_one(wall_seconds, timezone, ambiguous, nonexistent)
+        code = AMBIGUOUS_TIME if result.kind == AMBIGUOUS else NONEXISTENT_TIME if result.kind == NONEXISTENT else 0
+        utc_time = None
+        if not result.unresolved:
+            try:
+                utc_time = _utc_text(result.utc)
+            except OverflowError as e:
+                errors[i] = e
+                code |= INVALID_TIME
+        utc_times.append(utc_time)
+        codes.append(code)
+    return utc_times, np.array(codes, dtype=np.uint8), errors
+
+def _utc_text(seconds):
+    # The UTC string of an instant. Instants outside datetime's years 1-9999, e.g. 0001-01-01 00:00 in
+    # a zone east of UTC, raise OverflowError as pytz's astimezone did; callers report the row as invalid
+    return from_seconds(seconds).strftime('%Y-%m-%d %H:%M:%S+0000')
+
+def _finish(utc_times, codes, errors, return_errors):
+    record("convert_to_utc", len(utc_times), codes)
+    if return_errors:
+        return utc_times, codes
+    failed = np.fromiter((time is None for time in utc_times), dtype=bool, count=len(utc_times))
+    _report(failed, codes, errors[min(errors)] if errors else None)
+    return utc_times
+
+def _report(failed, codes, first_error=None):
+    # One warning for the whole batch rather than one per row, attributed to the caller of convert_to_utc
+    if failed.any():
+        details = ", ".join(f"{name} {count}" for name, count in error_counts(codes[failed]).items())
+        first = f"; first error: {first_error}" if first_error is not None else ""
+        warnings.warn(f"Could not convert {failed.sum()} of {len(failed)} times ({details}){first}",
+                      UserWarning, stacklevel=4)
+
+def _convert_array(times, timezones, ambiguous, nonexistent, return_errors):
+    # convert_to_utc for Arrow and NumPy timestamps, on the int64 buffer
+    buffer = read_timestamps(times)
+    size = len(buffer.values)
+    codes = np.zeros(size, dtype=np.uint8)
+    if buffer.valid is not None:
+        codes[~buffer.valid] = INVALID_TIME
+    if buffer.tz is not None:
+        # Already instants: only the label changes
+        result = retag(times, "UTC")
+        record("convert_to_utc", size, codes)
+        return (result, codes) if return_errors else result
+    
+    scale = UNITS[buffer.unit]
+    wall_seconds = buffer.values // scale
+    utc = buffer.values - wall_seconds * scale
+    failed = codes != 0
+    for timezone, positions in zone_groups(timezones, size):
+        rows = np.arange(size)[positions]
+        try:
+            compile_zone(timezone)
+        except pytz.UnknownTimeZoneError:
+            codes[rows] |= INVALID_ZONE
+            failed[rows] = True
+            continue
+        rows = rows[~failed[rows]]
+        with stage("convert_to_utc", "localize", len(rows)):
+            result = localize(wall_seconds[rows], timezone, ambiguous, nonexistent)
+        if nonexistent == "shift_forward":
+            # Shifted times land exactly on the transition
+            utc[rows[result.kind == NONEXISTENT]] = 0
+        utc[rows] += result.utc * scale
+        codes[rows] = np.where(result.kind == AMBIGUOUS, AMBIGUOUS_TIME,
+                               np.where(result.kind == NONEXISTENT, NONEXISTENT_TIME, 0))
+        failed[rows] = result.unresolved
+    
+    converted = write_timestamps(times, utc, buffer.unit, "UTC", ~failed if failed.any() else None)
+    record("convert_to_utc", size, codes)
+    if return_errors:
+        return converted, codes
+    _report(failed, codes)
+    return converted
+
+if __name__ == "__main__":
+    # Create a data frame with a column of time values and a corresponding timezone column
+    df = pd.DataFrame({
+        'time': ["2023-09-23 12:00:00", "2023-09-23 14:00:00", "2023-09-23 16:00:00"],
+        'tz': ["America/New_York", "Europe/London", "Asia/Tokyo"]
+    })
+
+    # Apply the convert_to_utc function to the entire columns
+    df['utc_time'] = convert_to_utc(df['time'].tolist(), df['tz'].tolist())
+
+    # Print the resulting data frame
+    print(df)
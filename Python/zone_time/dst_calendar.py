@@ -0,0 +1,420 @@
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import datetime
+import threading
+
+from ._lazy import np, pytz
+
+from .zone_engine import SMALL_BATCH, SMALL_GROUP, compile_zone, from_seconds, group_by_zone, per_row, to_seconds
+
+AMBIGUOUS_POLICIES = ("standard", "dst", "earliest", "latest", "raise", "NaT")
+NONEXISTENT_POLICIES = ("standard", "dst", "shift_forward", "raise", "NaT")
+
+# Kinds of wall-clock segments
+NORMAL = 0
+AMBIGUOUS = 1
+NONEXISTENT = 2
+
+_MIN = -2 ** 63  # np.iinfo(np.int64).min
+
+
+class WallSegments(namedtuple("WallSegments", ["kind", "first", "second"])):
+    """
+    Result of DstCalendar.segments.
+
+    Attributes:
+        kind (np.ndarray): uint8 array, NORMAL, AMBIGUOUS (clocks wound back) or NONEXISTENT (clocks wound forward).
+        first (np.ndarray): intp array of the period before the transition, or the only period for NORMAL rows.
+        second (np.ndarray): intp array of the period after the transition, equal to first for NORMAL rows.
+    """
+
+    __slots__ = ()
+
+
+class _WallTable:
+    # Sorted wall-clock boundaries of one zone, each starting a segment of a given kind
+    __slots__ = ("boundaries", "kind", "first", "second", "_lists")
+
+    def __init__(self, zone, lower=None, upper=None):
+        transitions, utcoffset = zone.transitions, zone.utcoffset
+        start = 0 if lower is None else int(zone.utc_periods(lower))
+        stop = len(transitions) - 1 if upper is None else int(zone.utc_periods(upper))
+        boundaries, kind, first, second = [_MIN], [NORMAL], [start], [start]
+        for i in range(start + 1, stop + 1):
+            before = transitions[i] + utcoffset[i - 1]
+            after = transitions[i] + utcoffset[i]
+            if after > before:
+                boundaries += [before, after]
+                kind += [NONEXISTENT, NORMAL]
+                first += [i - 1, i]
+                second += [i, i]
+            elif after < before:
+                boundaries += [after, before]
+                kind += [AMBIGUOUS, NORMAL]
+                first += [i - 1, i]
+                second += [i, i]
+            else:
+                boundaries.append(before)
+                kind.append(NORMAL)
+                first.append(i)
+                second.append(i)
+        self.boundaries = np.array(boundaries, dtype=np.int64)
+        # Transitions closer together than their offset change would leave the boundaries out of
+        # order; keeping the running maximum drops the segments they overlap
+        np.maximum.accumulate(self.boundaries, out=self.boundaries)
+        self.kind = np.array(kind, dtype=np.uint8)
+        self.first = np.array(first, dtype=np.intp)
+        self.second = np.array(second, dtype=np.intp)
+        self._lists = None
+
+    def lookup(self, wall_seconds):
+        if wall_seconds.ndim == 1 and len(wall_seconds) < SMALL_GROUP:
+            rows = [self.lookup_one(seconds) for seconds in wall_seconds.tolist()]
+            return tuple(np.array([row[i] for row in rows], dtype=dtype)
+                         for i, dtype in enumerate((np.uint8, np.intp, np.intp)))
+        segment = np.searchsorted(self.boundaries, wall_seconds, side="right") - 1
+        return self.kind[segment], self.first[segment], self.second[segment]
+
+    def lookup_one(self, wall_seconds):
+        if self._lists is None:
+            self._lists = (self.boundaries.tolist(), self.kind.tolist(), self.first.tolist(), self.second.tolist())
+        boundaries, kind, first, second = self._lists
+        segment = bisect_right(boundaries, wall_seconds) - 1
+        return kind[segment], first[segment], second[segment]
+
+
+class DstCalendar:
+    """
+    Precomputed wall-clock calendar of DST periods, transitions and their gaps and overlaps.
+
+    For each zone, the periods in effect between the start of first_year and the end of last_year are
+    laid out on the wall clock once, so classifying a local time is one binary search. Times outside
+    the range are answered from a table of the zone's whole history, built on first use.
+
+    Parameters:
+        first_year (int): The first year of the precomputed range. Default is 1970.
+        last_year (int): The last year of the precomputed range. Default is 2037, the last year pytz
+                         has explicit transitions for; later years keep the 2037 rules.
+    """
+
+    def __init__(self, first_year=1970, last_year=2037):
+        if first_year > last_year:
+            raise ValueError("first_year must not be after last_year.")
+        self.first_year = first_year
+        self.last_year = last_year
+        self._start = to_seconds(datetime(first_year, 1, 1))
+        self._end = to_seconds(datetime(last_year + 1, 1, 1))
+        self._tables = {}
+        self._full_tables = {}
+        self._lock = threading.Lock()
+
+    def _table(self, zone, full=False):
+        tables = self._full_tables if full else self._tables
+        table = tables.get(zone.name)
+        if table is None:
+            # A day of margin covers every UTC offset on either side of the range
+            bounds = () if full else (self._start - 86400, self._end + 86400)
+            table = _WallTable(zone, *bounds)
+            with self._lock:
+                tables[zone.name] = table
+        return table
+
+    def segments(self, wall_seconds, tz):
+        """
+        Classify wall-clock times of one time zone.
+
+        Parameters:
+        wall_seconds (array-like of int): Naive wall-clock times in seconds since 1970-01-01 00:00.
+        tz (str): A string representing the time zone.
+
+        Returns:
+        WallSegments: The segment kind and the candidate periods (indices into compile_zone(tz)) of each time.
+
+        Raises:
+        pytz.UnknownTimeZoneError: If the time zone is not known.
+        """
+        zone = compile_zone(tz)
+        wall_seconds = np.asarray(wall_seconds, dtype=np.int64)
+        inside = (wall_seconds >= self._start) & (wall_seconds < self._end)
+        if inside.all():
+            return WallSegments(*self._table(zone).lookup(wall_seconds))
+        kind = np.empty(wall_seconds.shape, dtype=np.uint8)
+        first = np.empty(wall_seconds.shape, dtype=np.intp)
+        second = np.empty(wall_seconds.shape, dtype=np.intp)
+        for table, rows in ((self._table(zone), inside), (self._table(zone, full=True), ~inside)):
+            if rows.any():
+                kind[rows], first[rows], second[rows] = table.lookup(wall_seconds[rows])
+        return WallSegments(kind, first, second)
+
+    def segment(self, wall_seconds, tz):
+        """
+        Classify one wall-clock time, as segments does for arrays.
+
+        Parameters:
+        wall_seconds (int): A naive wall-clock time in seconds since 1970-01-01 00:00.
+        tz (str): A string representing the time zone.
+
+        Returns:
+        Tuple[int, int, int]: The segment kind and the two candidate periods.
+
+        Raises:
+        pytz.UnknownTimeZoneError: If the time zone is not known.
+        """
+        return self._segment(compile_zone(tz), wall_seconds)
+
+    def _segment(self, zone, wall_seconds):
+        inside = self._start <= wall_seconds < self._end
+        return self._table(zone, full=not inside).lookup_one(wall_seconds)
+
+    def intervals(self, tz):
+        """
+        List the DST periods of a time zone that overlap the calendar's range.
+
+        Parameters:
+        tz (str): A string representing the time zone.
+
+        Returns:
+        np.ndarray: datetime64[s] array of shape (n, 2) with the UTC start and end of each DST period.
+                    The last end is NaT when DST is still in effect at the last known transition.
+
+        Raises:
+        pytz.UnknownTimeZoneError: If the time zone is not known.
+        """
+        zone = compile_zone(tz)
+        starts = zone.transitions
+        ends = np.append(zone.transitions[1:], _MIN)
+        keep = (zone.dst != 0) & (starts < self._end) & ((ends > self._start) | (ends == _MIN))
+        return np.stack([starts[keep], ends[keep]], axis=1).view("datetime64[s]")
+
+    def clear(self):
+        """
+        Drop the precomputed tables.
+        """
+        with self._lock:
+            self._tables.clear()
+            self._full_tables.clear()
+
+
+shared_calendar = DstCalendar()
+
+
+def check_policies(ambiguous, nonexistent):
+    """
+    Check the policies for ambiguous and non-existent wall-clock times.
+
+    Parameters:
+    ambiguous (str): One of AMBIGUOUS_POLICIES.
+    nonexistent (str): One of NONEXISTENT_POLICIES.
+
+    Raises:
+    ValueError: If a policy is unknown.
+    """
+    for name, policy, policies in (("ambiguous", ambiguous, AMBIGUOUS_POLICIES),
+                                   ("nonexistent", nonexistent, NONEXISTENT_POLICIES)):
+        if policy not in policies:
+            raise ValueError(f"{name} must be one of {policies}, got {policy!r}.")
+
+
+def choose_periods(zone, segments, wall_seconds, ambiguous="standard", nonexistent="standard"):
+    """
+    Pick one period per wall-clock time, applying the policies for ambiguous and non-existent times.
+
+    "standard" and "dst" match pytz's localize() with is_dst False and True. For ambiguous times they
+    pick the reading without and with DST, or the later and earlier UTC instant when both readings
+    agree. For non-existent times they take the offset in effect before and after the gap, which
+    around an ordinary spring-forward is standard time and DST.
+
+    "earliest" and "latest" pick the earlier or later UTC instant of an ambiguous time. "shift_forward"
+    moves a non-existent time to the end of the gap, i.e. the period after it (localize then returns
+    the transition instant). "raise" raises pytz.AmbiguousTimeError or pytz.NonExistentTimeError for
+    the first such time, and "NaT" marks it invalid.
+
+    Parameters:
+    zone (CompiledZone): The compiled time zone.
+    segments (WallSegments): The classified times, from DstCalendar.segments.
+    wall_seconds (np.ndarray): The int64 wall-clock seconds, used in error messages.
+    ambiguous (str): Policy for times that occur twice, one of AMBIGUOUS_POLICIES. Default is "standard".
+    nonexistent (str): Policy for times skipped by the clocks, one of NONEXISTENT_POLICIES. Default is "standard".
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: intp array of the chosen periods and a boolean array that is
+    True where a policy of "NaT" left the time without a period.
+
+    Raises:
+    ValueError: If a policy is unknown.
+    pytz.AmbiguousTimeError: If a time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If a time does not exist and nonexistent is "raise".
+    """
+    check_policies(ambiguous, nonexistent)
+    kind, first, second = segments
+    periods = first.copy()
+    invalid = np.zeros(kind.shape, dtype=bool)
+    for segment_kind, policy, error in ((AMBIGUOUS, ambiguous, pytz.AmbiguousTimeError),
+                                        (NONEXISTENT, nonexistent, pytz.NonExistentTimeError)):
+        rows = np.flatnonzero(kind == segment_kind)
+        if not len(rows):
+            continue
+        if policy == "raise":
+            raise error(from_seconds(wall_seconds[rows[0]]))
+        if policy == "NaT":
+            invalid[rows] = True
+        elif policy in ("latest", "shift_forward"):
+            periods[rows] = second[rows]
+        elif segment_kind == NONEXISTENT and policy == "dst":
+            # pytz borrows the offset from before the gap for standard time and from after it for DST
+            periods[rows] = second[rows]
+        elif segment_kind == AMBIGUOUS and policy in ("standard", "dst"):
+            want_dst = policy == "dst"
+            first_dst = (zone.dst[first[rows]] != 0) == want_dst
+            second_dst = (zone.dst[second[rows]] != 0) == want_dst
+            # On a tie, pytz takes the later instant for standard time and the earlier one for DST
+            use_first = np.where(first_dst != second_dst, first_dst, want_dst)
+            periods[rows] = np.where(use_first, first[rows], second[rows])
+    return periods, invalid
+
+
+def choose_period(zone, segment, wall_seconds, ambiguous="standard", nonexistent="standard"):
+    """
+    Pick the period of one wall-clock time, as choose_periods does for arrays.
+
+    Parameters:
+    zone (CompiledZone): The compiled time zone.
+    segment (Tuple[int, int, int]): The classified time, from DstCalendar.segment.
+    wall_seconds (int): The wall-clock seconds, used in error messages.
+    ambiguous (str): Policy for times that occur twice, one of AMBIGUOUS_POLICIES. Default is "standard".
+    nonexistent (str): Policy for times skipped by the clocks, one of NONEXISTENT_POLICIES. Default is "standard".
+
+    Returns:
+    Tuple[int, bool]: The chosen period, and True if a policy of "NaT" left the time without one.
+
+    Raises:
+    ValueError: If a policy is unknown.
+    pytz.AmbiguousTimeError: If the time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If the time does not exist and nonexistent is "raise".
+    """
+    check_policies(ambiguous, nonexistent)
+    kind, first, second = segment
+    if kind == NORMAL:
+        return first, False
+    if kind == AMBIGUOUS:
+        policy, error = ambiguous, pytz.AmbiguousTimeError
+    else:
+        policy, error = nonexistent, pytz.NonExistentTimeError
+    if policy == "raise":
+        raise error(from_seconds(wall_seconds))
+    if policy == "NaT":
+        return first, True
+    if policy in ("latest", "shift_forward") or (kind == NONEXISTENT and policy == "dst"):
+        return second, False
+    if kind == AMBIGUOUS and policy in ("standard", "dst"):
+        want_dst = policy == "dst"
+        dst = zone.as_lists()[2]
+        first_dst = (dst[first] != 0) == want_dst
+        second_dst = (dst[second] != 0) == want_dst
+        return (first if (first_dst if first_dst != second_dst else want_dst) else second), False
+    return first, False
+
+
+class LocalizedTimes(namedtuple("LocalizedTimes", ["utc", "utcoffset", "dst", "kind", "unresolved"])):
+    """
+    Result of localize.
+
+    Attributes:
+        utc (np.ndarray): int64 UTC instants in seconds since the Unix epoch, 0 for unresolved rows.
+        utcoffset (np.ndarray): int64 UTC offsets in seconds.
+        dst (np.ndarray): int64 DST adjustments in seconds.
+        kind (np.ndarray): uint8 segment kind of each wall time: NORMAL, AMBIGUOUS or NONEXISTENT.
+        unresolved (np.ndarray): Boolean array, True where a policy of "NaT" left the time unresolved.
+    """
+
+    __slots__ = ()
+
+
+def localize(wall_seconds, zones, ambiguous="standard", nonexistent="standard", calendar=None):
+    """
+    Resolve wall-clock times to UTC instants with explicit policies for ambiguous and non-existent times.
+
+    With the default policies the result is the same as local_lookup, i.e. pytz's localize(is_dst=False).
+    See choose_periods for the policies.
+
+    Parameters:
+    wall_seconds (array-like of int): Naive wall-clock times in seconds since 1970-01-01 00:00.
+    zones (str or array-like of str): A single time zone for all values, or one time zone per value.
+    ambiguous (str): Policy for times that occur twice, one of AMBIGUOUS_POLICIES. Default is "standard".
+    nonexistent (str): Policy for times skipped by the clocks, one of NONEXISTENT_POLICIES. Default is "standard".
+    calendar (DstCalendar, optional): The calendar to classify the times with. Default is None, which uses
+                                      the shared calendar.
+
+    Returns:
+    LocalizedTimes: The UTC instants, the zone state at each and how each wall time was classified.
+
+    Raises:
+    ValueError: If a policy is unknown.
+    pytz.UnknownTimeZoneError: If any time zone is not known.
+    pytz.AmbiguousTimeError: If a time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If a time does not exist and nonexistent is "raise".
+    """
+    calendar = calendar or shared_calendar
+    wall_seconds = np.asarray(wall_seconds, dtype=np.int64)
+    if len(wall_seconds) < SMALL_BATCH:
+        rows = [localize_one(seconds, zone, ambiguous, nonexistent, calendar)
+                for seconds, zone in zip(wall_seconds.tolist(), per_row(zones, len(wall_seconds)))]
+        return LocalizedTimes(*(np.array([row[i] for row in rows], dtype=dtype)
+                                for i, dtype in enumerate((np.int64, np.int64, np.int64, np.uint8, bool))))
+    utc = np.zeros(wall_seconds.shape, dtype=np.int64)
+    utcoffset = np.zeros(wall_seconds.shape, dtype=np.int64)
+    dst = np.zeros(wall_seconds.shape, dtype=np.int64)
+    kind = np.zeros(wall_seconds.shape, dtype=np.uint8)
+    unresolved = np.zeros(wall_seconds.shape, dtype=bool)
+    for name, positions in group_by_zone(zones, len(wall_seconds)):
+        zone = compile_zone(name)
+        seconds = wall_seconds[positions]
+        segments = calendar.segments(seconds, name)
+        periods, missing = choose_periods(zone, segments, seconds, ambiguous, nonexistent)
+        offsets = zone.utcoffset[periods]
+        instants = seconds - offsets
+        if nonexistent == "shift_forward":
+            shifted = segments.kind == NONEXISTENT
+            instants[shifted] = zone.transitions[periods[shifted]]
+        instants[missing] = 0
+        utc[positions] = instants
+        utcoffset[positions] = offsets
+        dst[positions] = zone.dst[periods]
+        kind[positions] = segments.kind
+        unresolved[positions] = missing
+    return LocalizedTimes(utc, utcoffset, dst, kind, unresolved)
+
+
+def localize_one(wall_seconds, tz, ambiguous="standard", nonexistent="standard", calendar=None):
+    """
+    Resolve one wall-clock time to a UTC instant, as localize does for arrays.
+
+    Parameters:
+    wall_seconds (int): A naive wall-clock time in seconds since 1970-01-01 00:00.
+    tz (str): A string representing the time zone.
+    ambiguous (str): Policy for times that occur twice, one of AMBIGUOUS_POLICIES. Default is "standard".
+    nonexistent (str): Policy for times skipped by the clocks, one of NONEXISTENT_POLICIES. Default is "standard".
+    calendar (DstCalendar, optional): The calendar to classify the time with. Default is None, which uses
+                                      the shared calendar.
+
+    Returns:
+    LocalizedTimes: The fields for the one time, as Python ints and a bool.
+
+    Raises:
+    ValueError: If a policy is unknown.
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    pytz.AmbiguousTimeError: If the time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If the time does not exist and nonexistent is "raise".
+    """
+    calendar = calendar or shared_calendar
+    zone = compile_zone(tz)
+    segment = calendar._segment(zone, wall_seconds)
+    period, missing = choose_period(zone, segment, wall_seconds, ambiguous, nonexistent)
+    transitions, utcoffset, dst, _ = zone.as_lists()
+    if missing:
+        utc = 0
+    elif nonexistent == "shift_forward" and segment[0] == NONEXISTENT:
+        utc = transitions[period]
+    else:
+        utc = wall_seconds - utcoffset[period]
+    return LocalizedTimes(utc, utcoffset[period], dst[period], segment[0], missing)
@@ -0,0 +1,143 @@
+from ._lazy import np, pd, pytz
+from datetime import datetime, timezone
+
+from .array_interop import UNITS, array_kind, import_pyarrow, read_timestamps
+from .timestamp_formatter import format_instants
+from .zone_engine import compile_zone
+from .zone_registry import get_zone
+
+def format_with_timezone(time, format_str="%Y-%m-%d %H:%M:%S %Z", to_tz=None):
+    """
+    Format a datetime object or a Series of datetime objects with time zone information.
+    
+    This function takes a datetime object or a pandas Series of datetime objects 
+    and optionally converts them to a specified time zone before formatting them 
+    according to the provided format string.
+    
+    Series of tz-aware timestamps are formatted in bulk when the format only uses %Y, %m, %d, %H, %M,
+    %S, %f, %z, %Z, %F, %T and %%: zone abbreviations and offsets are rendered once per transition
+    period instead of once per row. Other formats, and Series the fast path cannot vouch for, are
+    formatted element by element with strftime, with the same result.
+    
+    Arrow timestamp arrays and NumPy datetime64 arrays are formatted the same way, from their int64 buffer;
+    the time zone is to_tz, or else the Arrow type's. NumPy values are taken as UTC and need to_tz. The result
+    is an Arrow string array (null for null timestamps) or a NumPy str array ("NaT" for NaT).
+    
+    Parameters:
+        time (datetime, pd.Series, pyarrow timestamp array or np.ndarray of datetime64): A datetime object,
+             a pandas Series of datetime objects, or an array of timestamps.
+        format_str (str): A string specifying the desired format. Default is "%Y-%m-%d %H:%M:%S %Z".
+        to_tz (str): A string specifying the target time zone. If provided,
+                     the datetime object(s) are converted to this time zone before formatting.
+                     Default is None (no conversion).
+                     
+    Returns:
+        str, pd.Series or array: A string, a Series or an array of the input's kind representing
+                                 the formatted datetime object(s) with time zone information.
+    
+    Raises:
+        ValueError: If any 'time' object is naive or if 'to_tz' is not a valid time zone.
+    """
+    
+    # Resolve the target time zone once rather than for every element
+    target_tz = None
+    if to_tz:
+        try:
+            target_tz = get_zone(to_tz)
+        except pytz.UnknownTimeZoneError:
+            raise ValueError(f"The to_tz '{to_tz}' is not a valid time zone.")
+    
+    def format_single_datetime(dt):
+        # Check if the time object is naive (i.e., without timezone info)
+        if dt.tzinfo is None:
+            raise ValueError("The time object is naive. Please provide a datetime object with time zone information.")
+        
+        # If a target time zone is specified, convert the time object to that time zone
+        if target_tz is not None:
+            dt = dt.astimezone(target_tz)
+        
+        # Format the datetime object using the provided format string
+        return dt.strftime(format_str)
+
+    if array_kind(time):
+        return _format_array(time, format_str, to_tz)
+    elif isinstance(time, pd.Series):
+        formatted = _format_series(time, format_str, to_tz)
+        if formatted is not None:
+            return formatted
+        return time.map(format_single_datetime)
+    else:
+        return format_single_datetime(time)
+
+def _zone_name(tz):
+    # The pytz name of a Series' time zone, or None if it has none
+    if tz is timezone.utc:
+        return "UTC"
+    return getattr(tz, "zone", None) or getattr(tz, "key", None)
+
+def _format_series(time, format_str, to_tz):
+    # Bulk formatting of a tz-aware Series, or None to fall back to formatting element by element
+    if not isinstance(time.dtype, pd.DatetimeTZDtype) or time.isna().any():
+        return None
+    tz = time.dt.tz
+    name = to_tz or _zone_name(tz)
+    if name is None:
+        return None
+    utc_micros = time.to_numpy(dtype="datetime64[us]").view(np.int64)
+    try:
+        zone = compile_zone(name)
+    except pytz.UnknownTimeZoneError:
+        return None
+    if not to_tz and not hasattr(tz, "zone"):
+        # Zones other than pytz's (e.g. zoneinfo) may come from other tz data: only use the pytz
+        # tables if they give the Series' own UTC offsets
+        wall = time.dt.tz_localize(None).to_numpy(dtype="datetime64[us]").view(np.int64)
+        offsets = zone.utcoffset[zone.utc_periods(utc_micros // 1_000_000)]
+        if not np.array_equal(wall - utc_micros, offsets * 1_000_000):
+            return None
+    result = format_instants(utc_micros, name, format_str)
+    if result is None:
+        return None
+    return pd.Series(result, index=time.index, name=time.name)
+
+def _format_array(time, format_str, to_tz):
+    # format_with_timezone for Arrow and NumPy timestamps
+    timestamps = read_timestamps(time)
+    tz = to_tz or timestamps.tz
+    if tz is None:
+        raise ValueError("The time object is naive. Please provide a datetime object with time zone information.")
+    scale = UNITS[timestamps.unit]
+    micros = timestamps.values * (1_000_000 // scale) if scale <= 1_000_000 else timestamps.values // (scale // 1_000_000)
+    valid = timestamps.valid
+    if valid is not None:
+        micros = micros[valid]
+    try:
+        formatted = format_instants(micros, tz, format_str)
+    except pytz.UnknownTimeZoneError:
+        formatted = None
+    if formatted is None:
+        # Formats and zones (e.g. Arrow's fixed offsets) the bulk formatter does not handle
+        instants = pd.Series(micros.view("datetime64[us]")).dt.tz_localize("UTC")
+        instants = instants.dt.tz_convert(get_zone(tz) if not timestamps.tz or to_tz else timestamps.tz)
+        formatted = np.asarray(instants.map(lambda dt: dt.strftime(format_str)), dtype=str)
+    if valid is not None:
+        full = np.full(len(valid), "NaT", dtype=formatted.dtype if len(formatted) else "<U3")
+        full[valid] = formatted
+        formatted = full
+    if array_kind(time) == "arrow":
+        return import_pyarrow().array(formatted, mask=None if valid is None else ~valid)
+    return formatted
+
+if __name__ == "__main__":
+    # Example usage with DataFrame
+    df = pd.DataFrame({
+        'time': [
+            "2023-09-23 12:34:56",
+            "2023-09-24 13:45:57"
+        ]
+    })
+
+    df['time'] = pd.to_datetime(df['time']).dt.tz_localize('UTC')
+    df['formatted_time'] = format_with_timezone(df['time'], to_tz="America/New_York")
+
+    print(df)
@@ -0,0 +1,83 @@
+from .zone_clock import shared_clock
+
+_DEFAULT_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+def get_local_time(tz="UTC", format_output=False, include_tz_abbreviation=False, custom_format="%Y-%m-%d %H:%M:%S.%f",
+                   clock=None):
+    """
+    Get Local Time in Specified Time Zone
+
+    This function retrieves the current time and adjusts it to the specified time zone.
+    The user can also choose to format the output and include the time zone abbreviation.
+
+    Parameters:
+    tz (str): String representing the time zone to which the current time will be adjusted. Default is "UTC".
+    format_output (bool): Boolean, indicating whether to format the output as a string. Default is False.
+    include_tz_abbreviation (bool): Boolean, indicating whether to include the time zone abbreviation in the output. Default is False.
+    custom_format (str): String representing the custom format string to be used if format_output is True. Default is "%Y-%m-%d %H:%M:%S.%f".
+    clock (ZoneClock, optional): The clock service to read, e.g. one with a fixed clock for tests. Default is None,
+                                 which uses the shared clock; it resolves each zone once per transition period.
+
+    Returns:
+    datetime or str: A datetime object representing the local time in the specified time zone, optionally formatted as a string.
+
+    Examples:
+    >>> get_local_time("America/New_York", format_output=True, include_tz_abbreviation=True)
+    """
+    
+    # Retrieve the current time with microseconds (the clock validates the time zone)
+    [(current_time, tz_abbreviation)] = (clock or shared_clock).now_many([tz])
+    
+    # Optionally format the output as a string
+    if format_output:
+        return _format(current_time, tz_abbreviation, include_tz_abbreviation, custom_format)
+    else:
+        return current_time
+
+def get_local_times(zones, format_output=False, include_tz_abbreviation=False, custom_format="%Y-%m-%d %H:%M:%S.%f",
+                    clock=None):
+    """
+    Get Local Time in Several Time Zones at Once
+
+    All zones are read from a single clock read, so the results describe the same instant. Each zone's
+    offset and abbreviation come from the clock service's cache, refreshed only at the zone's next transition.
+
+    Parameters:
+    zones (iterable of str): The time zones.
+    format_output (bool): Boolean, indicating whether to format the output as strings. Default is False.
+    include_tz_abbreviation (bool): Boolean, indicating whether to include the time zone abbreviation in the output. Default is False.
+    custom_format (str): String representing the custom format string to be used if format_output is True. Default is "%Y-%m-%d %H:%M:%S.%f".
+    clock (ZoneClock, optional): The clock service to read. Default is None, which uses the shared clock.
+
+    Returns:
+    List[datetime] or List[str]: The local time in each time zone, in order, optionally formatted as strings.
+
+    Raises:
+    ValueError: If any time zone is invalid.
+
+    Examples:
+    >>> get_local_times(["America/New_York", "Europe/London"], format_output=True)
+    """
+    current_times = (clock or shared_clock).now_many(zones)
+    if not format_output:
+        return [current_time for current_time, _ in current_times]
+    return [_format(current_time, tz_abbreviation, include_tz_abbreviation, custom_format)
+            for current_time, tz_abbreviation in current_times]
+
+def _format(current_time, tz_abbreviation, include_tz_abbreviation, custom_format):
+    # The default format is ISO 8601 with a space separator, which isoformat renders several times faster
+    if custom_format == _DEFAULT_FORMAT and current_time.year >= 1000:
+        local_time_str = current_time.isoformat(" ", "microseconds")[:26]
+    else:
+        local_time_str = current_time.strftime(custom_format)
+    
+    # Optionally include the time zone abbreviation
+    if include_tz_abbreviation:
+        local_time_str += " " + tz_abbreviation
+    return local_time_str
+
+if __name__ == "__main__":
+    # Example usage:
+    tz = "America/New_York"
+    local_time = get_local_time(tz, format_output=True, include_tz_abbreviation=True)
+    print(local_time)
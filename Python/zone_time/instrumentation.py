@@ -0,0 +1,386 @@
+"""
+Opt-in instrumentation of the conversion functions.
+
+When enabled, the conversion functions record, per function: calls, rows, rows flagged with each
+error (see batch_convert.ERROR_NAMES) and the time spent in each stage (parsing, zone resolution,
+localization or lookup, formatting). A snapshot adds the hit rates of the zone caches. Snapshots
+go to sinks: any callable taking the snapshot dict, such as JsonFileSink or PrometheusFileSink,
+on demand with export(), every `interval` seconds, and when instrumentation is disabled.
+
+Instrumentation is off by default. While it is off, each hook in a conversion function costs one
+global lookup and one call returning a shared no-op context manager; no clock is read.
+
+    >>> from zone_time import instrumentation
+    >>> metrics = instrumentation.enable(sinks=[instrumentation.PrometheusFileSink("/tmp/zone_time.prom")])
+    >>> convert_to_utc(times, zones)
+    >>> metrics.snapshot()["stages"]["convert_to_utc"]
+    {'parse': {'calls': 1, 'rows': 3, 'seconds': 2.1e-05}, 'resolve_zones': {...}, ...}
+"""
+from contextlib import nullcontext
+from datetime import datetime
+import json
+import os
+import sys
+import threading
+from time import perf_counter
+
+_NULL = nullcontext()
+_metrics = None
+_sinks = ()
+_exporter = None
+
+
+class Metrics:
+    """
+    Thread-safe totals of the instrumented calls since the metrics were created or reset.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Set every total back to zero.
+        """
+        with self._lock:
+            self.since = datetime.now().astimezone()
+            self._started = perf_counter()
+            self.calls = {}
+            self.rows = {}
+            self.errors = {}
+            self.stages = {}
+
+    def add_call(self, function, rows, errors=None):
+        """
+        Count a call of a function.
+
+        Parameters:
+        function (str): The function name.
+        rows (int): The number of rows it handled.
+        errors (dict, optional): The number of rows per error name.
+        """
+        with self._lock:
+            self.calls[function] = self.calls.get(function, 0) + 1
+            self.rows[function] = self.rows.get(function, 0) + rows
+            if errors:
+                counts = self.errors.setdefault(function, {})
+                for name, count in errors.items():
+                    counts[name] = counts.get(name, 0) + count
+
+    def add_stage(self, function, stage, seconds, rows=0):
+        """
+        Add the time of one stage of a function call.
+
+        Parameters:
+        function (str): The function name.
+        stage (str): The stage name, e.g. "parse".
+        seconds (float): The time spent.
+        rows (int): The number of rows the stage handled. Default is 0.
+        """
+        with self._lock:
+            entry = self.stages.setdefault(function, {}).get(stage)
+            if entry is None:
+                entry = self.stages[function][stage] = [0, 0, 0.0]
+            entry[0] += 1
+            entry[1] += rows
+            entry[2] += seconds
+
+    def snapshot(self):
+        """
+        Copy the totals, with the current cache counters.
+
+        Returns:
+        dict: since (ISO time), seconds (since then), calls and rows per function, errors per
+              function and error name, stages per function and stage (calls, rows, seconds) and
+              caches per cache name (hits, misses, hit_rate).
+        """
+        with self._lock:
+            snapshot = {
+                "since": self.since.isoformat(timespec="seconds"),
+                "seconds": perf_counter() - self._started,
+                "calls": dict(self.calls),
+                "rows": dict(self.rows),
+                "errors": {function: dict(counts) for function, counts in self.errors.items()},
+                "stages": {function: {stage: {"calls": calls, "rows": rows, "seconds": seconds}
+                                      for stage, (calls, rows, seconds) in stages.items()}
+                           for function, stages in self.stages.items()},
+            }
+        snapshot["caches"] = cache_stats()
+        return snapshot
+
+
+class _Stage:
+    __slots__ = ("metrics", "function", "stage", "rows", "start")
+
+    def __init__(self, metrics, function, stage, rows):
+        self.metrics = metrics
+        self.function = function
+        self.stage = stage
+        self.rows = rows
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.add_stage(self.function, self.stage, perf_counter() - self.start, self.rows)
+
+
+def stage(function, name, rows=0):
+    """
+    Time a stage of a conversion function, if instrumentation is enabled.
+
+    Parameters:
+    function (str): The function name.
+    name (str): The stage name, e.g. "parse".
+    rows (int): The number of rows the stage handles. Default is 0.
+
+    Returns:
+    A context manager timing its block, or a shared no-op one when instrumentation is off.
+    """
+    metrics = _metrics
+    if metrics is None:
+        return _NULL
+    return _Stage(metrics, function, name, rows)
+
+
+def record(function, rows, codes=None):
+    """
+    Count a call of a conversion function, if instrumentation is enabled.
+
+    Parameters:
+    function (str): The function name.
+    rows (int): The number of rows it handled.
+    codes (np.ndarray, optional): uint8 error bits per row, as in BatchResult.errors.
+    """
+    metrics = _metrics
+    if metrics is None:
+        return
+    errors = None
+    if codes is not None:
+        from .batch_convert import error_counts
+        errors = error_counts(codes)
+    metrics.add_call(function, rows, errors)
+
+
+def _hit_rate(hits, misses):
+    lookups = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": hits / lookups if lookups else 0.0}
+
+
+def cache_stats():
+    """
+    Report the hit rates of the zone caches that are in use.
+
+    Only caches of modules already imported are reported, so this does not load anything.
+
+    Returns:
+    dict: hits, misses and hit_rate per cache: zone_registry (resolved zones), compiled_zones
+          (transition tables) and zone_clock (current periods for get_local_time).
+    """
+    caches = {}
+    registry = sys.modules.get(f"{__package__}.zone_registry")
+    if registry is not None:
+        stats = registry.zone_cache_stats()
+        caches["zone_registry"] = _hit_rate(stats["hits"] + stats["negative_hits"], stats["misses"])
+    engine = sys.modules.get(f"{__package__}.zone_engine")
+    if engine is not None:
+        info = engine._compile_canonical.cache_info()
+        caches["compiled_zones"] = _hit_rate(info.hits, info.misses)
+    clock = sys.modules.get(f"{__package__}.zone_clock")
+    if clock is not None:
+        stats = clock.shared_clock.stats()
+        caches["zone_clock"] = _hit_rate(stats["hits"], stats["refreshes"])
+    return caches
+
+
+def _write_atomically(path, text):
+    # Readers (e.g. a node_exporter textfile collector) never see a half-written file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as file:
+        file.write(text)
+    os.replace(temporary, path)
+
+
+class JsonFileSink:
+    """
+    Sink writing each snapshot to a JSON file, replacing the previous one.
+
+    Parameters:
+        path (str): The file to write.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, snapshot):
+        _write_atomically(self.path, json.dumps(snapshot, indent=1, sort_keys=True))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def prometheus_text(snapshot, prefix="zone_time"):
+    """
+    Render a snapshot in the Prometheus text exposition format.
+
+    Parameters:
+    snapshot (dict): A snapshot from Metrics.snapshot.
+    prefix (str): The prefix of every metric name. Default is "zone_time".
+
+    Returns:
+    str: The metrics, one sample per line.
+    """
+    families = [
+        ("calls_total", "counter", "Calls of each conversion function.",
+         [(_labels(function=function), count) for function, count in snapshot["calls"].items()]),
+        ("rows_total", "counter", "Rows handled by each conversion function.",
+         [(_labels(function=function), count) for function, count in snapshot["rows"].items()]),
+        ("errors_total", "counter", "Rows flagged with each error.",
+         [(_labels(function=function, error=error), count)
+          for function, counts in snapshot["errors"].items() for error, count in counts.items()]),
+        ("stage_seconds_total", "counter", "Time spent in each stage of the conversion functions.",
+         [(_labels(function=function, stage=stage), totals["seconds"])
+          for function, stages in snapshot["stages"].items() for stage, totals in stages.items()]),
+        ("stage_rows_total", "counter", "Rows handled by each stage of the conversion functions.",
+         [(_labels(function=function, stage=stage), totals["rows"])
+          for function, stages in snapshot["stages"].items() for stage, totals in stages.items()]),
+        ("cache_hits_total", "counter", "Hits of the zone caches.",
+         [(_labels(cache=cache), stats["hits"]) for cache, stats in snapshot["caches"].items()]),
+        ("cache_misses_total", "counter", "Misses of the zone caches.",
+         [(_labels(cache=cache), stats["misses"]) for cache, stats in snapshot["caches"].items()]),
+        ("cache_hit_ratio", "gauge", "Hit rate of the zone caches.",
+         [(_labels(cache=cache), stats["hit_rate"]) for cache, stats in snapshot["caches"].items()]),
+    ]
+    lines = []
+    for name, kind, description, samples in families:
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        lines.extend(f"{prefix}_{name}{{{labels}}} {value!r}" for labels, value in samples)
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusFileSink:
+    """
+    Sink writing each snapshot to a file in the Prometheus text format, replacing the previous one,
+    e.g. for node_exporter's textfile collector (which reads *.prom files).
+
+    Parameters:
+        path (str): The file to write.
+        prefix (str): The prefix of every metric name. Default is "zone_time".
+    """
+
+    def __init__(self, path, prefix="zone_time"):
+        self.path = path
+        self.prefix = prefix
+
+    def __call__(self, snapshot):
+        _write_atomically(self.path, prometheus_text(snapshot, self.prefix))
+
+
+class _Exporter(threading.Thread):
+    # Daemon thread exporting a snapshot every interval seconds until stopped
+    def __init__(self, interval):
+        super().__init__(name="zone_time-instrumentation", daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            export()
+
+
+def enable(sinks=(), interval=None):
+    """
+    Turn instrumentation on, with fresh metrics.
+
+    Parameters:
+    sinks (iterable of callable): Functions called with each exported snapshot. Default is none.
+    interval (float, optional): Export to the sinks every this many seconds from a background
+                                thread. Default is None, which exports only on export() and disable().
+
+    Returns:
+    Metrics: The metrics being recorded.
+    """
+    global _metrics, _sinks, _exporter
+    disable(flush=False)
+    _sinks = tuple(sinks)
+    _metrics = Metrics()
+    if interval is not None:
+        _exporter = _Exporter(interval)
+        _exporter.start()
+    return _metrics
+
+
+def disable(flush=True):
+    """
+    Turn instrumentation off.
+
+    Parameters:
+    flush (bool): Whether to export a last snapshot to the sinks. Default is True.
+
+    Returns:
+    Metrics or None: The metrics recorded until now, or None if instrumentation was off.
+    """
+    global _metrics, _sinks, _exporter
+    if _exporter is not None:
+        _exporter.stopped.set()
+        _exporter.join()
+        _exporter = None
+    if flush and _metrics is not None:
+        export()
+    metrics, _metrics, _sinks = _metrics, None, ()
+    return metrics
+
+
+def enabled():
+    """
+    Tell whether instrumentation is on.
+
+    Returns:
+    bool: True if the conversion functions are recording metrics.
+    """
+    return _metrics is not None
+
+
+def current_metrics():
+    """
+    The metrics being recorded.
+
+    Returns:
+    Metrics or None: The metrics, or None if instrumentation is off.
+    """
+    return _metrics
+
+
+def export():
+    """
+    Take a snapshot and pass it to every sink.
+
+    Returns:
+    dict or None: The snapshot, or None if instrumentation is off.
+    """
+    metrics = _metrics
+    if metrics is None:
+        return None
+    snapshot = metrics.snapshot()
+    for sink in _sinks:
+        sink(snapshot)
+    return snapshot
+
+
+if __name__ == "__main__":
+    # Run as a script this file is __main__, while the conversion functions report to the package module
+    from . import instrumentation
+    from .convert_to_utc import convert_to_utc
+
+    instrumentation.enable()
+    convert_to_utc(["2023-09-23 12:00:00", "2023-03-12 02:30:00", "bad"],
+                   ["America/New_York", "America/New_York", "Europe/London"])
+    print(instrumentation.prometheus_text(instrumentation.disable().snapshot()))
@@ -0,0 +1,114 @@
+from collections import namedtuple
+from datetime import datetime
+
+from ._lazy import np, pytz
+
+from .dst_calendar import choose_periods, shared_calendar
+from .timestamp_parser import parse_timestamps
+from .zone_engine import compile_zone, group_by_zone, local_lookup_one, to_seconds
+from .zone_registry import is_valid_zone
+
+def is_dst(time: str, tz: str) -> bool:
+    """
+    Check if Daylight Saving Time (DST) is in effect for a given time and time zone.
+    
+    Parameters:
+    time (str): A string representing the time in 'YYYY-MM-DD HH:MM:SS' format.
+    tz (str): A string representing the time zone.
+    
+    Returns:
+    bool: True if DST is in effect, False otherwise.
+    
+    Raises:
+    ValueError: If the input time string format or time zone is invalid.
+    """
+    
+    # Check if the provided time zone is valid
+    if not is_valid_zone(tz):
+        raise ValueError("Error: Invalid time zone. Please provide a valid time zone.")
+    
+    # Try to convert the time string to a datetime object with the specified time zone
+    try:
+        time_dt = datetime.strptime(time, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        raise ValueError("Error: Invalid time string format. Please provide time in 'YYYY-MM-DD HH:MM:SS' format.")
+    
+    # Localize the time to the given time zone
+    _, _, dst, _ = local_lookup_one(to_seconds(time_dt), tz)
+    
+    # Return whether Daylight Saving Time (DST) is in effect
+    return dst != 0
+
+class DstFlags(namedtuple("DstFlags", ["dst", "invalid"])):
+    """
+    Result of is_dst_batch.
+    
+    Attributes:
+        dst (np.ndarray): Boolean array, True where Daylight Saving Time is in effect. False for invalid rows.
+        invalid (np.ndarray): Boolean array, True where the time or time zone could not be used, or where a
+                              policy of "NaT" left an ambiguous or non-existent time unanswered.
+    """
+    
+    __slots__ = ()
+
+def is_dst_batch(times, timezones, ambiguous="standard", nonexistent="standard", calendar=None):
+    """
+    Check if Daylight Saving Time (DST) is in effect for many times and time zones at once.
+    
+    Each time is classified with a binary search in a precomputed per-zone DST calendar instead of
+    a pytz call per row. Bad times and unknown time zones are flagged in the result rather than raised.
+    
+    Parameters:
+    times (array-like of str or np.ndarray of datetime64): The local times, as strings in
+                                                          'YYYY-MM-DD HH:MM:SS' format or naive datetime64 values.
+    timezones (str or array-like of str): A single time zone for all times, or one time zone per time.
+    ambiguous (str): What to answer for times that occur twice when clocks are wound back: "standard"
+                     (default, the same answer as is_dst), "dst", "earliest", "latest", "raise" or "NaT"
+                     (mark the row invalid). See dst_calendar.choose_periods.
+    nonexistent (str): What to answer for times skipped when clocks are wound forward: "standard" (default),
+                       "dst", "shift_forward", "raise" or "NaT".
+    calendar (DstCalendar, optional): The calendar to answer from, e.g. one with a wider year range.
+                                      Default is None, which uses the shared calendar (1970 to 2037).
+    
+    Returns:
+    DstFlags: The DST flags and the invalid-row mask.
+    
+    Raises:
+    ValueError: If a policy is unknown, or the lengths of times and timezones differ.
+    pytz.AmbiguousTimeError: If a time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If a time does not exist and nonexistent is "raise".
+    """
+    calendar = calendar or shared_calendar
+    array = np.asarray(times)
+    if array.dtype.kind == "M":
+        micros = array.astype("datetime64[us]").view(np.int64)
+    else:
+        micros = parse_timestamps(array if array.dtype.kind == "U" else times, offsets=False).values.view(np.int64)
+    invalid = micros == np.iinfo(np.int64).min
+    wall_seconds = micros // 1_000_000
+    dst = np.zeros(len(wall_seconds), dtype=bool)
+    
+    for tz, positions in group_by_zone(timezones, len(wall_seconds)):
+        rows = np.arange(len(wall_seconds))[positions]
+        rows = rows[~invalid[rows]]
+        try:
+            zone = compile_zone(tz)
+        except pytz.UnknownTimeZoneError:
+            invalid[positions] = True
+            continue
+        seconds = wall_seconds[rows]
+        periods, unresolved = choose_periods(zone, calendar.segments(seconds, tz), seconds, ambiguous, nonexistent)
+        dst[rows] = (zone.dst[periods] != 0) & ~unresolved
+        invalid[rows] |= unresolved
+    return DstFlags(dst=dst, invalid=invalid)
+
+if __name__ == "__main__":
+    # Example Usage:
+    # Check if DST is in effect on '2023-07-01 12:00:00' in 'America/New_York' time zone
+    result = is_dst('2023-07-01 12:00:00', 'America/New_York')
+
+    # Print the result
+    if result:
+        print("Daylight Saving Time is in effect.")
+    else:
+        print("Daylight Saving Time is not in effect.")
@@ -0,0 +1,41 @@
+from .zone_catalog import shared_catalog
+
+def list_time_zones(query=None, limit=float('inf'), details=False, as_records=False):
+    """
+    List available time zones.
+
+    This function returns a list of time zone names that are available in Python.
+    The user can filter the list based on a query, limit the number of results, 
+    and request additional details like abbreviations and current offsets.
+    Names are looked up in a sorted catalog indexed once per process (see zone_catalog.ZoneCatalog),
+    and details are refreshed only when a zone crosses a transition.
+
+    Parameters:
+    query (str, optional): Query string to filter the time zone names (case-insensitive substring match).
+                           Default is None, which means no filtering.
+    limit (int, optional): The maximum number of time zones to return.
+                           Default is float('inf'), which means return all available time zones.
+    details (bool, optional): Whether to include time zone abbreviations and current offsets.
+                              Default is False.
+    as_records (bool, optional): Whether to return the details as ZoneRecord tuples (name, abbreviation,
+                                 utc_offset in seconds, offset text) instead of "name abbreviation offset"
+                                 strings. Implies details. Default is False.
+
+    Returns:
+    List[str] or List[ZoneRecord]: A list of time zone names, optionally including abbreviations and offsets.
+    """
+    # Filter and sort through the catalog, limiting the number of time zones returned
+    time_zones = shared_catalog.search(query, None if limit == float('inf') else int(limit))
+    
+    # Optionally include time zone abbreviations and current offsets
+    if details or as_records:
+        records = shared_catalog.details(time_zones)
+        return records if as_records else [str(record) for record in records]
+    
+    return time_zones
+
+if __name__ == "__main__":
+    # Example usage:
+    available_time_zones = list_time_zones(query="America", limit=5, details=True)
+    print(available_time_zones)
+    print(list_time_zones(query="new_y", as_records=True))
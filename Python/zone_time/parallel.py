@@ -0,0 +1,169 @@
+import os
+import sys
+
+from ._lazy import np
+
+from .batch_convert import BatchResult, from_utc_batch, to_utc_batch
+from .zone_engine import compile_zone
+
+_CONVERTERS = {"to_utc": to_utc_batch, "from_utc": from_utc_batch}
+
+
+def _share(array):
+    # Copy an array into a new shared memory block and describe it for the workers
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _convert_rows(direction, start, stop, blocks, specs, zone_names, abbreviations, policies):
+    arrays = {key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=blocks[key].buf)
+              for key, (_, shape, dtype) in specs.items()}
+    times = arrays["times"][start:stop]
+    if times.dtype.kind == "i":
+        times = times.view("datetime64[us]")
+    if "zone_codes" in arrays:
+        zones = np.asarray(zone_names, dtype=object)[arrays["zone_codes"][start:stop]]
+    else:
+        zones = zone_names[0]
+    result = _CONVERTERS[direction](times, zones, **policies)
+    arrays["values"][start:stop] = result.values.view(np.int64)
+    arrays["invalid"][start:stop] = result.invalid
+    arrays["errors"][start:stop] = result.errors
+    if result.tzname is not None:
+        index = {name: code for code, name in enumerate(abbreviations)}
+        index[None] = -1
+        arrays["tzname_codes"][start:stop] = np.fromiter(
+            map(index.__getitem__, result.tzname), dtype=np.int32, count=stop - start)
+
+
+def _convert_shard(task):
+    # Worker: convert rows [start, stop) of the shared inputs and write into the shared outputs
+    from multiprocessing import shared_memory
+    direction, start, stop, specs, zone_names, abbreviations, policies = task
+    # Pool workers share the parent's resource tracker, and the parent unlinks the blocks
+    blocks = {key: shared_memory.SharedMemory(name=spec[0]) for key, spec in specs.items()}
+    try:
+        _convert_rows(direction, start, stop, blocks, specs, zone_names, abbreviations, policies)
+    finally:
+        for block in blocks.values():
+            block.close()
+
+
+def worker_pool(workers=None):
+    """
+    Start a process pool suitable for the executor argument of convert_parallel.
+
+    On POSIX the shared memory resource tracker is started first, so the workers share it with this
+    process rather than each starting their own, which would report the blocks as leaked at exit.
+
+    Parameters:
+    workers (int, optional): The number of worker processes. Default is None, which uses os.cpu_count().
+
+    Returns:
+    concurrent.futures.ProcessPoolExecutor: The pool. Shut it down (or use it as a context manager) when done.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    if sys.platform != "win32":
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+
+def convert_parallel(times, timezones, direction="to_utc", workers=None, shard_size=None, executor=None,
+                     ambiguous="standard", nonexistent="standard"):
+    """
+    Run to_utc_batch or from_utc_batch over shards of the input in a process pool.
+
+    The inputs are copied once into shared memory blocks that every worker maps, and the workers write
+    their results straight into shared output arrays, so no row data is pickled between processes.
+    Results come back in input order.
+
+    Parameters:
+    times (array-like of str or np.ndarray of datetime64): The times to convert, as for to_utc_batch.
+    timezones (str or array-like of str): A single time zone for all times, or one time zone per time.
+    direction (str): "to_utc" or "from_utc". Default is "to_utc".
+    workers (int, optional): The number of worker processes. Default is None, which uses os.cpu_count().
+    shard_size (int, optional): Rows per task. Default is None, which splits the input into four shards per worker.
+    executor (concurrent.futures.ProcessPoolExecutor, optional): An existing pool to run on, to avoid
+                                                                  starting processes on every call. Create it
+                                                                  with worker_pool.
+    ambiguous (str): Policy for ambiguous wall times, as for to_utc_batch. Default is "standard".
+    nonexistent (str): Policy for non-existent wall times, as for to_utc_batch. Default is "standard".
+
+    Returns:
+    BatchResult: Same as to_utc_batch or from_utc_batch on the whole input.
+
+    Raises:
+    ValueError: If direction is unknown or the lengths of times and timezones differ.
+    pytz.AmbiguousTimeError, pytz.NonExistentTimeError: As for to_utc_batch, from the shard that met the time.
+    """
+    if direction not in _CONVERTERS:
+        raise ValueError("direction must be either 'to_utc' or 'from_utc'.")
+    policies = {"ambiguous": ambiguous, "nonexistent": nonexistent} if direction == "to_utc" else {}
+    workers = workers or os.cpu_count() or 1
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        times = times.astype("datetime64[us]").view(np.int64)
+    elif times.dtype.kind != "U":
+        times = times.astype(str)
+    size = len(times)
+
+    if isinstance(timezones, str):
+        zone_names, zone_codes = [timezones], None
+    else:
+        if len(timezones) != size:
+            raise ValueError("Length of zones must be either 1 or equal to the number of values.")
+        index = {}
+        zone_codes = np.fromiter((index.setdefault(zone, len(index)) for zone in timezones),
+                                 dtype=np.int32, count=size)
+        zone_names = list(index)
+
+    # Every abbreviation the workers may produce, so they can return codes instead of strings
+    abbreviations = []
+    if direction == "from_utc":
+        known = set()
+        for name in zone_names:
+            try:
+                known.update(compile_zone(name).tzname)
+            except Exception:
+                pass
+        abbreviations = sorted(known)
+
+    blocks = []
+    try:
+        specs = {}
+        outputs = {"values": np.zeros(size, dtype=np.int64), "invalid": np.zeros(size, dtype=bool),
+                   "errors": np.zeros(size, dtype=np.uint8)}
+        if direction == "from_utc":
+            outputs["tzname_codes"] = np.zeros(size, dtype=np.int32)
+        inputs = {"times": times}
+        if zone_codes is not None:
+            inputs["zone_codes"] = zone_codes
+        for key, array in list(inputs.items()) + list(outputs.items()):
+            block, specs[key] = _share(array)
+            blocks.append(block)
+
+        shard_size = shard_size or max(1, -(-size // (workers * 4)))
+        tasks = [(direction, start, min(start + shard_size, size), specs, zone_names, abbreviations, policies)
+                 for start in range(0, size, shard_size)]
+        if executor is not None:
+            list(executor.map(_convert_shard, tasks))
+        else:
+            with worker_pool(workers) as pool:
+                list(pool.map(_convert_shard, tasks))
+
+        results = {key: np.ndarray(size, dtype=outputs[key].dtype, buffer=block.buf).copy()
+                   for key, block in zip(specs, blocks) if key in outputs}
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    tzname = None
+    if direction == "from_utc":
+        table = np.array(abbreviations + [None], dtype=object)
+        tzname = table[results["tzname_codes"]]
+    return BatchResult(values=results["values"].view("datetime64[us]"), tzname=tzname, invalid=results["invalid"],
+                       errors=results["errors"])
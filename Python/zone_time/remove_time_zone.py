@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+from ._lazy import pytz
+
+from .array_interop import array_kind, read_timestamps, retag, wall_ticks, write_timestamps
+
+KEEP = ("wall", "utc")
+
+def remove_time_zone(datetime_obj, keep="wall"):
+    """
+    Remove the timezone attribute from a datetime object.
+
+    The time zone is dropped without a round trip through strings, so microseconds (and the nanoseconds of
+    pandas values) are kept. pandas Series and DatetimeIndex values of a tz-aware dtype are converted on
+    their int64 data in one vectorized step, and so are Arrow timestamp arrays; NumPy datetime64 arrays and
+    naive values are returned unchanged. Object Series are converted element by element.
+
+    Args:
+    datetime_obj (datetime, pd.Series, pd.DatetimeIndex, pyarrow timestamp array or np.ndarray of datetime64):
+        a datetime object with or without a timezone attribute, or a collection of them.
+    keep (str): "wall" (default) keeps the wall-clock time in the object's own time zone; "utc" keeps the
+        instant, as a naive UTC time.
+
+    Returns:
+    datetime: a datetime object without a timezone attribute, or a collection of the same kind (and unit).
+
+    Raises:
+    ValueError: If keep is not "wall" or "utc".
+    """
+    if keep not in KEEP:
+        raise ValueError(f"keep must be one of {KEEP}, got {keep!r}.")
+    
+    if array_kind(datetime_obj):
+        timestamps = read_timestamps(datetime_obj)
+        if timestamps.tz is None:
+            return datetime_obj
+        if keep == "utc":
+            # Arrow stores instants as UTC ticks: dropping the zone is a change of type
+            return retag(datetime_obj, None)
+        local = wall_ticks(timestamps, [(timestamps.tz, slice(None))])
+        return write_timestamps(datetime_obj, local, timestamps.unit, None, timestamps.valid)
+    
+    if type(datetime_obj).__module__.startswith("pandas") and hasattr(datetime_obj, "dtype"):
+        return _remove_from_pandas(datetime_obj, keep)
+    
+    if datetime_obj.tzinfo is None:
+        return datetime_obj
+    if keep == "utc":
+        datetime_obj = datetime_obj.astimezone(timezone.utc)
+    return datetime_obj.replace(tzinfo=None)
+
+def _remove_from_pandas(values, keep):
+    # Series or DatetimeIndex: vectorized for tz-aware dtypes, element by element for objects
+    accessor = values.dt if hasattr(values, "dt") else values
+    if getattr(values.dtype, "tz", None) is not None:
+        # tz_localize(None) keeps the wall clock; tz_convert(None) keeps the instant in UTC
+        return accessor.tz_localize(None) if keep == "wall" else accessor.tz_convert(None)
+    if values.dtype == object:
+        return values.map(lambda value: remove_time_zone(value, keep) if hasattr(value, "tzinfo") else value)
+    return values
+
+if __name__ == "__main__":
+    # Create a single datetime object with a timezone
+    datetime_with_tz = datetime(2023, 9, 23, 12, 0, 0, tzinfo=pytz.timezone("America/New_York"))
+
+    # Print the datetime object with timezone and its timezone attribute
+    print("Datetime with Timezone:")
+    print(datetime_with_tz)
+    print("Timezone attribute of datetime_with_tz:", datetime_with_tz.tzinfo, "\n")
+
+    # Apply the remove_time_zone function
+    datetime_without_tz = remove_time_zone(datetime_with_tz)
+
+    # Print the resulting datetime object without timezone and check its timezone attribute
+    print("Datetime without Timezone:")
+    print(datetime_without_tz)
+    print("Timezone attribute of datetime_without_tz:", datetime_without_tz.tzinfo, "\n")
+
+    # Example usage:
+    # List first 5 available timezones with 'America' in their name
+    available_time_zones = [tz for tz in pytz.all_timezones if 'America' in tz][:5]
+    print("Available time zones:")
+    print(available_time_zones)
@@ -0,0 +1,293 @@
+"""
+Streaming time zone conversion for CSV and Parquet files.
+
+Reads the input chunk by chunk, converts a time column with the batched converters and writes
+each chunk out before reading the next, so memory use depends on the chunk size only.
+
+Usage:
+    zone-time-convert events.csv events_utc.csv --time-column time --tz-column tz
+    zone-time-convert events.parquet local.parquet --time-column ts --tz Europe/Paris --direction from_utc
+
+(or "python -m zone_time.stream_convert" in place of "zone-time-convert").
+"""
+from contextlib import ExitStack
+import os
+import sys
+import time
+
+from ._lazy import pd
+
+from .batch_convert import error_counts, format_timestamps, from_utc_batch, to_utc_batch
+from .dst_calendar import AMBIGUOUS_POLICIES, NONEXISTENT_POLICIES
+
+FORMATS = ("csv", "parquet")
+
+
+def _file_format(path, file_format):
+    if file_format is not None:
+        if file_format not in FORMATS:
+            raise ValueError(f"Unsupported file format: {file_format}. Use one of {FORMATS}.")
+        return file_format
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension in ("parquet", "pq"):
+        return "parquet"
+    if extension in ("csv", "txt"):
+        return "csv"
+    raise ValueError(f"Cannot tell the file format of {path!r}. Pass it explicitly.")
+
+
+def _import_parquet():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Reading or writing Parquet files requires pyarrow. Install it with 'pip install pyarrow'.")
+    return pyarrow, pyarrow.parquet
+
+
+def read_chunks(path, chunksize, file_format=None, columns=None):
+    """
+    Read a CSV or Parquet file as a sequence of DataFrames.
+
+    Parameters:
+    path (str): The file to read.
+    chunksize (int): The number of rows per chunk.
+    file_format (str, optional): "csv" or "parquet". Default is None, which infers it from the file extension.
+    columns (List[str], optional): Columns to read as strings, e.g. the time and time zone columns.
+
+    Returns:
+    Iterator[pd.DataFrame]: The chunks, in file order.
+    """
+    if _file_format(path, file_format) == "csv":
+        dtype = {column: str for column in columns or []}
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=dtype)
+        return
+    _, parquet = _import_parquet()
+    for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunksize):
+        yield batch.to_pandas()
+
+
+class ChunkWriter:
+    """
+    Write DataFrames to a CSV or Parquet file one chunk at a time.
+
+    Parameters:
+        path (str): The file to write. It is overwritten.
+        file_format (str, optional): "csv" or "parquet". Default is None, which infers it from the file extension.
+    """
+
+    def __init__(self, path, file_format=None):
+        self.path = path
+        self.file_format = _file_format(path, file_format)
+        self._writer = None
+        self._schema = None
+        self._started = False
+
+    def write(self, chunk):
+        """
+        Append one chunk to the file, writing the header or schema with the first chunk.
+
+        Parameters:
+        chunk (pd.DataFrame): The rows to write.
+        """
+        if self.file_format == "csv":
+            chunk.to_csv(self.path, mode="a" if self._started else "w", header=not self._started, index=False)
+        else:
+            pyarrow, parquet = _import_parquet()
+            table = pyarrow.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+            if self._writer is None:
+                # A column with no values in the first chunk, such as the output when no row converted,
+                # comes out with type null, which no later chunk could be cast to; such columns hold strings
+                self._schema = pyarrow.schema(
+                    [field.with_type(pyarrow.string()) if pyarrow.types.is_null(field.type) else field
+                     for field in table.schema],
+                    metadata=table.schema.metadata,
+                )
+                table = table.cast(self._schema)
+                self._writer = parquet.ParquetWriter(self.path, self._schema)
+            self._writer.write_table(table)
+        self._started = True
+
+    def close(self):
+        """
+        Finish the file. A CSV file with no chunks written is left empty.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif not self._started and self.file_format == "csv":
+            open(self.path, "w").close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def convert_chunk(chunk, time_column, tz_column=None, tz=None, direction="to_utc", output_column=None,
+                  executor=None, ambiguous="standard", nonexistent="standard", error_column=None):
+    """
+    Convert the time column of one DataFrame chunk.
+
+    Parameters:
+    chunk (pd.DataFrame): The chunk to convert. It is modified in place.
+    time_column (str): The column holding the times as "YYYY-MM-DD HH:MM:SS" strings.
+    tz_column (str, optional): The column holding one time zone per row.
+    tz (str, optional): A single time zone for all rows, used when tz_column is not given.
+    direction (str): "to_utc" to convert local times to UTC, or "from_utc" to convert UTC times to local time.
+                     Default is "to_utc".
+    output_column (str, optional): The column to write the result to. Default is time_column with
+                                   "_utc" or "_local" appended.
+    executor (concurrent.futures.ProcessPoolExecutor, optional): A pool from parallel.worker_pool to
+                                                                  convert the chunk on. Default is None.
+    ambiguous (str): Policy for ambiguous local times when direction is "to_utc". See to_utc_batch.
+    nonexistent (str): Policy for non-existent local times when direction is "to_utc". See to_utc_batch.
+    error_column (str, optional): A column to write the per-row error codes (BatchResult.errors) to.
+                                  Default is None, which leaves them out.
+
+    Returns:
+    Tuple[pd.DataFrame, BatchResult]: The chunk and the conversion result. Rows that could not be
+    converted are left empty.
+    """
+    zones = chunk[tz_column].to_numpy(dtype=object) if tz_column is not None else tz
+    times = chunk[time_column].to_numpy(dtype=object)
+    policies = {"ambiguous": ambiguous, "nonexistent": nonexistent} if direction == "to_utc" else {}
+    if executor is not None:
+        from .parallel import convert_parallel
+        result = convert_parallel(times, zones, direction, executor=executor, **policies)
+    elif direction == "to_utc":
+        result = to_utc_batch(times, zones, **policies)
+    else:
+        result = from_utc_batch(times, zones)
+    if direction == "to_utc":
+        formatted = format_timestamps(result.values, "+0000")
+    else:
+        formatted = format_timestamps(result.values, " " + result.tzname.astype(str))
+    if output_column is None:
+        output_column = f"{time_column}_{'utc' if direction == 'to_utc' else 'local'}"
+    chunk[output_column] = formatted
+    if error_column is not None:
+        chunk[error_column] = result.errors
+    return chunk, result
+
+
+def convert_file(source, destination, time_column, tz_column=None, tz=None, direction="to_utc",
+                 output_column=None, chunksize=100_000, source_format=None, destination_format=None,
+                 progress=None, workers=None, ambiguous="standard", nonexistent="standard", error_column=None):
+    """
+    Convert the time column of a CSV or Parquet file, streaming it chunk by chunk.
+
+    Parameters:
+    source (str): The file to read.
+    destination (str): The file to write. It is overwritten.
+    time_column (str): The column holding the times as "YYYY-MM-DD HH:MM:SS" strings.
+    tz_column (str, optional): The column holding one time zone per row.
+    tz (str, optional): A single time zone for all rows, used when tz_column is not given.
+    direction (str): "to_utc" or "from_utc". Default is "to_utc".
+    output_column (str, optional): The column to write the result to. See convert_chunk.
+    chunksize (int): The number of rows held in memory at a time. Default is 100,000.
+    source_format (str, optional): "csv" or "parquet". Default is None, which infers it from the extension.
+    destination_format (str, optional): "csv" or "parquet". Default is None, which infers it from the extension.
+    progress (callable, optional): Called after every chunk with the rows done so far and the elapsed seconds.
+    workers (int, optional): Convert each chunk on a pool of this many processes. Default is None (in-process).
+    ambiguous (str): Policy for ambiguous local times when direction is "to_utc". See to_utc_batch.
+    nonexistent (str): Policy for non-existent local times when direction is "to_utc". See to_utc_batch.
+    error_column (str, optional): A column to write the per-row error codes to. See convert_chunk.
+
+    Returns:
+    dict: rows, invalid_rows, errors (rows per error name, see batch_convert.error_counts), seconds and
+          rows_per_second for the whole file.
+
+    Raises:
+    ValueError: If neither or both of tz_column and tz are given, or direction is unknown.
+    """
+    if (tz_column is None) == (tz is None):
+        raise ValueError("Provide exactly one of tz_column and tz.")
+    if direction not in ("to_utc", "from_utc"):
+        raise ValueError("direction must be either 'to_utc' or 'from_utc'.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+
+    columns = [time_column] + ([tz_column] if tz_column is not None else [])
+    rows = invalid_rows = 0
+    errors = {}
+    start = time.perf_counter()
+    with ExitStack() as stack:
+        writer = stack.enter_context(ChunkWriter(destination, destination_format))
+        executor = None
+        if workers is not None and workers > 1:
+            from .parallel import worker_pool
+            executor = stack.enter_context(worker_pool(workers))
+        for chunk in read_chunks(source, chunksize, source_format, columns):
+            chunk, result = convert_chunk(chunk, time_column, tz_column, tz, direction, output_column, executor,
+                                          ambiguous, nonexistent, error_column)
+            writer.write(chunk)
+            rows += len(chunk)
+            invalid_rows += int(result.invalid.sum())
+            for name, count in error_counts(result.errors).items():
+                errors[name] = errors.get(name, 0) + count
+            if progress is not None:
+                progress(rows, time.perf_counter() - start)
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "invalid_rows": invalid_rows,
+        "errors": errors,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds else 0.0,
+    }
+
+
+def print_progress(rows, seconds):
+    """
+    Progress callback that reports rows done and throughput on stderr.
+
+    Parameters:
+    rows (int): The rows converted so far.
+    seconds (float): The elapsed time in seconds.
+    """
+    rate = rows / seconds if seconds else 0.0
+    print(f"{rows:,} rows, {rate:,.0f} rows/s", file=sys.stderr)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert a time column of a CSV or Parquet file between local time and UTC.")
+    parser.add_argument("source", help="input CSV or Parquet file")
+    parser.add_argument("destination", help="output CSV or Parquet file (overwritten)")
+    parser.add_argument("--time-column", required=True, help="column holding 'YYYY-MM-DD HH:MM:SS' times")
+    zone = parser.add_mutually_exclusive_group(required=True)
+    zone.add_argument("--tz-column", help="column holding one time zone per row")
+    zone.add_argument("--tz", help="a single time zone for every row")
+    parser.add_argument("--direction", choices=("to_utc", "from_utc"), default="to_utc")
+    parser.add_argument("--output-column", help="column for the result (default: TIME_COLUMN_utc or TIME_COLUMN_local)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per chunk (default: 100000)")
+    parser.add_argument("--source-format", choices=FORMATS)
+    parser.add_argument("--destination-format", choices=FORMATS)
+    parser.add_argument("--workers", type=int, help="worker processes per chunk (default: convert in-process)")
+    parser.add_argument("--ambiguous", choices=AMBIGUOUS_POLICIES, default="standard",
+                        help="policy for local times that occur twice (to_utc only, default: standard)")
+    parser.add_argument("--nonexistent", choices=NONEXISTENT_POLICIES, default="standard",
+                        help="policy for local times skipped by DST (to_utc only, default: standard)")
+    parser.add_argument("--error-column", help="column for per-row error codes (default: none)")
+    parser.add_argument("--quiet", action="store_true", help="do not report progress")
+    args = parser.parse_args(argv)
+
+    summary = convert_file(
+        args.source, args.destination, args.time_column,
+        tz_column=args.tz_column, tz=args.tz, direction=args.direction, output_column=args.output_column,
+        chunksize=args.chunksize, source_format=args.source_format, destination_format=args.destination_format,
+        progress=None if args.quiet else print_progress, workers=args.workers,
+        ambiguous=args.ambiguous, nonexistent=args.nonexistent, error_column=args.error_column,
+    )
+    print(f"Converted {summary['rows']:,} rows ({summary['invalid_rows']:,} invalid) in {summary['seconds']:.1f}s, "
+          f"{summary['rows_per_second']:,.0f} rows/s", file=sys.stderr)
+    if summary["errors"]:
+        print("Flagged rows: " + ", ".join(f"{name} {count:,}" for name, count in summary["errors"].items()),
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+from ._lazy import np, pd, pytz
+from datetime import datetime
+import time
+
+from .zone_engine import compile_zone
+from .zone_registry import validate_zones
+
+_MINUTES_DTYPE = "int16"  # Offset differences stay within +-26 hours, 1560 minutes
+
+def time_difference(tz1_list, tz2_list, at=None):
+    """
+    Calculate Time Difference between Time Zones
+    
+    This function calculates the absolute time difference in minutes between pairs of time zones.
+    The function takes two lists of time zone names as input, and for each pair, it calculates 
+    the time difference based on the UTC offset difference of each time zone.
+    All pairs are evaluated at the same instant, and each distinct zone's offset is looked up once.
+    
+    :param tz1_list: List of strings, representing the first set of time zones.
+    :param tz2_list: List of strings, representing the second set of time zones.
+                    The length of tz2_list should be the same as tz1_list.
+    :param at: The instant to evaluate the offsets at: an aware datetime, a naive datetime or string taken
+               as UTC, or None (default) for the current time.
+    :return: A list of integers representing the time difference in minutes between each pair of time zones.
+    """
+    if len(tz1_list) != len(tz2_list):
+        raise ValueError("Both lists must have the same length.")
+    
+    if not (validate_zones(tz1_list).all() and validate_zones(tz2_list).all()):
+        raise ValueError("Invalid time zone provided.")
+    
+    # One reference instant for the whole batch
+    instant = _utc_seconds(None if at is None else [at])
+    zones = list(set(tz1_list) | set(tz2_list))
+    offsets = dict(zip(zones, _offset_table(zones, instant)[:, 0].tolist()))
+    
+    # Calculate the UTC offset difference in minutes
+    return [round(abs((offsets[tz1] - offsets[tz2]) / 60)) for tz1, tz2 in zip(tz1_list, tz2_list)]
+
+def _utc_seconds(instants):
+    # int64 UTC seconds since the Unix epoch; naive values are taken as UTC, None means now
+    if instants is None:
+        return np.array([int(time.time())], dtype=np.int64)
+    if not pd.api.types.is_list_like(instants):
+        instants = [instants]
+    index = pd.to_datetime(pd.Index(instants), utc=True)
+    if index.hasnans:
+        raise ValueError("Instants must not contain missing values.")
+    return np.asarray(index.tz_convert(None), dtype="datetime64[s]").astype(np.int64)
+
+def zone_offset_table(zones, instants=None):
+    """
+    Look up the UTC offset of each zone at each instant.
+    
+    Each distinct zone is compiled once and resolved for all instants with one binary search.
+    
+    :param zones: List of strings, representing the time zones.
+    :param instants: The instants, as datetime64 values, datetimes, strings or a pandas DatetimeIndex.
+                     Naive values are taken as UTC. Default is None, which uses the current time.
+    :return: An int32 array of UTC offsets in seconds, of shape (len(zones), len(instants)).
+    :raises ValueError: If a time zone is invalid or an instant is missing.
+    """
+    zones = list(zones)
+    if not validate_zones(zones).all():
+        raise ValueError("Invalid time zone provided.")
+    return _offset_table(zones, _utc_seconds(instants))
+
+def _offset_table(zones, seconds):
+    table = np.empty((len(zones), len(seconds)), dtype=np.int32)
+    rows = {}
+    for row, tz in enumerate(zones):
+        if tz in rows:
+            table[row] = table[rows[tz]]
+            continue
+        rows[tz] = row
+        zone = compile_zone(tz)
+        table[row] = zone.utcoffset[zone.utc_periods(seconds)]
+    return table
+
+def time_difference_matrix(zones, instants=None, absolute=False, chunk_size=64):
+    """
+    Calculate the Time Difference between Every Pair of Time Zones at Many Instants
+    
+    Entry [i, j, t] is the UTC offset of zones[i] minus that of zones[j] at instants[t], in minutes,
+    rounded to the nearest minute like time_difference. Every zone's offset is computed once per
+    instant (see zone_offset_table) and all pairs are evaluated at the same instants. The result has
+    len(zones) ** 2 * len(instants) int16 entries, e.g. 175 MB for 100 zones over every hour of a year;
+    it is filled chunk_size rows of zones at a time to bound the temporary memory.
+    
+    :param zones: List of strings, representing the time zones.
+    :param instants: The instants, as datetime64 values, datetimes, strings or a pandas DatetimeIndex
+                     (e.g. pd.date_range("2027-01-01", periods=8760, freq="h", tz="UTC")). Naive values
+                     are taken as UTC. Default is None, which uses the current time.
+    :param absolute: Whether to return the absolute difference, as time_difference does. Default is False.
+    :param chunk_size: The number of rows of zones to compute at once. Default is 64.
+    :return: An int16 array of minute differences, of shape (len(zones), len(zones), len(instants)).
+    :raises ValueError: If a time zone is invalid or an instant is missing.
+    """
+    offsets = zone_offset_table(zones, instants)
+    count, instant_count = offsets.shape
+    result = np.empty((count, count, instant_count), dtype=_MINUTES_DTYPE)
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        difference = (offsets[start:stop, None, :] - offsets[None, :, :]) / 60
+        if absolute:
+            np.abs(difference, out=difference)
+        # Round half to even, as round() does in time_difference
+        np.rint(difference, out=difference)
+        result[start:stop] = difference
+    return result
+
+if __name__ == "__main__":
+    # Example usage:
+    tz1_list = ["America/New_York", "Asia/Tokyo"]
+    tz2_list = ["Europe/London", "Europe/Berlin"]
+
+    # Calculate time difference in minutes and formatted
+    time_diff_minutes = time_difference(tz1_list, tz2_list)
+    time_diff_formatted = [f"{mins // 60} hours and {mins % 60} minutes" for mins in time_diff_minutes]
+
+    # Print the current time in each time zone for verification
+    current_time_tz1 = [str(datetime.now(pytz.timezone(tz))) for tz in tz1_list]
+    current_time_tz2 = [str(datetime.now(pytz.timezone(tz))) for tz in tz2_list]
+
+    # Create the resulting dataframe (you need pandas library for this)
+    df = pd.DataFrame({
+        'tz1': tz1_list,
+        'tz2': tz2_list,
+        'time_diff_minutes': time_diff_minutes,
+        'time_diff_formatted': time_diff_formatted,
+        'current_time_tz1': current_time_tz1,
+        'current_time_tz2': current_time_tz2,
+    })
+
+    print(df)
@@ -0,0 +1,204 @@
+from collections import namedtuple
+from datetime import datetime
+import time
+import warnings
+
+from ._lazy import np, pd, pytz
+
+from .array_interop import array_kind, read_timestamps, zone_groups
+from .dst_calendar import check_policies, localize, localize_one
+from .timestamp_formatter import format_offset
+from .zone_engine import SMALL_BATCH, compile_zone, to_seconds, utc_lookup_one
+from .zone_registry import validate_zones
+
+KINDS = ("utc", "wall")
+
+
+class ZoneOffsets(namedtuple("ZoneOffsets", ["seconds", "invalid_zone", "invalid", "text"])):
+    """
+    Result of time_zone_offsets.
+
+    Attributes:
+        seconds (np.ndarray): int32 UTC offsets in seconds, 0 for invalid rows.
+        invalid_zone (np.ndarray): Boolean array, True where the time zone is not known.
+        invalid (np.ndarray): Boolean array, True where the row has no offset: an unknown time zone,
+                              a missing time, or a wall time a policy of "NaT" left unresolved.
+        text (np.ndarray or None): object array of "+HH:MM" strings (None for invalid rows), or None
+                                   unless asked for.
+    """
+
+    __slots__ = ()
+
+
+def _instant_seconds(instants):
+    # int64 whole seconds, the missing mask and whether the values are instants (tz-aware)
+    if array_kind(instants):
+        timestamps = read_timestamps(instants)
+        missing = np.zeros(len(timestamps.values), dtype=bool) if timestamps.valid is None else ~timestamps.valid
+        return timestamps.seconds, missing, timestamps.tz is not None
+    if not pd.api.types.is_list_like(instants):
+        instants = [instants]
+    try:
+        index = pd.to_datetime(pd.Index(instants), errors="coerce")
+    except (TypeError, ValueError):
+        # Aware values in several time zones
+        index = pd.to_datetime(pd.Index(instants), errors="coerce", utc=True)
+    aware = index.tz is not None
+    if aware:
+        index = index.tz_convert(None)
+    values = np.asarray(index, dtype="datetime64[s]")
+    missing = np.isnat(values)
+    return values.view(np.int64), missing, aware
+
+
+def time_zone_offsets(zones, instants=None, kind="utc", as_strings=False, ambiguous="standard",
+                      nonexistent="standard"):
+    """
+    Look up the UTC offsets of many time zones at many times in one pass.
+
+    Rows are grouped by time zone and each group is resolved with a binary search in the zone's
+    compiled transition table, so the cost is a few array operations per row. NumPy datetime64
+    arrays and Arrow timestamp arrays (and an Arrow string array of zones) are read without a
+    Python object per row. Unknown time zones and missing times are flagged in the result rather
+    than warned about or raised.
+
+    Parameters:
+    zones (str or array-like of str): A single time zone for all rows, or one time zone per row.
+    instants (optional): The times, as an np.ndarray of datetime64, a pyarrow timestamp array, a pandas
+                         Series or Index, or a list of datetimes or strings. Default is None, which uses
+                         the current time for every zone.
+    kind (str): How to read naive times: "utc" (default) as UTC instants, or "wall" as wall-clock times
+                in each row's time zone. Tz-aware times are always instants.
+    as_strings (bool): Whether to also render the offsets as "+HH:MM" strings. Default is False.
+    ambiguous (str): For kind "wall", the policy for times that occur twice, as in convert_to_utc.
+                     Default is "standard".
+    nonexistent (str): For kind "wall", the policy for times skipped by the clocks. Default is "standard".
+
+    Returns:
+    ZoneOffsets: int32 offsets in seconds, the invalid-zone and invalid-row masks and, if asked for,
+                 the strings.
+
+    Raises:
+    ValueError: If kind or a policy is unknown, or the lengths of zones and instants differ.
+    pytz.AmbiguousTimeError: If a time is ambiguous and ambiguous is "raise".
+    pytz.NonExistentTimeError: If a time does not exist and nonexistent is "raise".
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown kind: {kind}. Use one of {KINDS}.")
+    check_policies(ambiguous, nonexistent)
+    if instants is None:
+        size = 1 if isinstance(zones, str) else len(zones)
+        seconds, missing, aware = np.full(size, int(time.time()), dtype=np.int64), np.zeros(size, dtype=bool), True
+    else:
+        seconds, missing, aware = _instant_seconds(instants)
+    size = len(seconds)
+    if missing.any():
+        seconds = np.where(missing, 0, seconds)
+    if not isinstance(zones, str) and len(zones) != size:
+        raise ValueError("Length of zones must be either 1 or equal to the number of instants.")
+
+    offsets = np.zeros(size, dtype=np.int32)
+    invalid_zone = np.zeros(size, dtype=bool)
+    invalid = missing.copy()
+    for tz, positions in zone_groups(zones, size):
+        try:
+            zone = compile_zone(tz)
+        except pytz.UnknownTimeZoneError:
+            invalid_zone[positions] = True
+            continue
+        if aware or kind == "utc":
+            offsets[positions] = zone.utcoffset[zone.utc_periods(seconds[positions])]
+        else:
+            result = localize(seconds[positions], zone.name, ambiguous, nonexistent)
+            offsets[positions] = result.utcoffset
+            invalid[positions] |= result.unresolved
+    invalid |= invalid_zone
+    offsets[invalid] = 0
+
+    text = None
+    if as_strings:
+        # One string per distinct offset
+        distinct, inverse = np.unique(offsets, return_inverse=True)
+        text = np.array([format_offset(offset, ":") for offset in distinct], dtype=object)[inverse]
+        text[invalid] = None
+    return ZoneOffsets(offsets, invalid_zone, invalid, text)
+
+
+def time_zone_offset(tz_list, datetime_list=None, ambiguous="standard", nonexistent="standard"):
+    """
+    Calculate Time Zone Offset
+
+    This function calculates the offset in hours and minutes of a given time zone or list of time zones from UTC.
+    It returns None for invalid time zones and issues one UserWarning naming them. For many rows,
+    time_zone_offsets returns numeric offsets and an invalid-zone mask without warning.
+
+    Parameters:
+        tz_list (list): A list of strings representing the time zone(s) for which to calculate the offset.
+        datetime_list (list, optional): A list of datetime objects representing the datetime(s) for which to calculate the offset.
+                                         Naive datetimes are wall-clock times in the time zone; aware datetimes are
+                                         instants. Default is the current time.
+        ambiguous (str): Policy for naive datetimes that occur twice when clocks are wound back: "standard" (default,
+                         pytz's is_dst=False), "dst", "earliest", "latest", "raise" or "NaT" (return None).
+        nonexistent (str): Policy for naive datetimes skipped when clocks are wound forward: "standard" (default),
+                           "dst", "shift_forward", "raise" or "NaT" (return None).
+
+    Returns:
+        list: A list of strings representing the offset(s) from UTC in the format "+HH:MM" (e.g. "-03:30"),
+              with ":SS" appended for offsets with seconds.
+
+    Examples:
+        >>> time_zone_offset(["America/New_York", "Europe/London", "Asia/Tokyo"])
+    """
+    check_policies(ambiguous, nonexistent)
+    if datetime_list is None:
+        now = datetime.now(pytz.utc)
+        datetime_list = [now] * len(tz_list)
+
+    if len(datetime_list) != len(tz_list):
+        raise ValueError("Length of datetime_list and tz_list must be the same.")
+
+    valid = validate_zones(tz_list)
+    offsets = [None] * len(tz_list)
+    rows = {"wall": [], "utc": []}
+    invalid_zones = []
+    for i, (tz, dt, tz_is_valid) in enumerate(zip(tz_list, datetime_list, valid)):
+        if not tz_is_valid:
+            invalid_zones.append(tz)
+        elif dt.tzinfo is not None and dt.utcoffset() is not None:
+            rows["utc"].append((i, to_seconds((dt - dt.utcoffset()).replace(tzinfo=None))))
+        else:
+            rows["wall"].append((i, to_seconds(dt)))
+    if invalid_zones:
+        # One warning per call, as ZoneOffsets flags the rows instead of reporting each one
+        warnings.warn(f"Invalid time zone(s) detected: {', '.join(map(str, dict.fromkeys(invalid_zones)))}. "
+                      f"Returning None for these entries.", UserWarning, stacklevel=2)
+
+    if len(tz_list) < SMALL_BATCH:
+        # A few rows: look each one up directly rather than through arrays
+        for i, seconds in rows["utc"]:
+            offsets[i] = format_offset(utc_lookup_one(seconds, tz_list[i])[0], ":")
+        for i, seconds in rows["wall"]:
+            result = localize_one(seconds, tz_list[i], ambiguous, nonexistent)
+            if not result.unresolved:
+                offsets[i] = format_offset(result.utcoffset, ":")
+        return offsets
+
+    for kind, entries in rows.items():
+        if not entries:
+            continue
+        positions, seconds = zip(*entries)
+        result = time_zone_offsets([tz_list[i] for i in positions], np.array(seconds, dtype="datetime64[s]"),
+                                   kind, ambiguous=ambiguous, nonexistent=nonexistent)
+        for i, offset, unresolved in zip(positions, result.seconds.tolist(), result.invalid.tolist()):
+            if not unresolved:
+                offsets[i] = format_offset(offset, ":")
+
+    return offsets
+
+if __name__ == "__main__":
+    # Example usage:
+    tz_list = ["America/New_York", "Europe/London", "Asia/Tokyo", "America/St_Johns", "Invalid/TimeZone"]
+    datetime_list = [datetime.now() for _ in tz_list]
+    offsets = time_zone_offset(tz_list, datetime_list)
+    print(offsets)
+    print(time_zone_offsets(tz_list, np.array(datetime_list, dtype="datetime64[s]"), kind="wall", as_strings=True))
@@ -0,0 +1,167 @@
+import re
+
+from ._lazy import np
+
+from .zone_engine import compile_zone
+
+# Fixed-width numeric directives and their widths
+_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2, "f": 6}
+# Shorthands for runs of fixed-width directives
+_ALIASES = {"F": "%Y-%m-%d", "T": "%H:%M:%S"}
+# Directives that depend only on the transition period
+_PERIOD_DIRECTIVES = ("z", "Z")
+_DIRECTIVE = re.compile(r"%(.)|%$|[^%]+", re.S)
+_MICROS = 1_000_000
+# Microseconds since the Unix epoch at 1000-01-01 and 10000-01-01, the range of 4-digit years
+_YEAR_1000 = -30610224000 * _MICROS
+_YEAR_10000 = 253402300800 * _MICROS
+
+
+def compile_format(format_str):
+    """
+    Split a strftime format string into tokens the vectorized formatter can render.
+
+    Supported directives are %Y, %m, %d, %H, %M, %S, %f, %z, %Z, %F, %T and %%.
+
+    Parameters:
+    format_str (str): A strftime format string.
+
+    Returns:
+    List[Tuple[str, str]] or None: ("text", literal) and ("directive", letter) tokens, or None if the
+    format uses a directive that is not supported.
+    """
+    tokens = []
+    for match in _DIRECTIVE.finditer(format_str):
+        letter = match.group(1)
+        if match.group(0) == "%":
+            return None
+        if letter is None:
+            tokens.append(("text", match.group(0)))
+        elif letter == "%":
+            tokens.append(("text", "%"))
+        elif letter in _ALIASES:
+            tokens.extend(compile_format(_ALIASES[letter]))
+        elif letter in _WIDTHS or letter in _PERIOD_DIRECTIVES:
+            tokens.append(("directive", letter))
+        else:
+            return None
+    return tokens
+
+
+def format_offset(seconds, separator=""):
+    """
+    Render a UTC offset as strftime's %z does.
+
+    Parameters:
+    seconds (int): The UTC offset in seconds.
+    separator (str): The text between hours, minutes and seconds. Default is "", giving "+HHMM";
+                     ":" gives the ISO 8601 form "+HH:MM".
+
+    Returns:
+    str: The sign, hours and minutes, with seconds appended only when the offset has them
+         (local mean time), e.g. "-0330" or "+00:09:21".
+    """
+    sign = "-" if seconds < 0 else "+"
+    minutes, second = divmod(abs(int(seconds)), 60)
+    hours, minute = divmod(minutes, 60)
+    return f"{sign}{hours:02d}{separator}{minute:02d}" + (f"{separator}{second:02d}" if second else "")
+
+
+def _period_table(zone, letter):
+    # One string per transition period of the zone
+    if letter == "Z":
+        return np.array([str(name) for name in zone.tzname], dtype=str)
+    return np.array([format_offset(offset) for offset in zone.utcoffset], dtype=str)
+
+
+def _fields(local_micros):
+    # Calendar fields of wall-clock microseconds (H. Hinnant's civil_from_days)
+    seconds, microsecond = np.divmod(local_micros, _MICROS)
+    days, second_of_day = np.divmod(seconds, 86400)
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_index = (5 * day_of_year + 2) // 153
+    month = np.where(month_index < 10, month_index + 3, month_index - 9)
+    return {
+        "Y": year_of_era + era * 400 + (month <= 2),
+        "m": month,
+        "d": day_of_year - (153 * month_index + 2) // 5 + 1,
+        "H": second_of_day // 3600,
+        "M": second_of_day // 60 % 60,
+        "S": second_of_day % 60,
+        "f": microsecond,
+    }
+
+
+def _render_fixed(tokens, fields, size):
+    # Render a run of fixed-width tokens into one code-point matrix and view it as strings. The
+    # matrix is filled one character column at a time, each a contiguous row, then transposed once
+    widths = [len(value) if kind == "text" else _WIDTHS[value] for kind, value in tokens]
+    chars = np.empty((sum(widths), size), dtype=np.int32)
+    column = 0
+    for (kind, value), width in zip(tokens, widths):
+        if kind == "text":
+            for position, character in enumerate(value):
+                chars[column + position] = ord(character)
+        else:
+            rest = fields[value].astype(np.int32)
+            for position in range(width - 1, -1, -1):
+                rest, digit = np.divmod(rest, 10)
+                np.add(digit, ord("0"), out=chars[column + position])
+        column += width
+    return np.ascontiguousarray(chars.T).view(f"<U{column}").reshape(size)
+
+
+def format_instants(utc_micros, tz, format_str):
+    """
+    Format UTC instants as wall-clock strings of a time zone, without a per-row strftime call.
+
+    Zone abbreviations (%Z) and UTC offsets (%z) are rendered once per transition period of the zone
+    and picked per row; the date and time fields are computed with integer array arithmetic.
+
+    Parameters:
+    utc_micros (np.ndarray): int64 UTC instants in microseconds since the Unix epoch.
+    tz (str): A string representing the time zone.
+    format_str (str): A strftime format string.
+
+    Returns:
+    np.ndarray or None: Array of formatted strings, the same as datetime.strftime gives for each
+    instant in the zone, or None if the format or the dates are not supported (years outside
+    1000 to 9999), so the caller can fall back to strftime.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    tokens = compile_format(format_str)
+    if tokens is None:
+        return None
+    utc_micros = np.asarray(utc_micros, dtype=np.int64)
+    zone = compile_zone(tz)
+    if not len(utc_micros):
+        return np.array([], dtype=str)
+    periods = zone.utc_periods(utc_micros // _MICROS)
+    local = utc_micros + zone.utcoffset[periods] * _MICROS
+    if local.min() < _YEAR_1000 or local.max() >= _YEAR_10000:
+        return None
+
+    fields = _fields(local)
+    pieces = []
+    run = []
+    for token in tokens + [None]:
+        if token is not None and not (token[0] == "directive" and token[1] in _PERIOD_DIRECTIVES):
+            run.append(token)
+            continue
+        if run:
+            pieces.append(_render_fixed(run, fields, len(local)))
+            run = []
+        if token is not None:
+            pieces.append(_period_table(zone, token[1])[periods])
+    if not pieces:
+        return np.full(len(local), "", dtype=str)
+    result = pieces[0]
+    for piece in pieces[1:]:
+        result = np.char.add(result, piece)
+    return result
@@ -0,0 +1,204 @@
+from collections import namedtuple
+from datetime import datetime
+
+from ._lazy import np
+
+from .zone_engine import SMALL_BATCH, to_seconds
+
+# Character positions of the digits and separators in "YYYY-MM-DD HH:MM:SS"
+_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_SEPARATORS = {4: "-", 7: "-", 13: ":", 16: ":"}
+_BASE_LENGTH = 19
+_MAX_FRACTION = 9
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MICROSECOND_WEIGHTS = (100000, 10000, 1000, 100, 10, 1)
+
+
+class ParsedTimestamps(namedtuple("ParsedTimestamps", ["values", "utcoffset", "has_offset", "invalid"])):
+    """
+    Result of parse_timestamps.
+
+    Attributes:
+        values (np.ndarray): datetime64[us] array of the wall-clock times as written, NaT for invalid rows.
+        utcoffset (np.ndarray): int32 array of the UTC offsets in seconds written after the time, 0 where none.
+        has_offset (np.ndarray): Boolean array, True where the string carried a "Z" or "+HH:MM" offset.
+        invalid (np.ndarray): Boolean array, True where the string could not be parsed.
+    """
+
+    __slots__ = ()
+
+    @property
+    def invalid_positions(self):
+        """np.ndarray: The positions of the rows that could not be parsed."""
+        return np.flatnonzero(self.invalid)
+
+    @property
+    def seconds(self):
+        """np.ndarray: int64 wall-clock seconds since 1970-01-01 00:00, rounded down (0 for invalid rows)."""
+        micros = np.where(self.invalid, 0, self.values.view(np.int64))
+        return micros // 1_000_000
+
+    def utc(self):
+        """
+        Apply the parsed offsets.
+
+        Returns:
+        np.ndarray: datetime64[us] array of UTC instants where an offset was given, and the
+                    unchanged wall-clock time elsewhere.
+        """
+        return self.values - self.utcoffset.astype("timedelta64[s]")
+
+
+def _days_from_civil(year, month, day):
+    # Days since 1970-01-01 in the proleptic Gregorian calendar (H. Hinnant's algorithm)
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _code_points(values):
+    # View the strings as a (rows, width) matrix of code points, zero-padded on the right. Rows that
+    # are not strings become empty, so they are flagged invalid rather than parsed from their str()
+    if not (isinstance(values, np.ndarray) and values.dtype.kind == "U"):
+        if not all(issubclass(kind, str) for kind in set(map(type, values))):
+            values = ["" if not isinstance(value, str) else value for value in values]
+        values = np.asarray(values, dtype=str)
+    strings = np.ascontiguousarray(values).reshape(-1)
+    width = max(strings.dtype.itemsize // 4, 1)
+    chars = strings.view(np.int32).reshape(len(strings), width)
+    lengths = (chars != 0).sum(axis=1)
+    return chars, lengths
+
+
+def _pad(chars, width):
+    if chars.shape[1] >= width:
+        return chars
+    return np.concatenate([chars, np.zeros((len(chars), width - chars.shape[1]), dtype=chars.dtype)], axis=1)
+
+
+def parse_timestamps(values, fractional=True, offsets=True, separators=" T"):
+    """
+    Parse fixed-layout timestamp strings in bulk.
+
+    The layout is "YYYY-MM-DD HH:MM:SS", optionally followed by fractional seconds (".f" with 1 to 9
+    digits, kept to the microsecond) and a UTC offset ("Z", "+HH", "+HHMM" or "+HH:MM"). Every row is
+    parsed with array operations; malformed rows are flagged in the result instead of raising.
+
+    Parameters:
+    values (list, np.ndarray or pd.Series of str): The timestamp strings.
+    fractional (bool): Whether fractional seconds are allowed. Default is True.
+    offsets (bool): Whether UTC offsets are allowed. Default is True.
+    separators (str): The characters accepted between the date and the time. Default is " T".
+
+    Returns:
+    ParsedTimestamps: The wall-clock values, offsets and the invalid-row mask.
+    """
+    chars, lengths = _code_points(values)
+    n_rows = len(chars)
+    chars = _pad(chars, _BASE_LENGTH + 1)
+
+    digits = chars[:, _DIGITS] - ord("0")
+    valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+    for position, separator in _SEPARATORS.items():
+        valid &= chars[:, position] == ord(separator)
+    valid &= np.isin(chars[:, 10], [ord(separator) for separator in separators])
+    digits = np.where(valid[:, None], digits, 0).astype(np.int64)
+
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    month = digits[:, 4] * 10 + digits[:, 5]
+    day = digits[:, 6] * 10 + digits[:, 7]
+    hour = digits[:, 8] * 10 + digits[:, 9]
+    minute = digits[:, 10] * 10 + digits[:, 11]
+    second = digits[:, 12] * 10 + digits[:, 13]
+
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_month = np.array(_DAYS_IN_MONTH, dtype=np.int64)[np.clip(month, 0, 12)] + (leap & (month == 2))
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+
+    # Fractional seconds: "." followed by a run of digits
+    position = np.full(n_rows, _BASE_LENGTH)
+    microsecond = np.zeros(n_rows, dtype=np.int64)
+    has_fraction = chars[:, _BASE_LENGTH] == ord(".")
+    if has_fraction.any():
+        start = _BASE_LENGTH + 1
+        chars = _pad(chars, start + _MAX_FRACTION)
+        fraction = chars[:, start:start + _MAX_FRACTION] - ord("0")
+        is_digit = (fraction >= 0) & (fraction <= 9)
+        n_digits = np.where(has_fraction, np.cumprod(is_digit, axis=1).sum(axis=1), 0)
+        kept = np.arange(6) < np.minimum(n_digits, 6)[:, None]
+        microsecond = (np.where(kept, fraction[:, :6], 0) * np.array(_MICROSECOND_WEIGHTS, dtype=np.int64)).sum(axis=1)
+        valid &= ~has_fraction | ((n_digits >= 1) & fractional)
+        position = position + np.where(has_fraction, 1 + n_digits, 0)
+
+    # UTC offset: "Z", or a sign followed by HH, HHMM or HH:MM
+    utcoffset = np.zeros(n_rows, dtype=np.int64)
+    has_offset = np.zeros(n_rows, dtype=bool)
+    has_tail = lengths > position
+    if has_tail.any():
+        chars = _pad(chars, position.max() + 6)
+        tail = chars[np.arange(n_rows)[:, None], position[:, None] + np.arange(6)]
+        zulu = tail[:, 0] == ord("Z")
+        sign = np.where(tail[:, 0] == ord("-"), -1, 1)
+        offset_digits = tail[:, 1:6] - ord("0")
+        is_digit = (offset_digits >= 0) & (offset_digits <= 9)
+        colon = tail[:, 3] == ord(":")
+        # Minutes sit at tail[4:6] after a colon, at tail[3:5] without one
+        minute_digits = np.where(colon[:, None], offset_digits[:, 3:5], offset_digits[:, 2:4])
+        has_minutes = np.where(colon, is_digit[:, 3:5].all(axis=1), is_digit[:, 2:4].all(axis=1))
+        signed = ((tail[:, 0] == ord("+")) | (tail[:, 0] == ord("-"))) & is_digit[:, :2].all(axis=1)
+        offset_length = np.where(zulu, 1, np.where(has_minutes, np.where(colon, 6, 5), 3))
+        offset_hours = offset_digits[:, 0] * 10 + offset_digits[:, 1]
+        offset_minutes = np.where(has_minutes, minute_digits[:, 0] * 10 + minute_digits[:, 1], 0)
+        has_offset = (zulu | signed) & has_tail
+        valid &= ~has_offset | (offsets & (offset_hours < 24) & (offset_minutes < 60))
+        utcoffset = np.where(signed, sign * (offset_hours * 3600 + offset_minutes * 60), 0)
+        position = position + np.where(has_offset, offset_length, 0)
+    valid &= lengths == position
+
+    seconds = _days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+    micros = np.where(valid, seconds * 1_000_000 + microsecond, np.iinfo(np.int64).min)
+    return ParsedTimestamps(
+        values=micros.view("datetime64[us]"),
+        utcoffset=np.where(valid & has_offset, utcoffset, 0).astype(np.int32),
+        has_offset=has_offset & valid,
+        invalid=~valid,
+    )
+
+
+def parse_wall_seconds(values):
+    """
+    Parse "YYYY-MM-DD HH:MM:SS" strings to wall-clock seconds, accepting exactly what
+    datetime.strptime(value, "%Y-%m-%d %H:%M:%S") accepts.
+
+    Well-formed rows go through parse_timestamps; only the rows it rejects are retried with
+    datetime.strptime, so lenient input such as single-digit fields still parses, and rows that
+    strptime also rejects keep strptime's exception. Inputs of fewer than SMALL_BATCH rows skip the
+    array path, whose fixed cost would dominate, and use strptime for every row.
+
+    Parameters:
+    values (list, np.ndarray or pd.Series of str): The timestamp strings.
+
+    Returns:
+    Tuple[np.ndarray, dict]: int64 wall-clock seconds since 1970-01-01 00:00 (0 for failed rows), and a
+    dict mapping the position of each failed row to the exception strptime raised for it.
+    """
+    if len(values) < SMALL_BATCH:
+        seconds = np.zeros(len(values), dtype=np.int64)
+        positions = range(len(values))
+    else:
+        parsed = parse_timestamps(values, fractional=False, offsets=False, separators=" ")
+        seconds = parsed.seconds
+        positions = parsed.invalid_positions
+    errors = {}
+    if len(positions):
+        items = values.tolist() if hasattr(values, "tolist") else values
+        for position in positions:
+            try:
+                seconds[position] = to_seconds(datetime.strptime(items[position], "%Y-%m-%d %H:%M:%S"))
+            except Exception as e:
+                errors[int(position)] = e
+    return seconds, errors
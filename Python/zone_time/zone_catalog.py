@@ -0,0 +1,160 @@
+from collections import namedtuple
+from functools import lru_cache
+import threading
+
+from ._lazy import pytz
+
+from .timestamp_formatter import format_offset
+from .zone_clock import shared_clock
+
+_GRAM = 3  # Longest indexed substring; longer queries intersect their trigram lists
+# There are only a few hundred distinct offsets, so their %z texts are rendered once each
+_offset_label = lru_cache(maxsize=None)(format_offset)
+
+
+class ZoneRecord(namedtuple("ZoneRecord", ["name", "abbreviation", "utc_offset", "offset"])):
+    """
+    Current details of one time zone, as returned by ZoneCatalog.details.
+
+    Attributes:
+        name (str): The time zone name.
+        abbreviation (str): The abbreviation in effect now, e.g. "EDT".
+        utc_offset (int): The UTC offset in effect now, in seconds.
+        offset (str): The same offset as strftime's %z renders it, e.g. "-0400".
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.name} {self.abbreviation} {self.offset}"
+
+
+class ZoneCatalog:
+    """
+    Sorted, indexed catalog of time zone names for search-as-you-type.
+
+    The names are sorted and indexed once, on first use: every substring of up to three letters
+    (case-insensitive) maps to the sorted positions of the names containing it. A query of up to
+    three letters is one dictionary lookup; a longer one intersects the lists of its trigrams and
+    checks the few survivors, so results come out already sorted. Query results are cached.
+    Details come from a ZoneClock, which looks each zone up again only after its next transition.
+
+    Parameters:
+        names (iterable of str, optional): The names to catalog. Default is None, which uses
+                                           pytz.all_timezones.
+        clock (ZoneClock, optional): The clock to take current details from. Default is None,
+                                     which uses the shared clock.
+        cache_size (int): The number of query results to keep. Default is 1024.
+    """
+
+    def __init__(self, names=None, clock=None, cache_size=1024):
+        self._source = names
+        self.clock = clock or shared_clock
+        self._names = None
+        self._lower = None
+        self._index = None
+        self._lock = threading.Lock()
+        self._search = lru_cache(maxsize=cache_size)(self._find)
+
+    def _build(self):
+        with self._lock:
+            if self._names is not None:
+                return
+            names = tuple(sorted(set(pytz.all_timezones if self._source is None else self._source)))
+            lower = tuple(name.lower() for name in names)
+            index = {}
+            for position, name in enumerate(lower):
+                grams = {name[start:start + size] for size in range(1, _GRAM + 1)
+                         for start in range(len(name) - size + 1)}
+                for gram in grams:
+                    index.setdefault(gram, []).append(position)
+            self._index = {gram: tuple(positions) for gram, positions in index.items()}
+            self._lower = lower
+            self._names = names
+
+    @property
+    def names(self):
+        """
+        tuple of str: Every cataloged name, sorted.
+        """
+        if self._names is None:
+            self._build()
+        return self._names
+
+    def _find(self, query, prefix):
+        # Sorted positions of the names matching a lower-case query
+        if not query:
+            return tuple(range(len(self._names)))
+        if len(query) <= _GRAM:
+            positions = self._index.get(query, ())
+        else:
+            lists = sorted((self._index.get(query[start:start + _GRAM], ()) for start in range(len(query) - _GRAM + 1)),
+                           key=len)
+            candidates = set(lists[0]).intersection(*lists[1:])
+            positions = sorted(position for position in candidates if query in self._lower[position])
+        if prefix:
+            positions = [position for position in positions if self._lower[position].startswith(query)]
+        return tuple(positions)
+
+    def search(self, query=None, limit=None, prefix=False):
+        """
+        Find the names containing a query, case-insensitively, in sorted order.
+
+        Parameters:
+        query (str, optional): The text to look for. Default is None, which matches every name.
+        limit (int, optional): The maximum number of names to return. Default is None, no limit.
+        prefix (bool): Whether the names must start with the query rather than contain it. Default is False.
+
+        Returns:
+        List[str]: The matching names.
+        """
+        if self._names is None:
+            self._build()
+        positions = self._search((query or "").lower(), prefix)
+        if limit is not None:
+            positions = positions[:limit]
+        names = self._names
+        return [names[position] for position in positions]
+
+    def details(self, names):
+        """
+        Get the current abbreviation and UTC offset of time zones, all at the same instant.
+
+        Parameters:
+        names (iterable of str): The time zone names.
+
+        Returns:
+        List[ZoneRecord]: One record per name, in order.
+
+        Raises:
+        ValueError: If a name is not a valid time zone.
+        """
+        names = list(names)
+        records = []
+        for name, (now, abbreviation) in zip(names, self.clock.now_many(names)):
+            utc_offset = int(now.utcoffset().total_seconds())
+            records.append(ZoneRecord(name, abbreviation, utc_offset, _offset_label(utc_offset)))
+        return records
+
+    def records(self, query=None, limit=None, prefix=False):
+        """
+        Search the catalog and return the current details of the matches.
+
+        Parameters:
+        query (str, optional): The text to look for. Default is None, which matches every name.
+        limit (int, optional): The maximum number of records to return. Default is None, no limit.
+        prefix (bool): Whether the names must start with the query rather than contain it. Default is False.
+
+        Returns:
+        List[ZoneRecord]: The matching zones with their current details, sorted by name.
+        """
+        return self.details(self.search(query, limit, prefix))
+
+    def clear(self):
+        """
+        Forget the cached query results. The index is kept.
+        """
+        self._search.cache_clear()
+
+
+shared_catalog = ZoneCatalog()
@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta
+import math
+import threading
+import time
+
+from .zone_engine import compile_zone
+from .zone_registry import get_zone, is_valid_zone
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROS = 1_000_000
+_NEVER = float("inf")
+
+
+class _Period:
+    # The state of one zone between two transitions, in UTC microseconds since the Unix epoch
+    __slots__ = ("start", "end", "offset", "epoch", "abbreviation")
+
+    def __init__(self, start, end, offset, tzinfo, abbreviation):
+        self.start = start
+        self.end = end
+        self.offset = offset
+        # Adding to an aware epoch keeps the tzinfo, which is cheaper than datetime.replace per call
+        self.epoch = _EPOCH.replace(tzinfo=tzinfo)
+        self.abbreviation = abbreviation
+
+
+class ZoneClock:
+    """
+    Current-time service that resolves each time zone once per transition period.
+
+    The UTC offset, tzinfo and abbreviation of a zone are looked up on first use and kept until the
+    zone's next transition (or until the clock goes back before the period started), so reading
+    the local time of a zone in between is one clock read and one datetime addition. All zones of
+    a bulk call share a single clock read.
+
+    Parameters:
+        clock (callable): Returns the current time in seconds since the Unix epoch, like time.time
+                          (the default). Pass a fixed function for deterministic results.
+        maxsize (int): The maximum number of zone names to keep; the cache is emptied when it
+                       grows past this. Default is 1024.
+    """
+
+    def __init__(self, clock=time.time, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.clock = clock
+        self.maxsize = maxsize
+        self._periods = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.refreshes = 0
+
+    def _resolve(self, tz, micros):
+        # Look up the period in effect at the instant, and remember it under the name as given
+        if not is_valid_zone(tz):
+            raise ValueError("Invalid time zone provided. Use pytz.all_timezones to view available time zones.")
+        seconds = micros // _MICROS
+        transitions = compile_zone(tz).transitions
+        index = int(transitions.searchsorted(seconds, side="right"))
+        start = int(transitions[index - 1]) * _MICROS if index else -_NEVER
+        end = int(transitions[index]) * _MICROS if index < len(transitions) else _NEVER
+        reference = datetime.fromtimestamp(seconds, get_zone(tz))
+        period = _Period(start, end, reference.utcoffset() // timedelta(microseconds=1),
+                         reference.tzinfo, reference.tzname())
+        with self._lock:
+            if len(self._periods) >= self.maxsize:
+                self._periods.clear()
+            self._periods[tz] = period
+            self.refreshes += 1
+        return period
+
+    def _period(self, tz, micros):
+        period = self._periods.get(tz)
+        if period is None or not period.start <= micros < period.end:
+            return self._resolve(tz, micros)
+        self.hits += 1
+        return period
+
+    def _micros(self):
+        # Round the way datetime.fromtimestamp does, on the fraction alone
+        fraction, seconds = math.modf(self.clock())
+        return int(seconds) * _MICROS + round(fraction * _MICROS)
+
+    def now(self, tz="UTC"):
+        """
+        Get the current time in a time zone.
+
+        Parameters:
+        tz (str): A string representing the time zone. Default is "UTC".
+
+        Returns:
+        datetime: The current time as an aware datetime, the same as datetime.now(tz) gives.
+
+        Raises:
+        ValueError: If the time zone is invalid.
+        """
+        micros = self._micros()
+        period = self._period(tz, micros)
+        return period.epoch + timedelta(microseconds=micros + period.offset)
+
+    def now_many(self, zones):
+        """
+        Get the current time in several time zones from a single clock read.
+
+        Parameters:
+        zones (iterable of str): The time zones.
+
+        Returns:
+        List[Tuple[datetime, str]]: The current time and the time zone abbreviation of each zone, in order.
+
+        Raises:
+        ValueError: If any time zone is invalid.
+        """
+        micros = self._micros()
+        results = []
+        for tz in zones:
+            period = self._period(tz, micros)
+            results.append((period.epoch + timedelta(microseconds=micros + period.offset), period.abbreviation))
+        return results
+
+    def abbreviation(self, tz="UTC"):
+        """
+        Get the current abbreviation of a time zone, such as "EST" or "EDT".
+
+        Parameters:
+        tz (str): A string representing the time zone. Default is "UTC".
+
+        Returns:
+        str: The abbreviation in effect now.
+
+        Raises:
+        ValueError: If the time zone is invalid.
+        """
+        return self._period(tz, self._micros()).abbreviation
+
+    def stats(self):
+        """
+        Report cache counters.
+
+        Returns:
+        dict: hits, refreshes (period lookups, on first use of a zone or after a transition),
+              size and maxsize.
+        """
+        return {"hits": self.hits, "refreshes": self.refreshes, "size": len(self._periods), "maxsize": self.maxsize}
+
+    def clear(self):
+        """
+        Forget every cached period and reset the counters.
+        """
+        with self._lock:
+            self._periods.clear()
+            self.hits = self.refreshes = 0
+
+
+shared_clock = ZoneClock()
@@ -0,0 +1,359 @@
+"""
+Compiled zone database: every zone's transition table in one memory-mapped file.
+
+compile_zone normally builds each table from pytz's tzfile data, separately in every process.
+Compiling the tables once into a file lets every process map the same pages instead: opening
+the database is a single mmap call, and each zone's transitions, offsets and DST adjustments
+are read-only NumPy views of the mapping, shared between processes through the page cache.
+
+The file carries the tzdata release it was built from (pytz.OLSON_VERSION). A database from
+another release, or a damaged one, is ignored with a warning and the tables come from pytz as
+before; so does any zone the file does not hold.
+
+The database is looked up at the path in the ZONE_TIME_DB environment variable, or else as
+zones.bin next to this module. Set ZONE_TIME_DB to "off" to never use one.
+
+Usage:
+    zone-time-db compile [--output PATH]
+    zone-time-db info [PATH]
+
+(or "python -m zone_time.zone_db" in place of "zone-time-db").
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+import warnings
+
+from ._lazy import np, pytz
+
+MAGIC = b"ZTDB"
+FORMAT_VERSION = 1
+ENVIRONMENT_VARIABLE = "ZONE_TIME_DB"
+# magic, format version, reserved, tzdata release, zones, periods, bytes of names, bytes of abbreviations
+_HEADER = struct.Struct("<4sHH16sIIII")
+
+
+def default_path():
+    """
+    The database path in use: $ZONE_TIME_DB if set, otherwise zones.bin next to this module.
+
+    Returns:
+    str or None: The path, or None if ZONE_TIME_DB is "off".
+    """
+    path = os.environ.get(ENVIRONMENT_VARIABLE)
+    if path is None:
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "zones.bin")
+    if path.strip().lower() in ("", "off", "0", "none"):
+        return None
+    return path
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def _layout(zones, periods, names_size, abbreviations_size):
+    # Byte offset of each section, little-endian; every array starts on an 8-byte boundary
+    sections = [
+        ("starts", "<i8", zones + 1),
+        ("transitions", "<i8", periods),
+        ("utcoffset", "<i8", periods),
+        ("dst", "<i8", periods),
+        ("abbreviations", "<u2", periods),
+        ("names", "u1", names_size),
+        ("abbreviation_names", "u1", abbreviations_size),
+    ]
+    layout = {}
+    offset = _align(_HEADER.size)
+    for section, dtype, count in sections:
+        layout[section] = (offset, dtype, count)
+        offset = _align(offset + np.dtype(dtype).itemsize * count)
+    return layout, offset
+
+
+class ZoneDatabase:
+    """
+    A compiled zone database file, mapped read-only.
+
+    Parameters:
+        path (str): The database file, as written by compile_database.
+
+    Attributes:
+        path (str): The database file.
+        tzdata_version (str): The tzdata release the tables were compiled from, e.g. "2024a".
+        names (tuple of str): The zones in the database, by canonical name.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a zone database of this format version, or is truncated.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a zone database.")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, tzdata, zones, periods, names_size, abbreviations_size = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a zone database.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}.")
+        layout, expected_size = _layout(zones, periods, names_size, abbreviations_size)
+        if size != expected_size:
+            raise ValueError(f"{path} is truncated or damaged: {size} bytes, expected {expected_size}.")
+        sections = {section: np.frombuffer(self._map, dtype=dtype, count=count, offset=offset)
+                    for section, (offset, dtype, count) in layout.items()}
+        self.tzdata_version = tzdata.rstrip(b"\0").decode("ascii")
+        self.names = tuple(bytes(sections["names"]).decode("utf-8").split("\n")) if zones else ()
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._starts = sections["starts"]
+        self._transitions = sections["transitions"]
+        self._utcoffset = sections["utcoffset"]
+        self._dst = sections["dst"]
+        self._codes = sections["abbreviations"]
+        self._abbreviations = np.array(bytes(sections["abbreviation_names"]).decode("utf-8").split("\n"), dtype=object)
+
+    def __repr__(self):
+        return f"<ZoneDatabase {self.path!r} tzdata={self.tzdata_version} zones={len(self.names)}>"
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def is_current(self):
+        """
+        Tell whether the database was compiled from the tzdata release pytz uses.
+
+        Returns:
+        bool: True if the tzdata releases match.
+        """
+        return self.tzdata_version == pytz.OLSON_VERSION
+
+    def tables(self, name):
+        """
+        Read the transition table of one zone.
+
+        Parameters:
+        name (str): A canonical time zone name.
+
+        Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] or None: transitions, utcoffset and dst
+        as read-only int64 views of the file, and an object array of abbreviations, as CompiledZone
+        holds them; None if the zone is not in the database.
+        """
+        i = self._index.get(name)
+        if i is None:
+            return None
+        start, end = int(self._starts[i]), int(self._starts[i + 1])
+        return (self._transitions[start:end], self._utcoffset[start:end], self._dst[start:end],
+                self._abbreviations[self._codes[start:end]])
+
+    def stats(self):
+        """
+        Describe the database.
+
+        Returns:
+        dict: path, tzdata_version, current (see is_current), zones, periods and bytes.
+        """
+        return {
+            "path": self.path,
+            "tzdata_version": self.tzdata_version,
+            "current": self.is_current(),
+            "zones": len(self.names),
+            "periods": len(self._transitions),
+            "bytes": len(self._map),
+        }
+
+
+def compile_database(path=None, zones=None):
+    """
+    Compile zone transition tables from pytz into a database file.
+
+    The file is written next to its destination and then renamed over it, so processes that
+    have the previous file mapped keep reading it unchanged.
+
+    Parameters:
+    path (str, optional): The file to write. Default is None, which uses default_path().
+    zones (iterable of str, optional): The zones to include. Default is None, all of pytz.all_timezones.
+                                       Names are stored canonically, so aliases add nothing.
+
+    Returns:
+    str: The path written.
+
+    Raises:
+    ValueError: If no path is given and ZONE_TIME_DB is "off".
+    pytz.UnknownTimeZoneError: If a zone is not known.
+    """
+    import tempfile
+    from .zone_engine import pytz_tables
+    from .zone_registry import canonical_name
+
+    path = path or default_path()
+    if path is None:
+        raise ValueError(f"No database path: {ENVIRONMENT_VARIABLE} is off. Pass a path.")
+    names = sorted({canonical_name(zone) for zone in (pytz.all_timezones if zones is None else zones)})
+    abbreviation_codes = {}
+    starts = [0]
+    columns = ([], [], [], [])
+    for name in names:
+        transitions, utcoffset, dst, tzname = pytz_tables(name)
+        columns[0].append(transitions)
+        columns[1].append(utcoffset)
+        columns[2].append(dst)
+        columns[3].append(np.array([abbreviation_codes.setdefault(abbreviation, len(abbreviation_codes))
+                                    for abbreviation in tzname], dtype=np.uint16))
+        starts.append(starts[-1] + len(transitions))
+    names_blob = "\n".join(names).encode("utf-8")
+    abbreviations_blob = "\n".join(abbreviation_codes).encode("utf-8")
+    layout, size = _layout(len(names), starts[-1], len(names_blob), len(abbreviations_blob))
+    sections = {
+        "starts": np.array(starts, dtype=np.int64),
+        "transitions": np.concatenate(columns[0]) if names else np.empty(0, np.int64),
+        "utcoffset": np.concatenate(columns[1]) if names else np.empty(0, np.int64),
+        "dst": np.concatenate(columns[2]) if names else np.empty(0, np.int64),
+        "abbreviations": np.concatenate(columns[3]) if names else np.empty(0, np.uint16),
+        "names": np.frombuffer(names_blob, dtype=np.uint8),
+        "abbreviation_names": np.frombuffer(abbreviations_blob, dtype=np.uint8),
+    }
+
+    content = bytearray(size)
+    _HEADER.pack_into(content, 0, MAGIC, FORMAT_VERSION, 0, pytz.OLSON_VERSION.encode("ascii"), len(names),
+                      starts[-1], len(names_blob), len(abbreviations_blob))
+    for section, (offset, dtype, count) in layout.items():
+        data = sections[section].astype(dtype, copy=False)
+        content[offset:offset + data.nbytes] = data.tobytes()
+
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".zones-", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+        # mkstemp creates the file private to its owner; workers may run as other users
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return path
+
+
+def load_database(path=None, require_current=True):
+    """
+    Open a zone database, or report why it cannot be used.
+
+    Parameters:
+    path (str, optional): The database file. Default is None, which uses default_path().
+    require_current (bool): Whether to reject a database compiled from another tzdata release
+                            than pytz's. Default is True.
+
+    Returns:
+    ZoneDatabase or None: The database, or None if there is none at the path, it is damaged or
+                          it is stale. Damaged and stale files are reported with a RuntimeWarning.
+    """
+    path = path or default_path()
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        database = ZoneDatabase(path)
+    except (OSError, ValueError) as error:
+        warnings.warn(f"Ignoring the zone database: {error}", RuntimeWarning, stacklevel=2)
+        return None
+    if require_current and not database.is_current():
+        warnings.warn(f"Ignoring the zone database {path}: compiled from tzdata {database.tzdata_version}, "
+                      f"but pytz uses {pytz.OLSON_VERSION}. Recompile it with 'zone-time-db compile'.",
+                      RuntimeWarning, stacklevel=2)
+        return None
+    return database
+
+
+_shared = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def shared_database():
+    """
+    The database compile_zone reads from, opened on first use.
+
+    Returns:
+    ZoneDatabase or None: The database at default_path(), or None if there is no usable one.
+    """
+    global _shared, _shared_loaded
+    if not _shared_loaded:
+        with _shared_lock:
+            if not _shared_loaded:
+                _shared = load_database()
+                _shared_loaded = True
+    return _shared
+
+
+def use_database(path):
+    """
+    Switch the database compile_zone reads from.
+
+    Tables compile_zone has already built are kept; clear them with
+    zone_engine._compile_canonical.cache_clear() to reload every zone.
+
+    Parameters:
+    path (str or None): The database file, or None to read every zone from pytz.
+
+    Returns:
+    ZoneDatabase or None: The database now in use.
+    """
+    global _shared, _shared_loaded
+    with _shared_lock:
+        _shared = load_database(path) if path is not None else None
+        _shared_loaded = True
+    return _shared
+
+
+def database_tables(name):
+    """
+    Read a zone's transition table from the shared database.
+
+    Parameters:
+    name (str): A canonical time zone name.
+
+    Returns:
+    tuple or None: See ZoneDatabase.tables; None if there is no database or the zone is not in it.
+    """
+    database = shared_database()
+    if database is None:
+        return None
+    return database.tables(name)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile or inspect the memory-mapped zone database.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_command = commands.add_parser("compile", help="compile every pytz zone into a database file")
+    compile_command.add_argument("--output", help=f"file to write (default: ${ENVIRONMENT_VARIABLE} or zones.bin "
+                                                  "next to the package)")
+    info_command = commands.add_parser("info", help="describe a database file")
+    info_command.add_argument("path", nargs="?", help="the database file (default: the one in use)")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        path = compile_database(args.output)
+        stats = ZoneDatabase(path).stats()
+        print(f"Wrote {stats['zones']:,} zones, {stats['periods']:,} periods ({stats['bytes']:,} bytes) "
+              f"from tzdata {stats['tzdata_version']} to {path}")
+        return 0
+    path = args.path or default_path()
+    if path is None or not os.path.exists(path):
+        print(f"No zone database at {path}", file=sys.stderr)
+        return 1
+    for key, value in ZoneDatabase(path).stats().items():
+        print(f"{key:<15} {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
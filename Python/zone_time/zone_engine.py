@@ -0,0 +1,447 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import repeat
+
+from ._lazy import np
+
+from .zone_db import database_tables
+from .zone_registry import canonical_name, get_zone
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+_DAY = 86400
+_SIX_HOURS = 6 * 3600
+
+# Below this many rows, a Python loop over single-value lookups beats the fixed cost of the array path
+SMALL_BATCH = 64
+# The same for the rows of one zone within a batch, where only the NumPy calls are saved
+SMALL_GROUP = 8
+
+
+class CompiledZone:
+    """
+    Transition table of a single time zone compiled into sorted NumPy arrays.
+
+    Period i starts at transitions[i] (UTC, in seconds since the Unix epoch) and lasts until
+    transitions[i + 1]. utcoffset, dst and tzname hold the state of each period, taken from pytz's
+    _utc_transition_times / _transition_info, so every lookup gives the same answer as pytz.
+
+    Attributes:
+        name (str): The time zone name.
+        transitions (np.ndarray): int64 array of period start times in UTC seconds, sorted ascending.
+        utcoffset (np.ndarray): int64 array of UTC offsets in seconds, one per period.
+        dst (np.ndarray): int64 array of DST adjustments in seconds, one per period.
+        tzname (np.ndarray): object array of time zone abbreviations, one per period.
+    """
+
+    __slots__ = ("name", "transitions", "utcoffset", "dst", "tzname", "_lists")
+
+    def __init__(self, name, transitions, utcoffset, dst, tzname):
+        self.name = name
+        self.transitions = transitions
+        self.utcoffset = utcoffset
+        self.dst = dst
+        self.tzname = tzname
+        self._lists = None
+
+    def __repr__(self):
+        return f"<CompiledZone {self.name!r} periods={len(self.transitions)}>"
+
+    def utc_periods(self, utc_seconds):
+        """
+        Find the period in effect at each UTC instant.
+
+        Parameters:
+        utc_seconds (np.ndarray): int64 array of UTC instants in seconds since the Unix epoch.
+
+        Returns:
+        np.ndarray: intp array of period indices.
+        """
+        if isinstance(utc_seconds, np.ndarray) and utc_seconds.ndim == 1 and len(utc_seconds) < SMALL_GROUP:
+            return np.array([self.utc_period(seconds) for seconds in utc_seconds.tolist()], dtype=np.intp)
+        periods = np.searchsorted(self.transitions, utc_seconds, side="right") - 1
+        return np.maximum(periods, 0)
+
+    def as_lists(self):
+        """
+        The table as Python lists, built on first use, for looking up single values without NumPy.
+
+        Returns:
+        Tuple[list, list, list, list]: transitions, utcoffset, dst and tzname.
+        """
+        lists = self._lists
+        if lists is None:
+            lists = self._lists = (self.transitions.tolist(), self.utcoffset.tolist(), self.dst.tolist(),
+                                   self.tzname.tolist())
+        return lists
+
+    def utc_period(self, utc_seconds):
+        """
+        Find the period in effect at one UTC instant.
+
+        Parameters:
+        utc_seconds (int): A UTC instant in seconds since the Unix epoch.
+
+        Returns:
+        int: The period index.
+        """
+        return max(bisect_right(self.as_lists()[0], utc_seconds) - 1, 0)
+
+    def local_period(self, wall_seconds, is_dst=False):
+        """
+        Find the period and UTC instant of one wall-clock time, as local_periods does for arrays.
+
+        Parameters:
+        wall_seconds (int): A naive wall-clock time in seconds since 1970-01-01 00:00.
+        is_dst (bool): Which side to pick for ambiguous and non-existent times. Default is False.
+
+        Returns:
+        Tuple[int, int]: The period index and the UTC instant in seconds.
+        """
+        _, utcoffset, dst, _ = self.as_lists()
+        candidates = []
+        for shift in (-_DAY, _DAY):
+            period = self.utc_period(wall_seconds + shift)
+            utc = wall_seconds - utcoffset[period]
+            actual = self.utc_period(utc)
+            candidates.append((actual, utc, utcoffset[actual] == utcoffset[period]))
+        (early, early_utc, early_ok), (late, late_utc, late_ok) = candidates
+        if early_ok and late_ok and early_utc != late_utc:
+            early_match = (dst[early] != 0) == is_dst
+            late_match = (dst[late] != 0) == is_dst
+            pick_early = early_match if early_match != late_match else (early_utc < late_utc) != (not is_dst)
+            return (early, early_utc) if pick_early else (late, late_utc)
+        if early_ok:
+            return early, early_utc
+        if late_ok:
+            return late, late_utc
+        shift = _SIX_HOURS if is_dst else -_SIX_HOURS
+        period, utc = self.local_period(wall_seconds + shift, is_dst)
+        return period, utc - shift
+
+    def local_periods(self, wall_seconds, is_dst=False):
+        """
+        Find the period and UTC instant of each wall-clock time, the way pytz's localize() does.
+
+        Ambiguous wall times (clocks wound back) resolve to the non-DST side when is_dst is False
+        and to the DST side when it is True. Non-existent wall times (clocks wound forward) are
+        interpreted with the offset in effect six hours earlier (is_dst False) or later (is_dst True).
+
+        Parameters:
+        wall_seconds (np.ndarray): int64 array of naive wall-clock times in seconds since 1970-01-01 00:00.
+        is_dst (bool): Which side to pick for ambiguous and non-existent times. Default is False.
+
+        Returns:
+        Tuple[np.ndarray, np.ndarray]: intp array of period indices and int64 array of UTC seconds.
+        """
+        wall_seconds = np.asarray(wall_seconds, dtype=np.int64)
+        if wall_seconds.ndim == 1 and len(wall_seconds) < SMALL_GROUP:
+            rows = [self.local_period(seconds, is_dst) for seconds in wall_seconds.tolist()]
+            return (np.array([period for period, _ in rows], dtype=np.intp),
+                    np.array([utc for _, utc in rows], dtype=np.int64))
+        periods = np.zeros(wall_seconds.shape, dtype=np.intp)
+        utc_seconds = np.zeros(wall_seconds.shape, dtype=np.int64)
+        if len(self.transitions) == 1:
+            utc_seconds[...] = wall_seconds - self.utcoffset[0]
+            return periods, utc_seconds
+
+        # Like pytz, the candidates are the periods in effect one day either side of the wall time;
+        # a candidate holds when converting back from its UTC instant gives the same offset.
+        candidates = []
+        for shift in (-_DAY, _DAY):
+            period = self.utc_periods(wall_seconds + shift)
+            utc = wall_seconds - self.utcoffset[period]
+            actual = self.utc_periods(utc)
+            candidates.append((actual, utc, self.utcoffset[actual] == self.utcoffset[period]))
+        (early, early_utc, early_ok), (late, late_utc, late_ok) = candidates
+        both = early_ok & late_ok & (early_utc != late_utc)
+
+        # Exactly one valid reading
+        single = (early_ok | late_ok) & ~both
+        use_late = single & ~early_ok
+        periods[single] = np.where(use_late[single], late[single], early[single])
+        utc_seconds[single] = np.where(use_late[single], late_utc[single], early_utc[single])
+
+        # Two valid readings: prefer the one whose DST flag matches is_dst, otherwise the
+        # latest (is_dst False) or earliest (is_dst True) UTC instant
+        if both.any():
+            early_match = (self.dst[early[both]] != 0) == is_dst
+            late_match = (self.dst[late[both]] != 0) == is_dst
+            first_utc_is_early = early_utc[both] < late_utc[both]
+            by_order = first_utc_is_early != (not is_dst)
+            pick_early = np.where(early_match != late_match, early_match, by_order)
+            periods[both] = np.where(pick_early, early[both], late[both])
+            utc_seconds[both] = np.where(pick_early, early_utc[both], late_utc[both])
+
+        # No valid reading: the wall time was skipped, so borrow the state from six hours away
+        missing = ~(early_ok | late_ok)
+        if missing.any():
+            shift = _SIX_HOURS if is_dst else -_SIX_HOURS
+            gap_periods, gap_utc = self.local_periods(wall_seconds[missing] + shift, is_dst)
+            periods[missing] = gap_periods
+            utc_seconds[missing] = gap_utc - shift
+        return periods, utc_seconds
+
+
+def compile_zone(tz):
+    """
+    Compile a time zone into a CompiledZone, once per canonical zone name.
+
+    Names are normalized through the zone registry, so aliases and differently-cased names
+    share one compiled table. The table is read from the compiled zone database when there is
+    a current one (see zone_db), and built from pytz otherwise.
+
+    Parameters:
+    tz (str): A string representing the time zone.
+
+    Returns:
+    CompiledZone: The compiled transition table.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    return _compile_canonical(canonical_name(tz))
+
+
+@lru_cache(maxsize=512)
+def _compile_canonical(name):
+    tables = database_tables(name)
+    if tables is None:
+        tables = pytz_tables(name)
+    return CompiledZone(name, *tables)
+
+
+def pytz_tables(name):
+    """
+    Build the transition table of a zone from pytz's tzfile data.
+
+    Parameters:
+    name (str): A canonical time zone name.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: transitions, utcoffset, dst and tzname,
+    as CompiledZone holds them.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    zone = get_zone(name)
+    if hasattr(zone, "_utc_transition_times"):
+        transitions = [(dt - _EPOCH) // _SECOND for dt in zone._utc_transition_times]
+        infos = zone._transition_info
+    else:
+        transitions = [(datetime.min - _EPOCH) // _SECOND]
+        infos = [(zone.utcoffset(None), zone.dst(None), zone.tzname(None))]
+    return (
+        np.array(transitions, dtype=np.int64),
+        np.array([info[0] // _SECOND for info in infos], dtype=np.int64),
+        np.array([info[1] // _SECOND for info in infos], dtype=np.int64),
+        np.array([info[2] for info in infos], dtype=object),
+    )
+
+
+def narrow_codes(codes, count):
+    """
+    Cast group codes to the smallest signed integer type that holds them.
+
+    A stable argsort of 8- and 16-bit integers is a radix sort in NumPy, several times faster than
+    sorting wider codes.
+
+    Parameters:
+    codes (np.ndarray): Integer codes between -1 and count - 1.
+    count (int): The number of distinct codes, not counting -1.
+
+    Returns:
+    np.ndarray: The codes as int8, int16 or unchanged.
+    """
+    if count < 2 ** 7:
+        return codes.astype(np.int8)
+    if count < 2 ** 15:
+        return codes.astype(np.int16)
+    return codes
+
+
+def group_by_zone(zones, size):
+    """
+    Split row positions into groups that share a time zone.
+
+    Parameters:
+    zones (str or array-like of str): A single time zone for all rows, or one time zone per row.
+    size (int): The number of rows.
+
+    Returns:
+    Iterator[Tuple[str, np.ndarray]]: Pairs of time zone name and the row positions that use it.
+    """
+    if isinstance(zones, str):
+        yield zones, slice(None)
+        return
+    if len(zones) != size:
+        raise ValueError("Length of zones must be either 1 or equal to the number of values.")
+    index = {}
+    codes = np.fromiter((index.setdefault(zone, len(index)) for zone in zones), dtype=np.intp, count=size)
+    if len(index) == 1:
+        yield next(iter(index)), slice(None)
+        return
+    codes = narrow_codes(codes, len(index))
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(index) + 1))
+    for code, name in enumerate(index):
+        yield name, order[bounds[code]:bounds[code + 1]]
+
+
+def per_row(zones, size):
+    """
+    The time zone of each row, for looping over rows one by one.
+
+    Parameters:
+    zones (str or array-like of str): A single time zone for all rows, or one time zone per row.
+    size (int): The number of rows.
+
+    Returns:
+    Iterable[str]: size time zone names.
+    """
+    if isinstance(zones, str):
+        return repeat(zones, size)
+    if len(zones) != size:
+        raise ValueError("Length of zones must be either 1 or equal to the number of values.")
+    return zones
+
+
+def _columns(rows, dtypes):
+    # Per-row tuples from a loop, as one array per field
+    return tuple(np.array([row[i] for row in rows], dtype=dtype) for i, dtype in enumerate(dtypes))
+
+
+def utc_lookup_one(utc_seconds, tz):
+    """
+    Look up the zone state at one UTC instant, with a bisect instead of the array machinery.
+
+    Parameters:
+    utc_seconds (int): A UTC instant in seconds since the Unix epoch.
+    tz (str): A string representing the time zone.
+
+    Returns:
+    Tuple[int, int, str]: The UTC offset and DST adjustment in seconds, and the abbreviation.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    zone = compile_zone(tz)
+    period = zone.utc_period(utc_seconds)
+    _, utcoffset, dst, tzname = zone.as_lists()
+    return utcoffset[period], dst[period], tzname[period]
+
+
+def local_lookup_one(wall_seconds, tz, is_dst=False):
+    """
+    Resolve one wall-clock time to a UTC instant, as local_lookup does for arrays.
+
+    Parameters:
+    wall_seconds (int): A naive wall-clock time in seconds since 1970-01-01 00:00.
+    tz (str): A string representing the time zone.
+    is_dst (bool): Which side to pick for ambiguous and non-existent times. Default is False.
+
+    Returns:
+    Tuple[int, int, int, str]: The UTC instant, UTC offset and DST adjustment in seconds, and the abbreviation.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the time zone is not known.
+    """
+    zone = compile_zone(tz)
+    period, utc_seconds = zone.local_period(wall_seconds, is_dst)
+    _, utcoffset, dst, tzname = zone.as_lists()
+    return utc_seconds, utcoffset[period], dst[period], tzname[period]
+
+
+def utc_lookup(utc_seconds, zones):
+    """
+    Look up the UTC offset, DST adjustment and abbreviation in effect at UTC instants.
+
+    Parameters:
+    utc_seconds (array-like of int): UTC instants in seconds since the Unix epoch.
+    zones (str or array-like of str): A single time zone for all values, or one time zone per value.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray, np.ndarray]: int64 UTC offsets in seconds, int64 DST adjustments
+    in seconds and an object array of abbreviations, one of each per value.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If any time zone is not known.
+    """
+    utc_seconds = np.asarray(utc_seconds, dtype=np.int64)
+    if len(utc_seconds) < SMALL_BATCH:
+        rows = [utc_lookup_one(seconds, zone)
+                for seconds, zone in zip(utc_seconds.tolist(), per_row(zones, len(utc_seconds)))]
+        return _columns(rows, (np.int64, np.int64, object))
+    utcoffset = np.empty(utc_seconds.shape, dtype=np.int64)
+    dst = np.empty(utc_seconds.shape, dtype=np.int64)
+    tzname = np.empty(utc_seconds.shape, dtype=object)
+    for name, positions in group_by_zone(zones, len(utc_seconds)):
+        zone = compile_zone(name)
+        periods = zone.utc_periods(utc_seconds[positions])
+        utcoffset[positions] = zone.utcoffset[periods]
+        dst[positions] = zone.dst[periods]
+        tzname[positions] = zone.tzname[periods]
+    return utcoffset, dst, tzname
+
+
+def local_lookup(wall_seconds, zones, is_dst=False):
+    """
+    Resolve wall-clock times to UTC instants, with the zone state in effect at each.
+
+    Parameters:
+    wall_seconds (array-like of int): Naive wall-clock times in seconds since 1970-01-01 00:00.
+    zones (str or array-like of str): A single time zone for all values, or one time zone per value.
+    is_dst (bool): Which side to pick for ambiguous and non-existent times, as in pytz's localize().
+                   Default is False.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: int64 UTC instants in seconds, int64 UTC
+    offsets in seconds, int64 DST adjustments in seconds and an object array of abbreviations.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If any time zone is not known.
+    """
+    wall_seconds = np.asarray(wall_seconds, dtype=np.int64)
+    if len(wall_seconds) < SMALL_BATCH:
+        rows = [local_lookup_one(seconds, zone, is_dst)
+                for seconds, zone in zip(wall_seconds.tolist(), per_row(zones, len(wall_seconds)))]
+        return _columns(rows, (np.int64, np.int64, np.int64, object))
+    utc_seconds = np.empty(wall_seconds.shape, dtype=np.int64)
+    utcoffset = np.empty(wall_seconds.shape, dtype=np.int64)
+    dst = np.empty(wall_seconds.shape, dtype=np.int64)
+    tzname = np.empty(wall_seconds.shape, dtype=object)
+    for name, positions in group_by_zone(zones, len(wall_seconds)):
+        zone = compile_zone(name)
+        periods, utc_seconds[positions] = zone.local_periods(wall_seconds[positions], is_dst)
+        utcoffset[positions] = zone.utcoffset[periods]
+        dst[positions] = zone.dst[periods]
+        tzname[positions] = zone.tzname[periods]
+    return utc_seconds, utcoffset, dst, tzname
+
+
+def to_seconds(dt):
+    """
+    Convert a naive datetime to whole seconds since 1970-01-01 00:00, rounding down.
+
+    Parameters:
+    dt (datetime): A naive datetime object.
+
+    Returns:
+    int: The number of seconds.
+    """
+    return (dt - _EPOCH) // _SECOND
+
+
+def from_seconds(seconds):
+    """
+    Convert seconds since 1970-01-01 00:00 back to a naive datetime.
+
+    Parameters:
+    seconds (int): The number of seconds.
+
+    Returns:
+    datetime: A naive datetime object.
+    """
+    return _EPOCH + timedelta(seconds=int(seconds))
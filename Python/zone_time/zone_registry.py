@@ -0,0 +1,341 @@
+from collections import OrderedDict
+import threading
+
+from ._lazy import np, pytz
+
+
+class ZoneRegistry:
+    """
+    Size-bounded LRU cache of resolved time zones.
+
+    Names are normalized before lookup: matching is case-insensitive, and legacy link names
+    (zones in pytz.all_timezones but not in pytz.common_timezones, such as "Asia/Calcutta")
+    share the transition data of the zone they link to. The returned tzinfo keeps the name
+    the caller asked for, as pytz.timezone does. Zones are built from the tzfile data
+    directly, since pytz.timezone keeps every zone it has loaded forever.
+    Unknown names are remembered in a separate bounded negative cache so repeated bad input
+    does not hit the zone data again.
+
+    Parameters:
+        maxsize (int): The maximum number of resolved zones to keep. Default is 256.
+        negative_maxsize (int): The maximum number of unknown names to remember. Default is 1024.
+    """
+
+    def __init__(self, maxsize=256, negative_maxsize=1024):
+        if maxsize < 1 or negative_maxsize < 0:
+            raise ValueError("maxsize must be at least 1 and negative_maxsize must not be negative.")
+        self.maxsize = maxsize
+        self.negative_maxsize = negative_maxsize
+        self._zones = OrderedDict()
+        self._unknown = OrderedDict()
+        self._names = None
+        self._links = None
+        self._aliases = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.negative_hits = 0
+
+    def _load_names(self):
+        # Lower-case index of every known name, and the legacy links from the tzdata source
+        names = {name.lower(): name for name in pytz.all_timezones}
+        common = set(pytz.common_timezones)
+        links = {}
+        try:
+            with pytz.open_resource("tzdata.zi") as source:
+                for line in source:
+                    fields = line.decode("utf-8").split()
+                    if len(fields) == 3 and fields[0] == "L" and fields[2] not in common:
+                        links[fields[2]] = fields[1]
+        except OSError:
+            pass
+        self._names, self._links = names, links
+
+    def zone_name(self, name):
+        """
+        Normalize the letter case of a time zone name, keeping legacy link names as given.
+
+        Parameters:
+        name (str): A string representing the time zone, in any letter case.
+
+        Returns:
+        str: The time zone name as pytz spells it, e.g. "Asia/Calcutta" for "asia/calcutta".
+
+        Raises:
+        pytz.UnknownTimeZoneError: If the name does not match any known time zone.
+        """
+        with self._lock:
+            if self._names is None:
+                self._load_names()
+            if not isinstance(name, str):
+                raise pytz.UnknownTimeZoneError(name)
+            key = name.strip().lower()
+            zone_name = self._aliases.get(key) or self._names.get(key)
+            if zone_name is None:
+                raise pytz.UnknownTimeZoneError(name)
+            return zone_name
+
+    def canonical_name(self, name):
+        """
+        Normalize a time zone name, following legacy links to the zone they point to.
+
+        Parameters:
+        name (str): A string representing the time zone, in any letter case.
+
+        Returns:
+        str: The canonical time zone name, e.g. "Asia/Kolkata" for "Asia/Calcutta".
+
+        Raises:
+        pytz.UnknownTimeZoneError: If the name does not match any known time zone.
+        """
+        with self._lock:
+            zone_name = self.zone_name(name)
+            return self._links.get(zone_name, zone_name)
+
+    def is_valid(self, name):
+        """
+        Check whether a string names a known time zone, by the same rule as get.
+
+        Parameters:
+        name (str): A string representing the time zone, in any letter case.
+
+        Returns:
+        bool: True if the name is a valid time zone, False otherwise.
+        """
+        try:
+            self.zone_name(name)
+        except pytz.UnknownTimeZoneError:
+            return False
+        return True
+
+    def register_alias(self, alias, name):
+        """
+        Register an extra name for a time zone, such as an in-house abbreviation.
+
+        Parameters:
+        alias (str): The new name. Matching is case-insensitive.
+        name (str): An existing time zone name the alias refers to.
+
+        Raises:
+        pytz.UnknownTimeZoneError: If name is not a known time zone.
+        """
+        zone_name = self.zone_name(name)
+        with self._lock:
+            key = alias.strip().lower()
+            self._aliases[key] = zone_name
+            self._unknown.pop(key, None)
+
+    def get(self, name):
+        """
+        Resolve a time zone name to its pytz tzinfo object, using the cache.
+
+        A legacy link name gets a tzinfo named after the link that shares the transition data of
+        its target zone.
+
+        Parameters:
+        name (str): A string representing the time zone.
+
+        Returns:
+        pytz.tzinfo.BaseTzInfo: The resolved time zone.
+
+        Raises:
+        pytz.UnknownTimeZoneError: If the name does not match any known time zone.
+        """
+        with self._lock:
+            if not isinstance(name, str):
+                self.misses += 1
+                raise pytz.UnknownTimeZoneError(name)
+            # Unknown names are remembered normalized, as canonical_name matches them
+            key = name.strip().lower()
+            if key in self._unknown:
+                self._unknown.move_to_end(key)
+                self.negative_hits += 1
+                raise pytz.UnknownTimeZoneError(name)
+            try:
+                zone_name = self.zone_name(name)
+            except pytz.UnknownTimeZoneError:
+                self.misses += 1
+                if self.negative_maxsize:
+                    self._unknown[key] = None
+                    if len(self._unknown) > self.negative_maxsize:
+                        self._unknown.popitem(last=False)
+                raise
+            zone = self._zones.get(zone_name)
+            if zone is not None:
+                self._zones.move_to_end(zone_name)
+                self.hits += 1
+                return zone
+            self.misses += 1
+            canonical = self._links.get(zone_name, zone_name)
+            target = self._zones.get(canonical) if canonical != zone_name else None
+            if target is None:
+                target = self._build(canonical)
+                self._store(canonical, target)
+            if canonical != zone_name:
+                # Same transition data under the link's name: the subclass only overrides zone
+                zone = type(zone_name, (type(target),), {"zone": zone_name})()
+                self._store(zone_name, zone)
+            return self._zones[zone_name]
+
+    @staticmethod
+    def _build(name):
+        # Build the zone directly rather than through pytz.timezone, whose own cache is unbounded
+        if name == "UTC":
+            return pytz.utc
+        from pytz.tzfile import build_tzinfo
+        with pytz.open_resource(name) as source:
+            return build_tzinfo(name, source)
+
+    def _store(self, name, zone):
+        self._zones[name] = zone
+        if len(self._zones) > self.maxsize:
+            self._zones.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Report cache counters.
+
+        Returns:
+        dict: hits, misses, evictions, negative_hits, size, negative_size, maxsize and hit_rate
+              (hits and negative hits over all lookups, or 0.0 before the first lookup).
+        """
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "negative_hits": self.negative_hits,
+                "size": len(self._zones),
+                "negative_size": len(self._unknown),
+                "maxsize": self.maxsize,
+                "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """
+        Empty the caches and reset the counters. Registered aliases are kept.
+        """
+        with self._lock:
+            self._zones.clear()
+            self._unknown.clear()
+            self.hits = self.misses = self.evictions = self.negative_hits = 0
+
+
+registry = ZoneRegistry()
+
+
+def get_zone(name):
+    """
+    Resolve a time zone name through the shared registry.
+
+    Parameters:
+    name (str): A string representing the time zone.
+
+    Returns:
+    pytz.tzinfo.BaseTzInfo: The resolved time zone.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the name does not match any known time zone.
+    """
+    return registry.get(name)
+
+
+def zone_name(name):
+    """
+    Normalize the letter case of a time zone name through the shared registry, keeping link names.
+
+    Parameters:
+    name (str): A string representing the time zone, in any letter case.
+
+    Returns:
+    str: The time zone name as pytz spells it.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the name does not match any known time zone.
+    """
+    return registry.zone_name(name)
+
+
+def canonical_name(name):
+    """
+    Normalize a time zone name through the shared registry, following legacy links.
+
+    Parameters:
+    name (str): A string representing the time zone, in any letter case.
+
+    Returns:
+    str: The canonical time zone name, which zones that link to each other share.
+
+    Raises:
+    pytz.UnknownTimeZoneError: If the name does not match any known time zone.
+    """
+    return registry.canonical_name(name)
+
+
+def zone_cache_stats():
+    """
+    Report the shared registry's cache counters.
+
+    Returns:
+    dict: See ZoneRegistry.stats.
+    """
+    return registry.stats()
+
+
+def is_valid_zone(name):
+    """
+    Check whether a string is a valid time zone name, in constant time.
+
+    Matching follows get_zone: letter case and surrounding whitespace are ignored, and registered
+    aliases are accepted, so every name this accepts resolves.
+
+    Parameters:
+    name (str): A string representing the time zone.
+
+    Returns:
+    bool: True if the name is a valid time zone, False otherwise.
+    """
+    return registry.is_valid(name)
+
+
+def validate_zones(zones, return_positions=False):
+    """
+    Validate a whole column of time zone names in one pass.
+
+    Each distinct value is checked once, so the per-row cost is a dictionary lookup.
+    pandas categorical columns are validated through their categories only.
+
+    Parameters:
+    zones (iterable of str): The time zone names to validate, e.g. a list or a pandas Series.
+    return_positions (bool): Whether to return the positions of the invalid names instead of a mask.
+                             Default is False.
+
+    Returns:
+    np.ndarray: A boolean mask that is True where the name is valid, or, if return_positions is True,
+                an integer array with the positions of the invalid names.
+    """
+    categorical = getattr(zones, "cat", None)
+    if categorical is not None:
+        # Code -1 (missing) picks the trailing False
+        valid_categories = np.array([is_valid_zone(name) for name in categorical.categories] + [False])
+        mask = valid_categories[np.asarray(categorical.codes)]
+    else:
+        seen = {}
+
+        def check(name):
+            try:
+                return seen[name]
+            except KeyError:
+                seen[name] = result = is_valid_zone(name)
+                return result
+            except TypeError:
+                return False
+
+        count = len(zones) if hasattr(zones, "__len__") else -1
+        mask = np.fromiter(map(check, zones), dtype=bool, count=count)
+    if return_positions:
+        return np.flatnonzero(~mask)
+    return mask